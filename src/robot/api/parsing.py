@@ -34,6 +34,12 @@ The publicly exposed parsing entry points are the following:
   functions for `parsing data to model`_ represented as
   an abstract syntax tree (AST).
 
+* :func:`~.parser.parser.update_model`,
+  :func:`~.parser.parser.update_resource_model`, and
+  :func:`~.parser.parser.update_init_model`
+  functions for updating models after their source has been edited without
+  parsing the whole source again. New in Robot Framework 5.0.
+
 * `Model objects`_ used by the AST model.
 
 * :class:`~robot.parsing.model.visitor.ModelVisitor`
@@ -486,6 +492,9 @@ from robot.parsing import (
     get_model,
     get_resource_model,
     get_init_model,
+    update_model,
+    update_resource_model,
+    update_init_model,
     Token
 )
 from robot.parsing.model.blocks import (
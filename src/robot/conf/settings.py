@@ -13,6 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import copy
 import glob
 import os
 import random
@@ -48,7 +49,10 @@ class _BaseSettings:
                  'Log'              : ('log', 'log.html'),
                  'Report'           : ('report', 'report.html'),
                  'XUnit'            : ('xunit', None),
+                 'BinaryOutput'     : ('binaryoutput', None),
                  'SplitLog'         : ('splitlog', False),
+                 'SharedStrings'    : ('sharedstrings', False),
+                 'LogCompression'   : ('logcompression', 9),
                  'TimestampOutputs' : ('timestampoutputs', False),
                  'LogTitle'         : ('logtitle', None),
                  'ReportTitle'      : ('reporttitle', None),
@@ -69,7 +73,7 @@ class _BaseSettings:
                  'PythonPath'       : ('pythonpath', []),
                  'StdOut'           : ('stdout', None),
                  'StdErr'           : ('stderr', None)}
-    _output_opts = ['Output', 'Log', 'Report', 'XUnit', 'DebugFile']
+    _output_opts = ['Output', 'Log', 'Report', 'XUnit', 'BinaryOutput', 'DebugFile']
 
     def __init__(self, options=None, **extra_options):
         self.start_timestamp = format_time(time.time(), '', '-', '')
@@ -116,7 +120,9 @@ class _BaseSettings:
             return None
         if name == 'OutputDir':
             return abspath(value)
-        if name in ['SuiteStatLevel', 'ConsoleWidth']:
+        if name in ['ParseCache', 'Resume']:
+            return abspath(value) if value.upper() != 'NONE' else None
+        if name in ['SuiteStatLevel', 'ConsoleWidth', 'Processes']:
             return self._convert_to_positive_integer_or_default(name, value)
         if name == 'VariableFiles':
             return [split_args_from_name_or_path(item) for item in value]
@@ -130,6 +136,10 @@ class _BaseSettings:
             return self._process_randomize_value(value)
         if name == 'MaxErrorLines':
             return self._process_max_error_lines(value)
+        if name == 'TimeoutEngine':
+            return self._process_timeout_engine(value)
+        if name == 'LogCompression':
+            return self._process_log_compression(value)
         if name == 'PythonPath':
             return self._process_pythonpath(value)
         if name == 'RemoveKeywords':
@@ -182,6 +192,21 @@ class _BaseSettings:
                                 f"Expected integer greater than 10, got {value}.")
         return value
 
+    def _process_log_compression(self, value):
+        value = self._convert_to_integer('LogCompression', value)
+        if not 0 <= value <= 9:
+            self._raise_invalid('LogCompression',
+                                f"Expected integer between 0 and 9, got {value}.")
+        return value
+
+    def _process_timeout_engine(self, value):
+        value = value.upper()
+        valid = ('DEFAULT', 'WATCHDOG')
+        if value not in valid:
+            valid = seq2str(valid, lastsep=' or ')
+            self._raise_invalid('TimeoutEngine', f"Expected {valid}, got '{value}'.")
+        return value
+
     def _process_randomize_value(self, original):
         value = original.upper()
         if ':' in value:
@@ -210,7 +235,8 @@ class _BaseSettings:
     def _get_output_file(self, option):
         """Returns path of the requested output file and creates needed dirs.
 
-        `option` can be 'Output', 'Log', 'Report', 'XUnit' or 'DebugFile'.
+        `option` can be 'Output', 'Log', 'Report', 'XUnit', 'BinaryOutput'
+        or 'DebugFile'.
         """
         name = self._opts[option]
         if not name:
@@ -226,6 +252,9 @@ class _BaseSettings:
 
     def _process_output_name(self, option, name):
         base, ext = os.path.splitext(name)
+        if ext.lower() == '.gz':
+            base, inner_ext = os.path.splitext(base)
+            ext = inner_ext + ext
         if self['TimestampOutputs']:
             base = f'{base}-{self.start_timestamp}'
         ext = self._get_output_extension(ext, option)
@@ -238,6 +267,8 @@ class _BaseSettings:
             return '.xml'
         if file_type in ['Log', 'Report']:
             return '.html'
+        if file_type == 'BinaryOutput':
+            return '.bin'
         if file_type == 'DebugFile':
             return '.txt'
         raise FrameworkError(f"Invalid output file type '{file_type}'.")
@@ -378,6 +409,10 @@ class _BaseSettings:
     def xunit(self):
         return self['XUnit']
 
+    @property
+    def binary_output(self):
+        return self['BinaryOutput']
+
     @property
     def log_level(self):
         return self['LogLevel']
@@ -386,6 +421,14 @@ class _BaseSettings:
     def split_log(self):
         return self['SplitLog']
 
+    @property
+    def shared_strings(self):
+        return self['SharedStrings']
+
+    @property
+    def log_compression(self):
+        return self['LogCompression']
+
     @property
     def suite_names(self):
         return self['SuiteNames']
@@ -446,6 +489,12 @@ class RobotSettings(_BaseSettings):
                        'SkipOnFailure'      : ('skiponfailure', []),
                        'SkipTeardownOnExit' : ('skipteardownonexit', False),
                        'Randomize'          : ('randomize', 'NONE'),
+                       'Processes'          : ('processes', 1),
+                       'TimeoutEngine'      : ('timeoutengine', 'DEFAULT'),
+                       'ResultsInMemory'    : ('resultsinmemory', False),
+                       'ParseCache'         : ('parsecache', None),
+                       'Journal'            : ('journal', False),
+                       'Resume'             : ('resume', None),
                        'RunEmptySuite'      : ('runemptysuite', False),
                        'Variables'          : ('variable', []),
                        'VariableFiles'      : ('variablefile', []),
@@ -462,13 +511,34 @@ class RobotSettings(_BaseSettings):
         settings = RebotSettings()
         settings.start_timestamp = self.start_timestamp
         not_copied = {'Include', 'Exclude', 'TestNames', 'SuiteNames', 'Name', 'Doc',
-                      'Metadata', 'Output', 'LogLevel', 'TimestampOutputs'}
+                      'Metadata', 'Output', 'BinaryOutput', 'LogLevel',
+                      'TimestampOutputs'}
         for opt in settings._opts:
             if opt in self and opt not in not_copied:
                 settings._opts[opt] = self[opt]
         settings._opts['ProcessEmptySuite'] = self['RunEmptySuite']
         return settings
 
+    def get_unit_settings(self, output):
+        """Settings for running a work unit in a parallel process."""
+        settings = copy.copy(self)
+        settings._opts = dict(self._opts, Output=output, Log=None, Report=None,
+                              XUnit=None, BinaryOutput=None, DebugFile=None,
+                              TimestampOutputs=False,
+                              PreRunModifiers=[], Processes=1,
+                              ResultsInMemory=False, StdOut=None,
+                              StdErr=None, ConsoleTypeDotted=False,
+                              ConsoleTypeQuiet=False)
+        if self.console_type.upper() != 'NONE':
+            settings._opts['ConsoleType'] = 'quiet'
+        return settings
+
+    def _process_cli_opts(self, opts):
+        _BaseSettings._process_cli_opts(self, opts)
+        if self['Resume'] and self['Processes'] > 1:
+            raise DataError("Options '--resume' and '--processes' cannot be "
+                            "used together.")
+
     def _output_disabled(self):
         return self.output is None
 
@@ -512,6 +582,30 @@ class RobotSettings(_BaseSettings):
     def randomize_tests(self):
         return self['Randomize'][0] in ('TESTS', 'ALL')
 
+    @property
+    def processes(self):
+        return self['Processes']
+
+    @property
+    def timeout_engine(self):
+        return self['TimeoutEngine']
+
+    @property
+    def results_in_memory(self):
+        return self['ResultsInMemory']
+
+    @property
+    def parse_cache(self):
+        return self['ParseCache']
+
+    @property
+    def journal(self):
+        return self['Journal']
+
+    @property
+    def resume(self):
+        return self['Resume']
+
     @property
     def dry_run(self):
         return self['DryRun']
@@ -594,11 +688,17 @@ class RebotSettings(_BaseSettings):
                        'ProcessEmptySuite' : ('processemptysuite', False),
                        'StartTime'         : ('starttime', None),
                        'EndTime'           : ('endtime', None),
-                       'Merge'             : ('merge', False)}
+                       'Merge'             : ('merge', False),
+                       'Recover'           : ('recover', False),
+                       'Processes'         : ('processes', 1)}
 
     def _output_disabled(self):
         return False
 
+    @property
+    def processes(self):
+        return self['Processes']
+
     @property
     def suite_config(self):
         return {
@@ -653,6 +753,10 @@ class RebotSettings(_BaseSettings):
     def merge(self):
         return self['Merge']
 
+    @property
+    def recover(self):
+        return self['Recover']
+
     @property
     def console_output_config(self):
         return {
@@ -1,6 +1,7 @@
 window.fileLoading = (function () {
 
     var fileLoadingCallbacks = {};
+    var sharedFileCallbacks = {};
 
     var timestamp = new Date().getTime();
 
@@ -33,8 +34,30 @@ window.fileLoading = (function () {
         }
     }
 
-    function notifyFileLoaded(filename) {
-        fileLoadingCallbacks[filename]();
+    function loadSharedFile(filename, callback) {
+        var callbacks = sharedFileCallbacks[filename];
+        if (callbacks === true) {
+            callback();
+        } else if (callbacks) {
+            callbacks.push(callback);
+        } else {
+            sharedFileCallbacks[filename] = [callback];
+            loadKeywordsFile(filename, function () {
+                var callbacks = sharedFileCallbacks[filename];
+                sharedFileCallbacks[filename] = true;
+                for (var i = 0; i < callbacks.length; i++) {
+                    callbacks[i]();
+                }
+            });
+        }
+    }
+
+    function notifyFileLoaded(filename, requiredFilename) {
+        // Split log files using shared strings require also that file.
+        if (requiredFilename)
+            loadSharedFile(requiredFilename, fileLoadingCallbacks[filename]);
+        else
+            fileLoadingCallbacks[filename]();
     }
 
     return {
@@ -3,6 +3,7 @@ window.testdata = function () {
     var elementsById = {};
     var idCounter = 0;
     var _statistics = null;
+    var _sharedStrings = null;
     var LEVELS = ['TRACE', 'DEBUG', 'INFO', 'WARN', 'ERROR', 'FAIL', 'SKIP'];
     var STATUSES = ['FAIL', 'PASS', 'SKIP', 'NOT RUN'];
     var KEYWORD_TYPES = ['KEYWORD', 'SETUP', 'TEARDOWN', 'FOR', 'ITERATION', 'IF', 'ELSE IF', 'ELSE', 'RETURN',
@@ -265,6 +266,12 @@ window.testdata = function () {
         return _statistics;
     }
 
+    function sharedStrings() {
+        if (!_sharedStrings)
+            _sharedStrings = StringStore(window.sharedStrings);
+        return _sharedStrings;
+    }
+
     function StringStore(strings) {
 
         function getText(id) {
@@ -273,6 +280,8 @@ window.testdata = function () {
                 return '';
             if (text[0] == '*')
                 return text.substring(1);
+            if (text[0] == '#')
+                return sharedStrings().get(parseInt(text.substring(1)));
             var extracted = extract(text);
             strings[id] = '*' + extracted;
             return extracted;
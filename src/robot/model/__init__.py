@@ -35,7 +35,7 @@ from .message import Message, Messages
 from .modifier import ModelModifier
 from .tags import Tags, TagPattern, TagPatterns
 from .namepatterns import SuiteNamePatterns, TestNamePatterns
-from .visitor import SuiteVisitor
+from .visitor import CompositeVisitor, SuiteVisitor
 from .totalstatistics import TotalStatisticsBuilder
 from .statistics import Statistics
 from .itemlist import ItemList
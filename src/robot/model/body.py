@@ -71,6 +71,15 @@ class BodyItem(ModelObject):
     def has_setup(self):
         return False
 
+    @property
+    def has_body(self):
+        """Check does an item have a non-empty body.
+
+        Items creating their body only when it is needed override this to
+        avoid creating empty body objects.
+        """
+        return bool(getattr(self, 'body', None))
+
     @property
     def has_teardown(self):
         return False
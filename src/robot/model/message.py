@@ -13,7 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from robot.utils import html_escape
+from robot.utils import html_escape, millis_to_timestamp, timestamp_to_millis
 
 from .body import BodyItem
 from .itemlist import ItemList
@@ -27,7 +27,7 @@ class Message(BodyItem):
     """
     type = BodyItem.MESSAGE
     repr_args = ('message', 'level')
-    __slots__ = ['message', 'level', 'html', 'timestamp']
+    __slots__ = ['message', 'level', 'html', 'timestamp_millis']
 
     def __init__(self, message='', level='INFO', html=False, timestamp=None, parent=None):
         #: The message content as a string.
@@ -38,11 +38,25 @@ class Message(BodyItem):
         self.level = level
         #: ``True`` if the content is in HTML, ``False`` otherwise.
         self.html = html
-        #: Timestamp in format ``%Y%m%d %H:%M:%S.%f``.
         self.timestamp = timestamp
         #: The object this message was triggered by.
         self.parent = parent
 
+    @property
+    def timestamp(self):
+        """Timestamp in format ``%Y%m%d %H:%M:%S.%f``.
+
+        Timestamp is stored as milliseconds after the epoch in
+        :attr:`timestamp_millis` and converted to a string when accessed.
+        """
+        if self.timestamp_millis is None:
+            return None
+        return millis_to_timestamp(self.timestamp_millis)
+
+    @timestamp.setter
+    def timestamp(self, timestamp):
+        self.timestamp_millis = timestamp_to_millis(timestamp) if timestamp else None
+
     @property
     def html_message(self):
         """Returns the message content as HTML."""
@@ -60,6 +60,9 @@ Visitors extending the :class:`SuiteVisitor` can stop visiting at a certain
 level either by overriding suitable :meth:`visit_x` method or by returning
 an explicit ``False`` from any :meth:`start_x` method.
 
+Multiple visitors can be run using one traversal of the suite structure
+by combining them with :class:`CompositeVisitor`.
+
 Examples
 --------
 
@@ -144,7 +147,7 @@ class SuiteVisitor:
         the body of the keyword
         """
         if self.start_keyword(kw) is not False:
-            if hasattr(kw, 'body'):
+            if kw.has_body:
                 kw.body.visit(self)
             if kw.has_teardown:
                 kw.teardown.visit(self)
@@ -384,7 +387,7 @@ class SuiteVisitor:
     def visit_return(self, return_):
         """Visits a RETURN elements."""
         if self.start_return(return_) is not False:
-            if hasattr(return_, 'body'):
+            if return_.has_body:
                 return_.body.visit(self)
             self.end_return(return_)
 
@@ -407,7 +410,7 @@ class SuiteVisitor:
     def visit_continue(self, continue_):
         """Visits CONTINUE elements."""
         if self.start_continue(continue_) is not False:
-            if hasattr(continue_, 'body'):
+            if continue_.has_body:
                 continue_.body.visit(self)
             self.end_continue(continue_)
 
@@ -430,7 +433,7 @@ class SuiteVisitor:
     def visit_break(self, break_):
         """Visits BREAK elements."""
         if self.start_break(break_) is not False:
-            if hasattr(break_, 'body'):
+            if break_.has_body:
                 break_.body.visit(self)
             self.end_break(break_)
 
@@ -497,3 +500,140 @@ class SuiteVisitor:
         Default implementation does nothing.
         """
         pass
+
+
+class CompositeVisitor(SuiteVisitor):
+    """Runs multiple visitors using one traversal of the suite structure.
+
+    Visiting a big suite structure separately with multiple visitors means
+    traversing the structure once per visitor. This visitor calls the
+    :meth:`start_x` and :meth:`end_x` methods of all the given visitors in
+    one traversal. At each item visitors are called in the given order and
+    visitors that return ``False`` from :meth:`start_x` do not see child items.
+    If a visitor has overridden :meth:`visit_x`, that method is called instead
+    and it is responsible for visiting the item and its children itself.
+
+    Visitors can be combined like this if the results are the same as when
+    visiting separately. That is the case if visitors modify only the visited
+    item or its children when the item is started, which is how visitors
+    typically work, but not if a visitor modifies already visited items in
+    :meth:`end_x`, and a visitor given later depends on that modification.
+
+    New in Robot Framework 5.0.
+    """
+
+    def __init__(self, *visitors):
+        self.visitors = visitors
+        self._active = [[(visitor, self._get_overridden(visitor))
+                         for visitor in visitors]]
+
+    def _get_overridden(self, visitor):
+        return {name for name in dir(SuiteVisitor) if name.startswith('visit_')
+                and getattr(type(visitor), name) is not getattr(SuiteVisitor, name)}
+
+    def _start(self, item, name):
+        active = []
+        visit, start = 'visit_' + name, 'start_' + name
+        for visitor, overridden in self._active[-1]:
+            if visit in overridden:
+                getattr(visitor, visit)(item)
+            elif getattr(visitor, start)(item) is not False:
+                active.append((visitor, overridden))
+        if not active:
+            return False
+        self._active.append(active)
+
+    def _end(self, item, name):
+        end = 'end_' + name
+        for visitor, _ in self._active.pop():
+            getattr(visitor, end)(item)
+
+    def start_suite(self, suite):
+        return self._start(suite, 'suite')
+
+    def end_suite(self, suite):
+        self._end(suite, 'suite')
+
+    def start_test(self, test):
+        return self._start(test, 'test')
+
+    def end_test(self, test):
+        self._end(test, 'test')
+
+    def start_keyword(self, keyword):
+        return self._start(keyword, 'keyword')
+
+    def end_keyword(self, keyword):
+        self._end(keyword, 'keyword')
+
+    def start_for(self, for_):
+        return self._start(for_, 'for')
+
+    def end_for(self, for_):
+        self._end(for_, 'for')
+
+    def start_for_iteration(self, iteration):
+        return self._start(iteration, 'for_iteration')
+
+    def end_for_iteration(self, iteration):
+        self._end(iteration, 'for_iteration')
+
+    def start_if(self, if_):
+        return self._start(if_, 'if')
+
+    def end_if(self, if_):
+        self._end(if_, 'if')
+
+    def start_if_branch(self, branch):
+        return self._start(branch, 'if_branch')
+
+    def end_if_branch(self, branch):
+        self._end(branch, 'if_branch')
+
+    def start_try(self, try_):
+        return self._start(try_, 'try')
+
+    def end_try(self, try_):
+        self._end(try_, 'try')
+
+    def start_try_branch(self, branch):
+        return self._start(branch, 'try_branch')
+
+    def end_try_branch(self, branch):
+        self._end(branch, 'try_branch')
+
+    def start_while(self, while_):
+        return self._start(while_, 'while')
+
+    def end_while(self, while_):
+        self._end(while_, 'while')
+
+    def start_while_iteration(self, iteration):
+        return self._start(iteration, 'while_iteration')
+
+    def end_while_iteration(self, iteration):
+        self._end(iteration, 'while_iteration')
+
+    def start_return(self, return_):
+        return self._start(return_, 'return')
+
+    def end_return(self, return_):
+        self._end(return_, 'return')
+
+    def start_continue(self, continue_):
+        return self._start(continue_, 'continue')
+
+    def end_continue(self, continue_):
+        self._end(continue_, 'continue')
+
+    def start_break(self, break_):
+        return self._start(break_, 'break')
+
+    def end_break(self, break_):
+        self._end(break_, 'break')
+
+    def start_message(self, msg):
+        return self._start(msg, 'message')
+
+    def end_message(self, msg):
+        self._end(msg, 'message')
@@ -0,0 +1,201 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import time
+
+from robot.result import binaryformat as bf
+from robot.result.visitor import ResultVisitor
+from robot.utils import get_epoch_millis, safe_str
+from robot.version import get_full_version
+
+from .loggerhelper import IsLogged
+
+
+class BinaryLogger(ResultVisitor):
+    """Writes results in the :mod:`binary format <robot.result.binaryformat>`.
+
+    Works like :class:`~robot.output.xmllogger.XmlLogger` and can be used
+    both during execution and for writing existing results.
+    """
+    # See `XmlLogger.sync_interval`.
+    sync_interval = 1.0
+
+    def __init__(self, path, log_level='TRACE', rpa=False, generator='Robot',
+                 journal=False):
+        self._log_message_is_logged = IsLogged(log_level)
+        self._error_message_is_logged = IsLogged('WARN')
+        self._writer = bf.RecordWriter(path)
+        self._writer.write(bf.ROBOT, get_full_version(generator),
+                           get_epoch_millis(), rpa)
+        self._errors = []
+        self._journal = journal
+        self._synced = None
+
+    def close(self):
+        self._writer.write(bf.ERRORS)
+        for msg in self._errors:
+            self._write_message(msg)
+        self._writer.close()
+
+    def set_log_level(self, level):
+        return self._log_message_is_logged.set_level(level)
+
+    def message(self, msg):
+        if self._error_message_is_logged(msg.level):
+            self._errors.append(msg)
+
+    def log_message(self, msg):
+        if self._log_message_is_logged(msg.level):
+            self._write_message(msg)
+
+    def start_message(self, msg):
+        self._write_message(msg)
+
+    def _write_message(self, msg):
+        self._writer.write(bf.MESSAGE, msg.message, self._writer.string(msg.level),
+                           msg.html, msg.timestamp_millis)
+
+    def start_keyword(self, kw):
+        string, strings = self._writer.string, self._writer.strings
+        self._writer.write(bf.KEYWORD, string(kw.type), string(kw.kwname),
+                           string(kw.libname), string(kw.sourcename or None),
+                           strings(kw.assign), strings(safe_str(a) for a in kw.args),
+                           strings(kw.tags), kw.doc)
+
+    def end_keyword(self, kw):
+        self._writer.write(bf.KEYWORD_END, str(kw.timeout) if kw.timeout else None,
+                           *self._status(kw))
+
+    def start_if(self, if_):
+        self._writer.write(bf.IF, if_.doc)
+
+    def end_if(self, if_):
+        self._write_end(if_)
+
+    def start_if_branch(self, branch):
+        self._writer.write(bf.IF_BRANCH, self._writer.string(branch.type),
+                           branch.condition, branch.doc)
+
+    def end_if_branch(self, branch):
+        self._write_end(branch)
+
+    def start_for(self, for_):
+        strings = self._writer.strings
+        self._writer.write(bf.FOR, self._writer.string(for_.flavor),
+                           strings(for_.variables), strings(for_.values), for_.doc)
+
+    def end_for(self, for_):
+        self._write_end(for_)
+
+    def start_for_iteration(self, iteration):
+        string = self._writer.string
+        variables = [(string(name), value)
+                     for name, value in iteration.variables.items()]
+        self._writer.write(bf.FOR_ITERATION, variables, iteration.doc)
+
+    def end_for_iteration(self, iteration):
+        self._write_end(iteration)
+
+    def start_try(self, root):
+        self._writer.write(bf.TRY, root.doc)
+
+    def end_try(self, root):
+        self._write_end(root)
+
+    def start_try_branch(self, branch):
+        patterns = branch.patterns if branch.type == branch.EXCEPT else ()
+        variable = branch.variable if branch.type == branch.EXCEPT else None
+        self._writer.write(bf.TRY_BRANCH, self._writer.string(branch.type),
+                           self._writer.strings(patterns), variable)
+
+    def end_try_branch(self, branch):
+        self._write_end(branch)
+
+    def start_while(self, while_):
+        self._writer.write(bf.WHILE, while_.condition, while_.doc)
+
+    def end_while(self, while_):
+        self._write_end(while_)
+
+    def start_while_iteration(self, iteration):
+        self._writer.write(bf.WHILE_ITERATION, iteration.doc)
+
+    def end_while_iteration(self, iteration):
+        self._write_end(iteration)
+
+    def start_return(self, return_):
+        self._writer.write(bf.RETURN, self._writer.strings(return_.values))
+
+    def end_return(self, return_):
+        self._write_end(return_)
+
+    def start_continue(self, continue_):
+        self._writer.write(bf.CONTINUE)
+
+    def end_continue(self, continue_):
+        self._write_end(continue_)
+
+    def start_break(self, break_):
+        self._writer.write(bf.BREAK)
+
+    def end_break(self, break_):
+        self._write_end(break_)
+
+    def start_test(self, test):
+        self._writer.write(bf.TEST, test.name, test.lineno)
+        if self._journal:
+            self._sync()
+
+    def end_test(self, test):
+        self._writer.write(bf.TEST_END, test.doc, self._writer.strings(test.tags),
+                           str(test.timeout) if test.timeout else None,
+                           *self._status(test))
+        if self._journal:
+            self._sync()
+
+    def start_suite(self, suite):
+        self._writer.write(bf.SUITE, self._writer.string(suite.name),
+                           self._writer.string(suite.source))
+        if self._journal:
+            self._sync()
+
+    def end_suite(self, suite):
+        self._writer.write(bf.SUITE_END, suite.doc, list(suite.metadata.items()),
+                           *self._status(suite))
+        if self._journal:
+            self._sync()
+
+    def _sync(self):
+        now = time.monotonic()
+        sync = self._synced is None or now - self._synced >= self.sync_interval
+        self._writer.flush(sync)
+        if sync:
+            self._synced = now
+
+    def visit_statistics(self, stats):
+        # Statistics are calculated when results are read.
+        pass
+
+    def visit_errors(self, errors):
+        self._writer.write(bf.ERRORS)
+        for msg in errors:
+            self._write_message(msg)
+
+    def _write_end(self, item):
+        self._writer.write(bf.END, *self._status(item))
+
+    def _status(self, item):
+        return (self._writer.string(item.status), item.message,
+                item.start_millis, item.end_millis)
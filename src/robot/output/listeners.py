@@ -27,8 +27,8 @@ class Listeners:
     _method_names = ('start_suite', 'end_suite', 'start_test', 'end_test',
                      'start_keyword', 'end_keyword', 'log_message', 'message',
                      'output_file', 'report_file', 'log_file', 'debug_file',
-                     'xunit_file', 'library_import', 'resource_import',
-                     'variables_import', 'close')
+                     'xunit_file', 'binary_output_file', 'library_import',
+                     'resource_import', 'variables_import', 'close')
 
     def __init__(self, listeners, log_level='INFO'):
         self._is_logged = IsLogged(log_level)
@@ -60,7 +60,7 @@ class Listeners:
         method(name, attrs)
 
     def output_file(self, file_type, path):
-        method = getattr(self, '_%s_file' % file_type.lower())
+        method = getattr(self, '_%s_file' % file_type.lower().replace(' ', '_'))
         method(path)
 
     def __bool__(self):
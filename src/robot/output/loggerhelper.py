@@ -15,7 +15,7 @@
 
 from robot.errors import DataError
 from robot.model import Message as BaseMessage
-from robot.utils import get_timestamp, is_string, safe_str
+from robot.utils import get_epoch_millis, is_string, safe_str
 
 
 LEVELS = {
@@ -80,8 +80,9 @@ class Message(BaseMessage):
     def __init__(self, message, level='INFO', html=False, timestamp=None):
         message = self._normalize_message(message)
         level, html = self._get_level_and_html(level, html)
-        timestamp = timestamp or get_timestamp()
         super().__init__(message, level, html, timestamp)
+        if not timestamp:
+            self.timestamp_millis = get_epoch_millis()
 
     def _normalize_message(self, msg):
         if callable(msg):
@@ -14,10 +14,12 @@
 #  limitations under the License.
 
 from . import pyloggingconf
+from .binarylogger import BinaryLogger
 from .debugfile import DebugFile
 from .listeners import LibraryListeners, Listeners
 from .logger import LOGGER
 from .loggerhelper import AbstractLogger
+from .resultlogger import ResultLogger
 from .xmllogger import XmlLogger
 
 
@@ -26,17 +28,27 @@ class Output(AbstractLogger):
     def __init__(self, settings):
         AbstractLogger.__init__(self)
         self._xmllogger = XmlLogger(settings.output, settings.log_level,
-                                    settings.rpa)
+                                    settings.rpa, journal=settings.journal)
+        self._binarylogger = BinaryLogger(settings.binary_output, settings.log_level,
+                                          settings.rpa, journal=settings.journal) \
+            if settings.binary_output else None
         self.listeners = Listeners(settings.listeners, settings.log_level)
         self.library_listeners = LibraryListeners(settings.log_level)
+        self._result_logger = ResultLogger(settings.log_level,
+                                           settings.flatten_keywords) \
+            if settings.results_in_memory else None
         self._register_loggers(DebugFile(settings.debug_file))
         self._settings = settings
 
     def _register_loggers(self, debug_file):
         LOGGER.register_xml_logger(self._xmllogger)
         LOGGER.register_listeners(self.listeners or None, self.library_listeners)
+        if self._binarylogger:
+            LOGGER.register_logger(self._binarylogger)
         if debug_file:
             LOGGER.register_logger(debug_file)
+        if self._result_logger:
+            LOGGER.register_logger(self._result_logger)
 
     def register_error_listener(self, listener):
         LOGGER.register_error_listener(listener)
@@ -45,7 +57,15 @@ class Output(AbstractLogger):
         self._xmllogger.visit_statistics(result.statistics)
         self._xmllogger.close()
         LOGGER.unregister_xml_logger()
+        if self._result_logger:
+            LOGGER.unregister_logger(self._result_logger)
+            result.errors.messages = self._result_logger.errors
+            result.source = self._settings.output
         LOGGER.output_file('Output', self._settings['Output'])
+        if self._binarylogger:
+            self._binarylogger.close()
+            LOGGER.unregister_logger(self._binarylogger)
+            LOGGER.output_file('Binary output', self._settings['BinaryOutput'])
 
     def start_suite(self, suite):
         LOGGER.start_suite(suite)
@@ -68,8 +88,27 @@ class Output(AbstractLogger):
     def message(self, msg):
         LOGGER.log_message(msg)
 
+    def replay(self, *items):
+        """Writes keywords and messages executed earlier to the output file."""
+        for item in items:
+            item.visit(self._xmllogger)
+            if self._binarylogger:
+                item.visit(self._binarylogger)
+
+    def replay_errors(self, errors):
+        for msg in errors:
+            self._xmllogger.message(msg)
+            if self._binarylogger:
+                self._binarylogger.message(msg)
+            if self._result_logger:
+                self._result_logger.message(msg)
+
     def set_log_level(self, level):
         pyloggingconf.set_level(level)
         self.listeners.set_log_level(level)
         self.library_listeners.set_log_level(level)
+        if self._result_logger:
+            self._result_logger.set_log_level(level)
+        if self._binarylogger:
+            self._binarylogger.set_log_level(level)
         return self._xmllogger.set_log_level(level)
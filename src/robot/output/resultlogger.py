@@ -0,0 +1,149 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from robot.result import Message
+from robot.result.flattenkeywordmatcher import (FlattenByNameMatcher,
+                                                FlattenByTagMatcher,
+                                                FlattenByTypeMatcher)
+
+from .loggerhelper import IsLogged
+
+
+class ResultLogger:
+    """Adds keywords and messages to the result model during execution.
+
+    Suites and tests are added to the result model by the runner, but keywords
+    and control structures are only written to the output file. This logger
+    adds them, along with logged messages, to the result model so that log and
+    report can be created without reading the output file. Messages are
+    filtered and keywords flattened the same way as when the output file is
+    written and read.
+    """
+
+    def __init__(self, log_level='TRACE', flatten_keywords=None):
+        self._log_message_is_logged = IsLogged(log_level)
+        self._error_message_is_logged = IsLogged('WARN')
+        self._flattener = KeywordFlattener(flatten_keywords or [])
+        self._items = []
+        self._started_keywords = 0
+        self.errors = []
+
+    def set_log_level(self, level):
+        return self._log_message_is_logged.set_level(level)
+
+    def start_suite(self, suite):
+        self._items.append(suite.result)
+
+    def end_suite(self, suite):
+        self._items.pop()
+
+    def start_test(self, test):
+        self._items.append(test.result)
+
+    def end_test(self, test):
+        self._items.pop()
+
+    def start_keyword(self, kw):
+        result = kw.result
+        parent = self._items[-1]
+        # Loop iterations are added to their loops already when they are created.
+        if result.parent is not parent:
+            if result.type == result.SETUP:
+                parent.setup = result
+            elif result.type == result.TEARDOWN:
+                parent.teardown = result
+            else:
+                parent.body.append(result)
+        self._items.append(result)
+        self._started_keywords += 1
+
+    def end_keyword(self, kw):
+        self._started_keywords -= 1
+        self._flattener.flatten_if_needed(self._items.pop())
+
+    def log_message(self, msg):
+        if self._started_keywords and self._log_message_is_logged(msg.level):
+            self._items[-1].body.append(Message(msg.message, msg.level, msg.html,
+                                                msg.timestamp))
+
+    def message(self, msg):
+        if self._error_message_is_logged(msg.level):
+            self.errors.append(Message(msg.message, msg.level, msg.html,
+                                       msg.timestamp))
+
+
+class KeywordFlattener:
+    """Flattens keywords matching ``--flattenkeywords`` options.
+
+    Flattened keywords get all messages of their children and the children
+    are removed otherwise. The result is the same as when keywords are
+    flattened while reading the output file.
+    """
+    _types = {'FOR': 'for', 'WHILE': 'while', 'ITERATION': 'iter'}
+    _keywords = {'KEYWORD', 'SETUP', 'TEARDOWN'}
+    _containers = {'IF/ELSE ROOT', 'TRY/EXCEPT ROOT'} | set(_types) | _keywords
+
+    def __init__(self, flatten):
+        self._match_name = FlattenByNameMatcher(flatten)
+        self._match_type = FlattenByTypeMatcher(flatten)
+        self._match_tags = FlattenByTagMatcher(flatten)
+
+    def __bool__(self):
+        return bool(self._match_name or self._match_type or self._match_tags)
+
+    def flatten_if_needed(self, item):
+        if self and item.type in self._containers and self._should_flatten(item):
+            self._flatten(item)
+
+    def _should_flatten(self, item):
+        # Matching is done the same way as when reading output files where
+        # also control structures are matched by name using an empty name.
+        if item.type in self._keywords:
+            name, library, tags = item.kwname, item.libname, item.tags
+        else:
+            name, library, tags = '', None, None
+        if self._match_name and self._match_name.match(name, library):
+            return True
+        if self._match_type and item.type in self._types:
+            return self._match_type.match(self._types[item.type])
+        return bool(self._match_tags and tags and self._match_tags.match(tags))
+
+    def _flatten(self, item):
+        item.body = list(self._flatten_body(item))
+        if item.has_teardown:
+            item.teardown = None
+        item.doc = ('%s\n\n_*Keyword content flattened.*_' % item.doc).strip()
+
+    def _flatten_body(self, item):
+        # Direct children that are not containers, such as RETURN and branches
+        # of IF and TRY, are preserved similarly as when reading output files.
+        for child in item.body:
+            if child.type in self._containers:
+                yield from self._get_messages(child)
+            else:
+                if child.type != child.MESSAGE:
+                    child.body = list(self._flatten_body(child))
+                yield child
+        if item.has_teardown:
+            yield from self._get_messages(item.teardown)
+
+    def _get_messages(self, item):
+        for child in item.body:
+            if child.type == child.MESSAGE:
+                yield child
+            else:
+                yield from self._get_messages(child)
+        if item.has_teardown:
+            yield from self._get_messages(item.teardown)
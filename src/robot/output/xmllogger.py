@@ -13,7 +13,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from robot.utils import get_timestamp, NullMarkupWriter, safe_str, XmlWriter
+import os
+import time
+
+from robot.utils import (file_writer, get_timestamp, is_pathlike, is_string,
+                         NullMarkupWriter, safe_str, XmlWriter)
 from robot.version import get_full_version
 from robot.result.visitor import ResultVisitor
 
@@ -21,17 +25,28 @@ from .loggerhelper import IsLogged
 
 
 class XmlLogger(ResultVisitor):
-
-    def __init__(self, path, log_level='TRACE', rpa=False, generator='Robot'):
+    # Output files can be huge and written to slow network drives.
+    # A large write buffer reduces the number of system calls.
+    buffer_size = 1024 * 1024
+    # In journal mode the output file is flushed when tests and suites start
+    # and end, but synced to the disk at most this often (seconds).
+    sync_interval = 1.0
+
+    def __init__(self, path, log_level='TRACE', rpa=False, generator='Robot',
+                 journal=False):
         self._log_message_is_logged = IsLogged(log_level)
         self._error_message_is_logged = IsLogged('WARN')
         self._writer = self._get_writer(path, rpa, generator)
         self._errors = []
+        self._journal = journal and bool(path)
+        self._synced = None
 
     def _get_writer(self, path, rpa, generator):
         if not path:
             return NullMarkupWriter()
-        writer = XmlWriter(path, write_empty=False, usage='output')
+        if is_string(path) or is_pathlike(path):
+            path = file_writer(path, usage='output', buffer_size=self.buffer_size)
+        writer = XmlWriter(path, write_empty=False)
         writer.start('robot', {'generator': get_full_version(generator),
                                'generated': get_timestamp(),
                                'rpa': 'true' if rpa else 'false',
@@ -57,6 +72,9 @@ class XmlLogger(ResultVisitor):
         if self._log_message_is_logged(msg.level):
             self._write_message(msg)
 
+    def start_message(self, msg):
+        self._write_message(msg)
+
     def _write_message(self, msg):
         attrs = {'timestamp': msg.timestamp or 'N/A', 'level': msg.level}
         if msg.html:
@@ -182,6 +200,8 @@ class XmlLogger(ResultVisitor):
     def start_test(self, test):
         self._writer.start('test', {'id': test.id, 'name': test.name,
                                     'line': str(test.lineno or '')})
+        if self._journal:
+            self._sync()
 
     def end_test(self, test):
         self._writer.element('doc', test.doc)
@@ -190,10 +210,14 @@ class XmlLogger(ResultVisitor):
             self._writer.element('timeout', attrs={'value': str(test.timeout)})
         self._write_status(test)
         self._writer.end('test')
+        if self._journal:
+            self._sync()
 
     def start_suite(self, suite):
         attrs = {'id': suite.id, 'name': suite.name, 'source': suite.source}
         self._writer.start('suite', attrs)
+        if self._journal:
+            self._sync()
 
     def end_suite(self, suite):
         self._writer.element('doc', suite.doc)
@@ -201,6 +225,16 @@ class XmlLogger(ResultVisitor):
             self._writer.element('meta', value, {'name': name})
         self._write_status(suite)
         self._writer.end('suite')
+        if self._journal:
+            self._sync()
+
+    def _sync(self):
+        output = self._writer.output
+        output.flush()
+        now = time.monotonic()
+        if self._synced is None or now - self._synced >= self.sync_interval:
+            os.fsync(output.fileno())
+            self._synced = now
 
     def start_statistics(self, stats):
         self._writer.start('statistics')
@@ -243,6 +277,6 @@ class XmlLogger(ResultVisitor):
     def _write_status(self, item):
         attrs = {'status': item.status, 'starttime': item.starttime or 'N/A',
                  'endtime': item.endtime or 'N/A'}
-        if not (item.starttime and item.endtime):
+        if item.start_millis is None or item.end_millis is None:
             attrs['elapsedtime'] = str(item.elapsedtime)
         self._writer.element('status', item.message, attrs)
@@ -23,5 +23,6 @@ this module directly, issue should be submitted about exposing it explicitly via
 
 from .lexer import get_tokens, get_resource_tokens, get_init_tokens, Token
 from .model import ModelTransformer, ModelVisitor
-from .parser import get_model, get_resource_model, get_init_model
+from .parser import (get_model, get_resource_model, get_init_model,
+                     update_model, update_resource_model, update_init_model)
 from .suitestructure import SuiteStructureBuilder, SuiteStructureVisitor
@@ -92,10 +92,12 @@ class Lexer:
                 self.lexer.input(data)
 
     def _read(self, source):
+        # Lines are read lazily to avoid having the whole data in memory twice,
+        # first as one big string and then split to lines.
         try:
             with FileReader(source, accept_text=True) as reader:
-                return reader.read()
-        except:
+                yield from reader.readlines()
+        except Exception:
             raise DataError(get_error_message())
 
     def get_tokens(self):
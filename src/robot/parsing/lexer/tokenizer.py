@@ -14,6 +14,7 @@
 #  limitations under the License.
 
 import re
+from sys import intern
 
 from .tokens import Token
 
@@ -23,8 +24,15 @@ class Tokenizer:
     _pipe_splitter = re.compile(r'((?:\A|\s+)\|(?:\s+|\Z))', re.UNICODE)
 
     def tokenize(self, data, data_only=False):
+        """Tokenizes the given data to statements.
+
+        ``data`` can be a string or an iterable yielding lines. In the latter
+        case lines are consumed lazily, which allows tokenizing big files
+        without reading them into memory first.
+        """
         current = []
-        for lineno, line in enumerate(data.splitlines(not data_only), start=1):
+        lines = self._split_lines(data, keepends=not data_only)
+        for lineno, line in enumerate(lines, start=1):
             tokens = self._tokenize_line(line, lineno, not data_only)
             tokens, starts_new = self._cleanup_tokens(tokens, data_only)
             if starts_new:
@@ -35,6 +43,13 @@ class Tokenizer:
                 current.extend(tokens)
         yield current
 
+    def _split_lines(self, data, keepends):
+        if isinstance(data, str):
+            return data.splitlines(keepends)
+        # Lines read from files are split only from newlines, but the data
+        # may also contain other line boundaries `str.splitlines` handles.
+        return (part for line in data for part in line.splitlines(keepends))
+
     def _tokenize_line(self, line, lineno, include_separators=True):
         # Performance optimized code.
         tokens = []
@@ -46,13 +61,13 @@ class Tokenizer:
             splitter = self._split_from_spaces
         for value, is_data in splitter(line.rstrip()):
             if is_data:
-                append(Token(None, value, lineno, offset))
+                append(Token(None, intern(value), lineno, offset))
             elif include_separators:
-                append(Token(Token.SEPARATOR, value, lineno, offset))
+                append(Token(Token.SEPARATOR, intern(value), lineno, offset))
             offset += len(value)
         if include_separators:
             trailing_whitespace = line[len(line.rstrip()):]
-            append(Token(Token.EOL, trailing_whitespace, lineno, offset))
+            append(Token(Token.EOL, intern(trailing_whitespace), lineno, offset))
         return tokens
 
     def _split_from_spaces(self, line):
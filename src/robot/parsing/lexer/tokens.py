@@ -145,8 +145,7 @@ class Token:
         KEYWORD_NAME
     ))
 
-    __slots__ = ['type', 'value', 'lineno', 'col_offset', 'error',
-                 '_add_eos_before', '_add_eos_after']
+    __slots__ = ['type', 'value', 'lineno', 'col_offset', 'error', '_eos']
 
     def __init__(self, type=None, value=None, lineno=-1, col_offset=-1, error=None):
         self.type = type
@@ -162,8 +161,24 @@ class Token:
         self.col_offset = col_offset
         self.error = error
         # Used internally be lexer to indicate that EOS is needed before/after.
-        self._add_eos_before = False
-        self._add_eos_after = False
+        # Both flags are stored in one slot to keep tokens small.
+        self._eos = 0
+
+    @property
+    def _add_eos_before(self):
+        return bool(self._eos & 1)
+
+    @_add_eos_before.setter
+    def _add_eos_before(self, value):
+        self._eos = self._eos | 1 if value else self._eos & ~1
+
+    @property
+    def _add_eos_after(self):
+        return bool(self._eos & 2)
+
+    @_add_eos_after.setter
+    def _add_eos_after(self, value):
+        self._eos = self._eos | 2 if value else self._eos & ~2
 
     @property
     def end_col_offset(self):
@@ -13,4 +13,6 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from .parser import get_model, get_resource_model, get_init_model
+from .cache import ParseCache
+from .parser import (get_model, get_resource_model, get_init_model,
+                     update_model, update_resource_model, update_init_model)
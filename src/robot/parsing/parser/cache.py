@@ -0,0 +1,139 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+from robot.version import get_version
+
+from ..lexer import Token, get_tokens, get_resource_tokens, get_init_tokens
+from .parser import _tokens_to_statements, _statements_to_model
+
+
+class ParseCache:
+    """Persistent cache that avoids tokenizing unchanged files again.
+
+    Tokens of parsed files are stored to the given ``directory`` in a compact
+    serialized format. Cache entries are keyed by the absolute path of the
+    parsed file, the type of the file and the Robot Framework version, and
+    they are valid only as long as the file has the same modification time
+    and size or, if they have changed, the same content hash.
+
+    The model is built from the cached tokens every time. That is fast
+    compared to tokenizing and it guarantees that ``${CURDIR}`` is handled
+    correctly and that the model is validated by the current code.
+
+    Problems reading or writing cache files are silently ignored and the file
+    is parsed normally.
+    """
+    _format = 1
+
+    def __init__(self, directory):
+        self.directory = os.path.abspath(directory)
+
+    def get_model(self, source, curdir=None, data=None):
+        """Same as :func:`~robot.parsing.parser.parser.get_model` with caching.
+
+        :param source: Path to the parsed file. Used as the cache key and as
+            the source of the created model.
+        :param curdir: Value to use for ``${CURDIR}``.
+        :param data: Callable returning the data to tokenize if it is not the
+            ``source`` file itself. Called only if the cache is not valid.
+
+        The returned model always contains only data tokens.
+        """
+        return self._get_model(get_tokens, source, curdir, data)
+
+    def get_resource_model(self, source, curdir=None, data=None):
+        """Same as :meth:`get_model` but for resource files."""
+        return self._get_model(get_resource_tokens, source, curdir, data)
+
+    def get_init_model(self, source, curdir=None, data=None):
+        """Same as :meth:`get_model` but for suite initialization files."""
+        return self._get_model(get_init_tokens, source, curdir, data)
+
+    def _get_model(self, token_getter, source, curdir, data):
+        source = os.fspath(source)
+        tokens = self._get_tokens(token_getter, source, data)
+        statements = _tokens_to_statements(tokens, curdir)
+        model = _statements_to_model(statements, source)
+        model.validate_model()
+        return model
+
+    def _get_tokens(self, token_getter, source, data):
+        path = self._get_cache_path(token_getter, source)
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return token_getter(data() if data else source, data_only=True)
+        entry = self._read(path)
+        if entry and self._is_valid(entry, stat, source):
+            if entry['mtime'] != stat.st_mtime_ns:
+                entry['mtime'] = stat.st_mtime_ns
+                self._write(path, entry)
+            return [Token(*t) for t in entry['tokens']]
+        tokens = list(token_getter(data() if data else source, data_only=True))
+        self._write(path, {'mtime': stat.st_mtime_ns,
+                           'size': stat.st_size,
+                           'digest': self._get_digest(source),
+                           'tokens': [(t.type, t.value, t.lineno, t.col_offset, t.error)
+                                      for t in tokens]})
+        return tokens
+
+    def _get_cache_path(self, token_getter, source):
+        key = '\n'.join([str(self._format), get_version(), token_getter.__name__,
+                         os.path.normcase(os.path.abspath(source))])
+        name = hashlib.sha1(key.encode('UTF-8')).hexdigest()
+        return os.path.join(self.directory, name + '.pickle')
+
+    def _is_valid(self, entry, stat, source):
+        if entry['size'] != stat.st_size:
+            return False
+        if entry['mtime'] == stat.st_mtime_ns:
+            return True
+        digest = self._get_digest(source)
+        return digest is not None and digest == entry['digest']
+
+    def _get_digest(self, source):
+        try:
+            with open(source, 'rb') as file:
+                return hashlib.sha1(file.read()).hexdigest()
+        except OSError:
+            return None
+
+    def _read(self, path):
+        try:
+            with open(path, 'rb') as file:
+                return pickle.load(file)
+        except Exception:
+            return None
+
+    def _write(self, path, entry):
+        # Writing to a temporary file and renaming it is atomic and avoids
+        # corrupted entries when multiple processes use the same cache.
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    pickle.dump(entry, file, pickle.HIGHEST_PROTOCOL)
+                os.replace(temp, path)
+            except Exception:
+                os.remove(temp)
+                raise
+        except Exception:
+            pass
@@ -17,6 +17,7 @@ from ..lexer import Token, get_tokens, get_resource_tokens, get_init_tokens
 from ..model import Statement
 
 from .fileparser import FileParser
+from .updater import ModelUpdater
 
 
 def get_model(source, data_only=False, curdir=None):
@@ -64,6 +65,62 @@ def get_init_model(source, data_only=False, curdir=None):
     return _get_model(get_init_tokens, source, data_only, curdir)
 
 
+def update_model(model, start_line, end_line, text, curdir=None):
+    """Updates a model after lines in its source have been edited.
+
+    :param model: Model created earlier by :func:`get_model` or by this
+        function. The model must have been created with ``data_only=False``
+        and it is updated in place.
+    :param start_line: First edited line. Line numbers start from one.
+    :param end_line: Last edited line. Use ``start_line - 1`` if lines are
+        only inserted.
+    :param text: New text replacing the edited lines. Use an empty string
+        if lines are only removed.
+    :param curdir: Directory where the source file exists. See
+        :func:`get_model` for more details.
+
+    Only the edited tests or keywords, or the edited section when editing
+    settings, variables or comments, are parsed again and other parts of
+    the model are reused. Line numbers of tokens after the edit are updated.
+    The whole source is parsed again if the edit spans multiple sections or
+    affects, for example, section headers. The resulting model is the same
+    as one created by parsing the edited source from scratch.
+
+    Returns the updated model. Use :func:`update_resource_model` or
+    :func:`update_init_model` when updating resource or suite initialization
+    file models, respectively.
+
+    New in Robot Framework 5.0.
+    """
+    return _update_model(get_tokens, model, start_line, end_line, text, curdir)
+
+
+def update_resource_model(model, start_line, end_line, text, curdir=None):
+    """Updates a resource file model after lines in its source have been edited.
+
+    Otherwise same as :func:`update_model` but the model must have been
+    created by :func:`get_resource_model`.
+    """
+    return _update_model(get_resource_tokens, model, start_line, end_line, text,
+                         curdir)
+
+
+def update_init_model(model, start_line, end_line, text, curdir=None):
+    """Updates an init file model after lines in its source have been edited.
+
+    Otherwise same as :func:`update_model` but the model must have been
+    created by :func:`get_init_model`.
+    """
+    return _update_model(get_init_tokens, model, start_line, end_line, text,
+                         curdir)
+
+
+def _update_model(token_getter, model, start_line, end_line, text, curdir=None):
+    def parse(source, curdir):
+        return _get_model(token_getter, source, curdir=curdir)
+    return ModelUpdater(parse).update(model, start_line, end_line, text, curdir)
+
+
 def _get_model(token_getter, source, data_only=False, curdir=None):
     tokens = token_getter(source, data_only)
     statements = _tokens_to_statements(tokens, curdir)
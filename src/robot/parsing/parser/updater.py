@@ -0,0 +1,219 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from io import StringIO
+
+from ..lexer import Token
+from ..model import (Keyword, KeywordSection, ModelVisitor, SettingSection,
+                     TestCase, TestCaseSection)
+from ..model.blocks import ModelWriter
+
+
+class ModelUpdater:
+    """Updates a model after lines in its source have been edited.
+
+    Only the edited part of the model is parsed again and other nodes are
+    reused as-is. In test case and keyword sections the parsed part consists
+    of the edited tests or keywords as well as the test or keyword preceding
+    them, because an edit can make a test or keyword continue the previous
+    one. In other sections the whole edited section is parsed. Line numbers
+    of tokens after the edit are updated if the number of lines changes.
+
+    If the edit affects section headers, spans multiple sections, or changes
+    something that affects how other sections are parsed, the whole model is
+    parsed again. The result is always the same as when parsing the edited
+    source from scratch.
+
+    :param parse: Callable that gets the source and ``curdir`` and returns
+        a new :class:`~robot.parsing.model.blocks.File` model.
+    """
+
+    def __init__(self, parse):
+        self._parse = parse
+
+    def update(self, model, start_line, end_line, text, curdir=None):
+        lines = self._get_lines(model)
+        if not (1 <= start_line <= len(lines) + 1
+                and start_line - 1 <= end_line <= len(lines)):
+            raise ValueError(f"Invalid line range {start_line}-{end_line} "
+                             f"for source with {len(lines)} lines.")
+        new_lines = text.splitlines(True)
+        if new_lines and end_line < len(lines) \
+                and not new_lines[-1].endswith(('\n', '\r')):
+            new_lines[-1] += '\n'
+        edit = _Edit(start_line, end_line, new_lines)
+        if not self._update_section(model, lines, edit, curdir):
+            source = ''.join(lines[:start_line-1] + new_lines + lines[end_line:])
+            model.sections = self._parse(source, curdir).sections
+        return model
+
+    def _get_lines(self, model):
+        output = StringIO()
+        ModelWriter(output).write(model)
+        return output.getvalue().splitlines(True)
+
+    def _update_section(self, model, lines, edit, curdir):
+        sections = model.sections
+        index = self._find_section(sections, edit.first_line)
+        if index is None:
+            return False
+        section = sections[index]
+        header = section.header
+        if index + 1 < len(sections):
+            section_end = sections[index+1].lineno - 1
+        else:
+            section_end = len(lines)
+        if (header is None or edit.last_line > section_end
+                or edit.touches(header.lineno, header.end_lineno)):
+            return False
+        settings = [s for s in sections if isinstance(s, SettingSection)]
+        if isinstance(section, (TestCaseSection, KeywordSection)):
+            prefix = settings if isinstance(section, TestCaseSection) else []
+            first, last = self._get_block_range(section, edit)
+        elif isinstance(section, SettingSection) and len(settings) > 1:
+            return False
+        else:
+            prefix = []
+            first, last = 0, len(section.body)
+        body = section.body
+        start = body[first].lineno if first < len(body) else header.end_lineno + 1
+        end = body[last].lineno - 1 if last < len(body) else section_end
+        source = []
+        for other in prefix:
+            other_end = self._section_end(other, model, lines)
+            source.extend(self._lines_with_newline(lines, other.lineno, other_end))
+        source.extend(self._lines_with_newline(lines, header.lineno, header.end_lineno))
+        offset = len(source)
+        source.extend(lines[start-1:edit.start_line-1] + edit.new_lines
+                      + lines[edit.end_line:end])
+        parsed = self._parse(''.join(source), curdir).sections
+        if (len(parsed) != len(prefix) + 1 or type(parsed[-1]) is not type(section)
+                or self._template_changed(section, parsed[-1])):
+            return False
+        items = parsed[-1].body
+        # Continuation lines at the beginning of a section are part of
+        # the header, so it is taken from the parsed data as well.
+        header = parsed[-1].header if first == 0 else None
+        _LineShifter(start - offset - 1).visit_all(items + [header] if header
+                                                   else items)
+        delta = len(edit.new_lines) - (edit.end_line - edit.start_line + 1)
+        if delta:
+            _LineShifter(delta).visit_all(body[last:] + sections[index+1:])
+        body[first:last] = items
+        if header:
+            section.header = header
+        return True
+
+    def _find_section(self, sections, line):
+        if line < 1:
+            return None
+        for index, section in reversed(list(enumerate(sections))):
+            if section.lineno <= line:
+                return index
+        return None
+
+    def _section_end(self, section, model, lines):
+        index = model.sections.index(section)
+        if index + 1 < len(model.sections):
+            return model.sections[index+1].lineno - 1
+        return len(lines)
+
+    def _get_block_range(self, section, edit):
+        body = section.body
+        first = self._find_item(body, edit.first_line)
+        last = self._find_item(body, edit.last_line) + 1
+        # Start from the preceding test or keyword, or from the beginning of
+        # the section, because an edit can make items continue previous ones.
+        first = max(first - 1, 0)
+        while first > 0 and not self._is_block(body[first]):
+            first -= 1
+        # Statements after the edit can become part of the edited item.
+        while last < len(body) and not self._is_block(body[last]):
+            last += 1
+        return first, last
+
+    def _find_item(self, body, line):
+        index = -1
+        for index, item in enumerate(body):
+            if self._lineno(item) > line:
+                return index - 1
+        return index
+
+    def _lineno(self, item):
+        # Getting line number via the header is faster with blocks.
+        return getattr(item, 'header', item).lineno
+
+    def _is_block(self, item):
+        # Tests and keywords without a name are created from indented lines
+        # at the beginning of sections and they do not start a new block.
+        return (isinstance(item, (TestCase, Keyword))
+                and bool(item.header.tokens[0].value))
+
+    def _lines_with_newline(self, lines, start, end):
+        lines = lines[start-1:end]
+        if lines and not lines[-1].endswith(('\n', '\r')):
+            lines[-1] += '\n'
+        return lines
+
+    def _template_changed(self, old, new):
+        # Test Template affects how tests in all test case sections are parsed.
+        if not isinstance(old, SettingSection):
+            return False
+        return self._get_template(old) != self._get_template(new)
+
+    def _get_template(self, section):
+        return [token.value for statement in section.body
+                if statement.type == Token.TEST_TEMPLATE
+                for token in statement.data_tokens]
+
+
+class _Edit:
+
+    def __init__(self, start_line, end_line, new_lines):
+        self.start_line = start_line
+        self.end_line = end_line
+        self.new_lines = new_lines
+
+    @property
+    def first_line(self):
+        # With inserts, the line before the inserted lines is the first
+        # affected line.
+        if self.end_line < self.start_line:
+            return self.start_line - 1
+        return self.start_line
+
+    @property
+    def last_line(self):
+        return max(self.end_line, self.first_line)
+
+    def touches(self, start, end):
+        if self.end_line < self.start_line:
+            return start < self.start_line <= end
+        return self.start_line <= end and self.end_line >= start
+
+
+class _LineShifter(ModelVisitor):
+
+    def __init__(self, delta):
+        self.delta = delta
+
+    def visit_all(self, nodes):
+        if self.delta:
+            for node in nodes:
+                self.visit(node)
+
+    def visit_Statement(self, statement):
+        for token in statement.tokens:
+            token.lineno += self.delta
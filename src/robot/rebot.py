@@ -85,6 +85,14 @@ Options
  -R --merge               When combining results, merge outputs together
                           instead of putting them under a new top level suite.
                           Example: rebot --merge orig.xml rerun.xml
+    --recover             Process also outputs that are truncated because
+                          execution was interrupted, for example, when using
+                          robot's --journal option. Unfinished tests are marked
+                          failed and unfinished suites and keywords get
+                          a message telling that execution was interrupted.
+    --processes count     Read outputs in parallel using this many processes.
+                          Makes combining and merging many outputs faster.
+                          Example: rebot --processes 4 *.xml
  -N --name name           Set the name of the top level suite.
  -D --doc documentation   Set the documentation of the top level suite.
                           Simple formatting is supported (e.g. *bold*). If
@@ -139,6 +147,11 @@ Options
                           similarly as --log. Default: report.html
  -x --xunit file          xUnit compatible result file. Not created unless this
                           option is specified.
+    --binaryoutput file   Binary output file containing same data as the XML
+                          output. Binary outputs are faster to write and read
+                          than XML outputs and can be processed with Rebot
+                          similarly. Not created unless this option is
+                          specified. Default extension is `.bin`.
  -T --timestampoutputs    When this option is used, timestamp in a format
                           `YYYYMMDD-hhmmss` is added to all generated output
                           files between their basename and extension. For
@@ -147,6 +160,13 @@ Options
                           `report-20070503-154410.html`.
     --splitlog            Split the log file into smaller pieces that open in
                           browsers transparently.
+    --sharedstrings       When used with --splitlog, write long strings used
+                          by split log files only once to a separate
+                          `<log>-strings.js` file that is loaded when needed.
+    --logcompression level  Compression level between 0 and 9 to use with
+                          long strings in log and report files. Lower levels
+                          make creating outputs faster but files bigger and
+                          0 disables compression. Default is 9.
     --logtitle title      Title for the generated log file. The default title
                           is `<SuiteName> Log`.
     --reporttitle title   Title for the generated report file. The default
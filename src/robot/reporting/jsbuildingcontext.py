@@ -13,26 +13,38 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from os.path import exists, dirname
 
 from robot.output.loggerhelper import LEVELS
 from robot.utils import (attribute_escape, get_link_path, html_escape, html_format,
-                         is_string, safe_str, timestamp_to_secs)
+                         is_string, safe_str)
 
 from .expandkeywordmatcher import ExpandKeywordMatcher
+from .jswriter import ModelSpiller
 from .stringcache import StringCache
 
 
 class JsBuildingContext:
 
     def __init__(self, log_path=None, split_log=False, expand_keywords=None,
-                 prune_input=False):
+                 prune_input=False, spill_keywords=False, compression_level=9,
+                 compression_workers=None, shared_strings=False):
         # log_path can be a custom object in unit tests
         self._log_dir = dirname(log_path) if is_string(log_path) else None
         self._split_log = split_log
         self._prune_input = prune_input
-        self._strings = self._top_level_strings = StringCache()
+        self.spilled = ModelSpiller() if spill_keywords else None
+        self._compression_level = compression_level
+        # zlib releases the GIL when compressing, so threads are enough.
+        workers = compression_workers or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(workers) \
+            if workers > 1 and compression_level else None
+        self._strings = self._top_level_strings = self._string_cache()
+        self._shared_strings = self._string_cache() \
+            if split_log and shared_strings else None
         self.basemillis = None
         self.split_results = []
         self.min_level = 'NONE'
@@ -40,6 +52,9 @@ class JsBuildingContext:
         self._expand_matcher = ExpandKeywordMatcher(expand_keywords) \
             if expand_keywords else None
 
+    def _string_cache(self, shared=None):
+        return StringCache(self._compression_level, self._executor, shared)
+
     def string(self, string, escape=True, attr=False):
         if escape and string:
             if not is_string(string):
@@ -55,10 +70,9 @@ class JsBuildingContext:
             if self._log_dir and source and exists(source) else ''
         return self.string(rel_source)
 
-    def timestamp(self, time):
-        if not time:
+    def timestamp(self, millis):
+        if millis is None:
             return None
-        millis = int(timestamp_to_secs(time) * 1000)
         if self.basemillis is None:
             self.basemillis = millis
         return millis - self.basemillis
@@ -89,17 +103,37 @@ class JsBuildingContext:
     def strings(self):
         return self._strings.dump()
 
+    @property
+    def shared_strings(self):
+        if self._shared_strings is None:
+            return None
+        strings = self._shared_strings.dump()
+        return self.spilled.spill_json(strings) if self.spilled else strings
+
     def start_splitting_if_needed(self, split=False):
         if self._split_log and split:
-            self._strings = StringCache()
+            self._strings = self._string_cache(self._shared_strings)
             return True
         return False
 
     def end_splitting(self, model):
-        self.split_results.append((model, self.strings))
+        if self.spilled:
+            self.split_results.append((self.spilled.spill_json(model),
+                                       self.spilled.spill_json(self.strings)))
+        else:
+            self.split_results.append((model, self.strings))
         self._strings = self._top_level_strings
         return len(self.split_results)
 
+    def spill(self, keywords):
+        if self.spilled and keywords and not isinstance(keywords, int):
+            return self.spilled.spill(keywords)
+        return keywords
+
+    def close(self):
+        if self._executor:
+            self._executor.shutdown()
+
     @contextmanager
     def prune_input(self, *items):
         yield
@@ -22,13 +22,16 @@ from .stringcache import StringIndex
 class JsExecutionResult:
 
     def __init__(self, suite, statistics, errors, strings, basemillis=None,
-                 split_results=None, min_level=None, expand_keywords=None):
+                 split_results=None, min_level=None, expand_keywords=None,
+                 spilled=None, shared_strings=None):
         self.suite = suite
         self.strings = strings
         self.min_level = min_level
         self.data = self._get_data(statistics, errors, basemillis or 0,
                                    expand_keywords)
         self.split_results = split_results or []
+        self.shared_strings = shared_strings
+        self.spilled = spilled
 
     def _get_data(self, statistics, errors, basemillis, expand_keywords):
         return OrderedDict([
@@ -41,11 +44,18 @@ class JsExecutionResult:
 
     def remove_data_not_needed_in_report(self):
         self.data.pop('errors')
+        self.close()
         remover = _KeywordRemover()
         self.suite = remover.remove_keywords(self.suite)
         self.suite, self.strings \
                 = remover.remove_unused_strings(self.suite, self.strings)
 
+    def close(self):
+        """Removes possibly spilled keywords. They are not needed afterwards."""
+        if self.spilled:
+            self.spilled.close()
+            self.spilled = None
+
 
 class _KeywordRemover:
 
@@ -31,22 +31,35 @@ KEYWORD_TYPES = {'KEYWORD': 0, 'SETUP': 1, 'TEARDOWN': 2,
 class JsModelBuilder:
 
     def __init__(self, log_path=None, split_log=False, expand_keywords=None,
-                 prune_input_to_save_memory=False):
+                 prune_input_to_save_memory=False, spill_keywords=False,
+                 compression_level=9, shared_strings=False):
         self._context = JsBuildingContext(log_path, split_log, expand_keywords,
-                                          prune_input_to_save_memory)
+                                          prune_input_to_save_memory,
+                                          spill_keywords, compression_level,
+                                          shared_strings=shared_strings)
 
     def build_from(self, result_from_xml):
         # Statistics must be build first because building suite may prune input.
-        return JsExecutionResult(
-            statistics=StatisticsBuilder().build(result_from_xml.statistics),
-            suite=SuiteBuilder(self._context).build(result_from_xml.suite),
-            errors=ErrorsBuilder(self._context).build(result_from_xml.errors),
-            strings=self._context.strings,
-            basemillis=self._context.basemillis,
-            split_results=self._context.split_results,
-            min_level=self._context.min_level,
-            expand_keywords=self._context.expand_keywords
-        )
+        try:
+            return JsExecutionResult(
+                statistics=StatisticsBuilder().build(result_from_xml.statistics),
+                suite=SuiteBuilder(self._context).build(result_from_xml.suite),
+                errors=ErrorsBuilder(self._context).build(result_from_xml.errors),
+                strings=self._context.strings,
+                basemillis=self._context.basemillis,
+                split_results=self._context.split_results,
+                shared_strings=self._context.shared_strings,
+                min_level=self._context.min_level,
+                expand_keywords=self._context.expand_keywords,
+                spilled=self._context.spilled
+            )
+        except:
+            # Spilled keywords are not needed if building fails.
+            if self._context.spilled:
+                self._context.spilled.close()
+            raise
+        finally:
+            self._context.close()
 
 
 class _Builder:
@@ -59,7 +72,7 @@ class _Builder:
 
     def _get_status(self, item):
         model = (STATUSES[item.status],
-                 self._timestamp(item.starttime),
+                 self._timestamp(item.start_millis),
                  item.elapsedtime)
         msg = getattr(item, 'message', '')
         if not msg:
@@ -100,7 +113,8 @@ class SuiteBuilder(_Builder):
                     self._get_status(suite),
                     tuple(self._build_suite(s) for s in suite.suites),
                     tuple(self._build_test(t) for t in suite.tests),
-                    tuple(self._build_keyword(k, split=True) for k in kws),
+                    self._context.spill(tuple(self._build_keyword(k, split=True)
+                                              for k in kws)),
                     stats)
 
     def _yield_metadata(self, suite):
@@ -127,7 +141,7 @@ class TestBuilder(_Builder):
                     self._html(test.doc),
                     tuple(self._string(t) for t in test.tags),
                     self._get_status(test),
-                    self._build_keywords(kws, split=True))
+                    self._context.spill(self._build_keywords(kws, split=True)))
 
     def _get_keywords(self, test):
         kws = []
@@ -153,10 +167,12 @@ class KeywordBuilder(_Builder):
 
     def build_keyword(self, kw, split=False):
         self._context.check_expansion(kw)
-        items = kw.body.flatten()
+        # Avoid creating empty bodies. See `robot.result.model.LazyBodyMixin`.
+        body = kw.body if kw.has_body else []
+        items = body.flatten() if body else []
         if kw.has_teardown:
             items.append(kw.teardown)
-        with self._context.prune_input(kw.body):
+        with self._context.prune_input(body):
             return (KEYWORD_TYPES[kw.type],
                     self._string(kw.kwname, attr=True),
                     self._string(kw.libname, attr=True),
@@ -178,7 +194,7 @@ class MessageBuilder(_Builder):
         return self._build(msg)
 
     def _build(self, msg):
-        return (self._timestamp(msg.timestamp),
+        return (self._timestamp(msg.timestamp_millis),
                 LEVELS[msg.level],
                 self._string(msg.html_message, escape=False))
 
@@ -13,6 +13,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from tempfile import TemporaryFile
+
 from robot.htmldata import JsonWriter
 
 
@@ -35,7 +37,7 @@ class JsResultWriter:
 
     def write(self, result, settings):
         self._start_output_block()
-        self._write_suite(result.suite)
+        self._write_suite(result.suite, result.spilled)
         self._write_strings(result.strings)
         self._write_data(result.data)
         self._write_settings_and_end_output_block(settings)
@@ -44,9 +46,14 @@ class JsResultWriter:
         self._write(self._start_block, postfix='', separator=False)
         self._write('%s = {}' % self._output_attr)
 
-    def _write_suite(self, suite):
+    def _write_suite(self, suite, spilled=None):
+        mapping = None
+        if spilled:
+            for line in spilled.lines():
+                self._write(line)
+            mapping = spilled.mapping
         writer = SuiteWriter(self._write_json, self._split_threshold)
-        writer.write(suite, self._output_var(self._suite_key))
+        writer.write(suite, self._output_var(self._suite_key), mapping)
 
     def _write_strings(self, strings):
         variable = self._output_var(self._strings_key)
@@ -76,8 +83,8 @@ class SuiteWriter:
         self._write_json = write_json
         self._split_threshold = split_threshold
 
-    def write(self, suite, variable):
-        mapping = {}
+    def write(self, suite, variable, mapping=None):
+        mapping = dict(mapping or {})
         self._write_parts_over_threshold(suite, mapping)
         self._write_json('%s = ' % variable, suite, mapping=mapping)
 
@@ -97,12 +104,136 @@ class SuiteWriter:
         mapping[data] = part_name
 
 
+class ModelSpiller:
+    """Writes parts of the suite model to a temporary file while it is built.
+
+    Keywords of tests and suites are written to the file right after they
+    have been built and replaced with :class:`PartReference` objects in the
+    model. Keywords are collected to parts containing roughly
+    ``split_threshold`` items, and items of a single keyword structure
+    exceeding that are written as separate parts similarly as with
+    :class:`SuiteWriter`. :attr:`mapping` maps references to the names of
+    the written parts and :meth:`lines` returns the written parts.
+
+    Also models and strings of split logs can be spilled. They are returned
+    as :class:`SpilledJson` objects that :class:`SplitLogWriter` handles.
+    """
+
+    def __init__(self, split_threshold=9500):
+        self._file = TemporaryFile('w+', encoding='UTF-8')
+        self._writer = JsonWriter(self._file)
+        self._split_threshold = split_threshold
+        self._batch = []
+        self._batch_size = 0
+        self._batches = 0
+        self._parts = 0
+        self.mapping = {}
+
+    def spill(self, keywords):
+        """Spills keywords and returns a reference to them."""
+        keywords, size = self._write_parts_over_threshold(keywords)
+        reference = self._reference('window.kParts%d[%d]'
+                                    % (self._batches, len(self._batch)))
+        self._batch.append(keywords)
+        self._batch_size += size
+        if self._batch_size > self._split_threshold:
+            self._write_batch()
+        return reference
+
+    def _write_parts_over_threshold(self, data):
+        if not isinstance(data, tuple):
+            return data, 1
+        items = []
+        size = 1
+        for item in data:
+            item, item_size = self._write_parts_over_threshold(item)
+            items.append(item)
+            size += item_size
+        data = tuple(items)
+        if size > self._split_threshold:
+            return self._write_part(data), 1
+        return data, size
+
+    def _write_part(self, data):
+        name = 'window.kPart%d' % self._parts
+        self._parts += 1
+        self._write(data, name)
+        return self._reference(name)
+
+    def _write_batch(self):
+        self._write(self._batch, 'window.kParts%d' % self._batches)
+        self._batch = []
+        self._batch_size = 0
+        self._batches += 1
+
+    def _write(self, data, name):
+        self._writer.write_json('%s = ' % name, data, postfix='\n',
+                                mapping=self.mapping)
+
+    def _reference(self, name):
+        reference = PartReference()
+        self.mapping[reference] = name
+        return reference
+
+    def spill_json(self, data):
+        """Writes ``data`` as JSON and returns it as :class:`SpilledJson`."""
+        self._file.seek(0, 2)
+        start = self._file.tell()
+        self._writer.write_json('', data, postfix='\n')
+        return SpilledJson(self._file, start)
+
+    def lines(self):
+        """Returns written parts as lines without the trailing ``;``."""
+        if self._batch:
+            self._write_batch()
+        self._file.seek(0)
+        for line in self._file:
+            # Spilled split log data does not start with `window`.
+            if line.startswith('window.'):
+                yield line[:-1]
+
+    def close(self):
+        self._file.close()
+
+
+class PartReference:
+    """Reference to a part of the model written by :class:`ModelSpiller`."""
+    __slots__ = []
+
+
+class SpilledJson:
+    """JSON data written to a temporary file by :class:`ModelSpiller`."""
+    __slots__ = ['_file', '_start']
+
+    def __init__(self, file, start):
+        self._file = file
+        self._start = start
+
+    def read(self):
+        self._file.seek(self._start)
+        return self._file.readline()[:-1]
+
+
 class SplitLogWriter:
 
     def __init__(self, output):
         self._writer = JsonWriter(output)
 
-    def write(self, keywords, strings, index, notify):
-        self._writer.write_json('window.keywords%d = ' % index, keywords)
-        self._writer.write_json('window.strings%d = ' % index, strings)
+    def write(self, keywords, strings, index, notify, shared=None):
+        self._write_json('window.keywords%d = ' % index, keywords)
+        self._write_json('window.strings%d = ' % index, strings)
+        if shared:
+            self._writer.write('window.fileLoading.notify("%s", "%s")'
+                               % (notify, shared))
+        else:
+            self._writer.write('window.fileLoading.notify("%s")' % notify)
+
+    def write_shared_strings(self, strings, notify):
+        self._write_json('window.sharedStrings = ', strings)
         self._writer.write('window.fileLoading.notify("%s")' % notify)
+
+    def _write_json(self, prefix, data):
+        if isinstance(data, SpilledJson):
+            self._writer.write(prefix + data.read())
+        else:
+            self._writer.write_json(prefix, data)
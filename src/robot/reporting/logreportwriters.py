@@ -45,14 +45,24 @@ class LogWriter(_LogReportWriter):
             self._write_split_logs(splitext(path)[0])
 
     def _write_split_logs(self, base):
+        shared = None
+        if self._js_model.shared_strings is not None:
+            path = '%s-strings.js' % base
+            self._write_shared_strings(self._js_model.shared_strings, path)
+            shared = basename(path)
         for index, (keywords, strings) in enumerate(self._js_model.split_results,
                                                     start=1):
-            self._write_split_log(index, keywords, strings, '%s-%d.js' % (base, index))
+            self._write_split_log(index, keywords, strings, '%s-%d.js' % (base, index),
+                                  shared)
 
-    def _write_split_log(self, index, keywords, strings, path):
+    def _write_split_log(self, index, keywords, strings, path, shared=None):
         with file_writer(path, usage=self.usage) as outfile:
             writer = SplitLogWriter(outfile)
-            writer.write(keywords, strings, index, basename(path))
+            writer.write(keywords, strings, index, basename(path), shared)
+
+    def _write_shared_strings(self, strings, path):
+        with file_writer(path, usage=self.usage) as outfile:
+            SplitLogWriter(outfile).write_shared_strings(strings, basename(path))
 
 
 class ReportWriter(_LogReportWriter):
@@ -13,6 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from robot.output.binarylogger import BinaryLogger
 from robot.output.xmllogger import XmlLogger
 
 
@@ -21,12 +22,21 @@ class OutputWriter(XmlLogger):
     def __init__(self, output, rpa=False):
         XmlLogger.__init__(self, output, rpa=rpa, generator='Rebot')
 
-    def start_message(self, msg):
-        self._write_message(msg)
-
     def close(self):
         self._writer.end('robot')
         self._writer.close()
 
     def end_result(self, result):
         self.close()
+
+
+class BinaryOutputWriter(BinaryLogger):
+
+    def __init__(self, output, rpa=False):
+        BinaryLogger.__init__(self, output, rpa=rpa, generator='Rebot')
+
+    def close(self):
+        self._writer.close()
+
+    def end_result(self, result):
+        self.close()
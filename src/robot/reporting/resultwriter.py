@@ -29,6 +29,12 @@ class ResultWriter:
 
     :param sources: Either one :class:`~robot.result.executionresult.Result`
         object, or one or more paths to existing output XML files.
+    :param prune_input: When a ``Result`` object is given, process it using
+        the given settings the same way as results read from output files
+        and allow discarding its contents while results are written to save
+        memory. If the result is needed after that, it is read from the
+        file specified by its ``source`` attribute. Used when results are
+        collected into memory during execution.
 
     By default writes ``report.html`` and ``log.html``, but no output XML
     or xUnit files. Custom file names can be given and results disabled
@@ -39,8 +45,9 @@ class ResultWriter:
         writer.write_results(report='custom.html', log=None, xunit='xunit.xml')
     """
 
-    def __init__(self, *sources):
+    def __init__(self, *sources, prune_input=False):
         self._sources = sources
+        self._prune_input = prune_input
 
     def write_results(self, settings=None, **options):
         """Writes results based on the given ``settings``  or ``options``.
@@ -52,9 +59,11 @@ class ResultWriter:
             are not given.
         """
         settings = settings or RebotSettings(options)
-        results = Results(settings, *self._sources)
+        results = Results(settings, *self._sources, prune_input=self._prune_input)
         if settings.output:
             self._write_output(results.result, settings.output)
+        if settings.binary_output:
+            self._write_binary_output(results.result, settings.binary_output)
         if settings.xunit:
             self._write_xunit(results.result, settings.xunit)
         if settings.log:
@@ -65,11 +74,15 @@ class ResultWriter:
             results.js_result.remove_data_not_needed_in_report()
             self._write_report(results.js_result, settings.report,
                                settings.report_config)
+        results.close()
         return results.return_code
 
     def _write_output(self, result, path):
         self._write('Output', result.save, path)
 
+    def _write_binary_output(self, result, path):
+        self._write('Binary output', lambda path: result.save(path, binary=True), path)
+
     def _write_xunit(self, result, path):
         self._write('XUnit', XUnitWriter(result).write, path)
 
@@ -90,12 +103,17 @@ class ResultWriter:
 
 class Results:
 
-    def __init__(self, settings, *sources):
+    def __init__(self, settings, *sources, prune_input=False):
         self._settings = settings
         self._sources = sources
         if len(sources) == 1 and isinstance(sources[0], Result):
             self._result = sources[0]
             self._prune = False
+            if prune_input:
+                self._process(self._result)
+                if self._result.source:
+                    self._sources = (self._result.source,)
+                    self._prune = True
             self.return_code = self._result.return_code
         else:
             self._result = None
@@ -106,33 +124,56 @@ class Results:
     @property
     def result(self):
         if self._result is None:
-            include_keywords = bool(self._settings.log or self._settings.output)
+            outputs = self._settings.output or self._settings.binary_output
+            include_keywords = bool(self._settings.log or outputs)
             flattened = self._settings.flatten_keywords
+            # Content of passed keywords is not needed if they are removed and
+            # when only the log is created keywords are needed only one test
+            # at a time.
+            lazy_keywords = (any(how.upper() == 'PASSED'
+                                 for how in self._settings.remove_keywords)
+                             or bool(self._settings.log and not outputs))
             self._result = ExecutionResult(include_keywords=include_keywords,
                                            flattened_keywords=flattened,
+                                           lazy_keywords=lazy_keywords,
                                            merge=self._settings.merge,
+                                           recover=self._settings.recover,
+                                           processes=self._settings.processes,
                                            rpa=self._settings.rpa,
                                            *self._sources)
-            if self._settings.rpa is None:
-                self._settings.rpa = self._result.rpa
-            modifier = ModelModifier(self._settings.pre_rebot_modifiers,
-                                     self._settings.process_empty_suite,
-                                     LOGGER)
-            self._result.suite.visit(modifier)
-            self._result.configure(self._settings.status_rc,
-                                   self._settings.suite_config,
-                                   self._settings.statistics_config)
+            self._process(self._result)
             self.return_code = self._result.return_code
         return self._result
 
+    def _process(self, result):
+        if self._settings.rpa is None:
+            self._settings.rpa = result.rpa
+        modifier = ModelModifier(self._settings.pre_rebot_modifiers,
+                                 self._settings.process_empty_suite,
+                                 LOGGER)
+        result.suite.visit(modifier)
+        result.configure(self._settings.status_rc,
+                         self._settings.suite_config,
+                         self._settings.statistics_config)
+
     @property
     def js_result(self):
         if self._js_result is None:
+            # Result is read first so that possible errors do not leave
+            # the builder's temporary spill file open.
+            result = self.result
             builder = JsModelBuilder(log_path=self._settings.log,
                                      split_log=self._settings.split_log,
                                      expand_keywords=self._settings.expand_keywords,
-                                     prune_input_to_save_memory=self._prune)
-            self._js_result = builder.build_from(self.result)
+                                     prune_input_to_save_memory=self._prune,
+                                     spill_keywords=bool(self._settings.log and self._prune),
+                                     compression_level=self._settings.log_compression,
+                                     shared_strings=self._settings.shared_strings)
+            self._js_result = builder.build_from(result)
             if self._prune:
                 self._result = None
         return self._js_result
+
+    def close(self):
+        if self._js_result:
+            self._js_result.close()
@@ -13,7 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from collections import OrderedDict
+from hashlib import blake2b
 
 from robot.utils import compress_text
 
@@ -23,26 +23,84 @@ class StringIndex(int):
 
 
 class StringCache:
+    """Collects strings used by the JS model and gives them indices.
+
+    Long strings are compressed if that makes them shorter. Identical long
+    strings are detected using their hashes already before compressing them,
+    so each distinct string is compressed only once. If ``executor`` is
+    given, long strings are compressed in batches using it and results are
+    collected when the strings are dumped.
+
+    If ``shared`` cache is given, long strings are added to it and this
+    cache only contains references to them in format ``#<index>``. This
+    allows split log files to share long strings.
+    """
     _compress_threshold = 80
     _use_compressed_threshold = 1.1
+    _batch_size = 1000000
+    _max_batches = 8
     _zero_index = StringIndex(0)
 
-    def __init__(self):
-        self._cache = OrderedDict({'*': self._zero_index})
+    def __init__(self, compression_level=9, executor=None, shared=None):
+        self._cache = {'*': self._zero_index}
+        self._strings = ['*']
+        self._compression_level = compression_level
+        self._executor = executor
+        self._shared = shared
+        self._pending = []
+        self._pending_size = 0
+        self._batches = []
 
     def add(self, text):
         if not text:
             return self._zero_index
-        text = self._encode(text)
-        if text not in self._cache:
-            self._cache[text] = StringIndex(len(self._cache))
-        return self._cache[text]
+        raw = self._raw(text)
+        compress = self._compression_level and len(raw) >= self._compress_threshold
+        if self._shared is not None and len(raw) >= self._compress_threshold:
+            raw = '#%d' % self._shared.add(text)
+            compress = False
+        key = self._hash(text) if compress else raw
+        if key not in self._cache:
+            index = self._cache[key] = StringIndex(len(self._strings))
+            if not compress:
+                self._strings.append(raw)
+            elif self._executor:
+                self._strings.append(None)
+                self._add_pending(index, text)
+            else:
+                self._strings.append(self._encode(text))
+        return self._cache[key]
+
+    def _hash(self, text):
+        return blake2b(text.encode('UTF-8'), digest_size=16).digest()
+
+    def _add_pending(self, index, text):
+        self._pending.append((index, text))
+        self._pending_size += len(text)
+        if self._pending_size >= self._batch_size:
+            self._submit_pending()
+
+    def _submit_pending(self):
+        indices, texts = zip(*self._pending)
+        future = self._executor.submit(self._encode_batch, texts)
+        self._batches.append((indices, future))
+        self._pending = []
+        self._pending_size = 0
+        while len(self._batches) > self._max_batches:
+            self._collect(*self._batches.pop(0))
+
+    def _encode_batch(self, texts):
+        return [self._encode(text) for text in texts]
+
+    def _collect(self, indices, future):
+        for index, encoded in zip(indices, future.result()):
+            self._strings[index] = encoded
 
     def _encode(self, text):
         raw = self._raw(text)
-        if raw in self._cache or len(raw) < self._compress_threshold:
+        if len(raw) < self._compress_threshold or not self._compression_level:
             return raw
-        compressed = compress_text(text)
+        compressed = compress_text(text, self._compression_level)
         if len(compressed) * self._use_compressed_threshold < len(raw):
             return compressed
         return raw
@@ -51,4 +109,9 @@ class StringCache:
         return '*'+text
 
     def dump(self):
-        return tuple(self._cache)
+        if self._pending:
+            self._submit_pending()
+        for batch in self._batches:
+            self._collect(*batch)
+        self._batches = []
+        return tuple(self._strings)
@@ -0,0 +1,335 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from io import BytesIO
+
+from robot.utils import is_bytes
+
+from . import binaryformat as bf
+from .flattenkeywordmatcher import (FlattenByNameMatcher, FlattenByTagMatcher,
+                                    FlattenByTypeMatcher)
+from .model import Keyword, TestCase, TestSuite
+from .xmlelementhandlers import ElementHandler
+
+
+class BinaryResultBuilder:
+    """Builds :class:`~.executionresult.Result` objects from binary outputs.
+
+    Accepts same arguments as
+    :class:`~robot.result.resultbuilder.ExecutionResultBuilder` except that
+    ``lazy_keywords`` is ignored. Reading binary outputs is fast enough
+    without it.
+    """
+
+    def __init__(self, source, include_keywords=True, flattened_keywords=None,
+                 lazy_keywords=False, recover=False):
+        self._source = source
+        self._include_keywords = include_keywords
+        self._flattened_keywords = flattened_keywords
+        self._recover = recover
+        self._strings = []
+        self._stack = []
+        self._handlers = {
+            bf.STRING: self._string,
+            bf.ROBOT: self._robot,
+            bf.SUITE: self._suite,
+            bf.SUITE_END: self._suite_end,
+            bf.TEST: self._test,
+            bf.TEST_END: self._test_end,
+            bf.KEYWORD: self._keyword,
+            bf.KEYWORD_END: self._keyword_end,
+            bf.FOR: self._for,
+            bf.FOR_ITERATION: self._for_iteration,
+            bf.WHILE: self._while,
+            bf.WHILE_ITERATION: self._while_iteration,
+            bf.IF: self._if,
+            bf.IF_BRANCH: self._if_branch,
+            bf.TRY: self._try,
+            bf.TRY_BRANCH: self._try_branch,
+            bf.RETURN: self._return,
+            bf.CONTINUE: self._continue,
+            bf.BREAK: self._break,
+            bf.END: self._end,
+            bf.MESSAGE: self._message,
+            bf.ERRORS: self._errors,
+        }
+
+    def build(self, result):
+        self._stack = [result]
+        with self._open(self._source) as file:
+            try:
+                self._read(file)
+            except EOFError:
+                if not (self._recover and len(self._stack) > 1):
+                    raise
+                self._interrupt()
+        result.handle_suite_teardown_failures()
+        if not self._include_keywords:
+            from .resultbuilder import RemoveKeywords
+            result.suite.visit(RemoveKeywords())
+        return result
+
+    def _open(self, source):
+        if is_bytes(source):
+            return BytesIO(source)
+        if hasattr(source, 'read'):
+            return _NotClosing(source)
+        return open(source, 'rb')
+
+    def _read(self, file):
+        handlers = self._handlers
+        chunks = bf.read_chunks(file)
+        if self._flattened_keywords:
+            chunks = _Flattener(self._flattened_keywords).flatten(chunks)
+        for records in chunks:
+            for record in records:
+                handlers[record[0]](record)
+
+    def _interrupt(self):
+        tags = {TestSuite: 'suite', TestCase: 'test', Keyword: 'kw'}
+        while len(self._stack) > 1:
+            item = self._stack.pop()
+            if type(item) in tags:
+                ElementHandler.element_handlers[tags[type(item)]].interrupt(item)
+
+    def _string(self, record):
+        self._strings.append(record[1])
+
+    def _get_string(self, index):
+        return self._strings[index] if index is not None else None
+
+    def _get_strings(self, indices):
+        return tuple([self._get_string(index) for index in indices])
+
+    def _robot(self, record):
+        result = self._stack[-1]
+        result.generated_by_robot = record[1].split()[0].upper() == 'ROBOT'
+        if result.rpa is None:
+            result.rpa = record[3]
+
+    def _suite(self, record):
+        parent = self._stack[-1]
+        name = self._get_string(record[1])
+        source = self._get_string(record[2])
+        if parent is self._stack[0]:
+            suite = parent.suite.config(name=name, source=source, rpa=parent.rpa)
+        else:
+            suite = parent.suites.create(name=name, source=source, rpa=parent.rpa)
+        self._stack.append(suite)
+
+    def _suite_end(self, record):
+        suite = self._stack.pop()
+        _, doc, metadata, _, message, start, end = record
+        suite.doc = doc
+        for name, value in metadata:
+            suite.metadata[name] = value
+        if message:
+            suite.message = message
+        suite.start_millis = start
+        suite.end_millis = end
+
+    def _test(self, record):
+        test = self._stack[-1].tests.create(name=record[1], lineno=record[2])
+        self._stack.append(test)
+
+    def _test_end(self, record):
+        test = self._stack.pop()
+        _, doc, tags, timeout, status, message, start, end = record
+        test.doc = doc
+        test.tags = self._get_strings(tags)
+        test.timeout = timeout
+        self._set_status(test, status, message, start, end)
+
+    def _keyword(self, record):
+        get_string, get_strings = self._get_string, self._get_strings
+        parent = self._stack[-1]
+        _, type, name, library, source, assign, args, tags, doc = record
+        type = get_string(type)
+        attrs = dict(kwname=get_string(name),
+                     libname=get_string(library),
+                     sourcename=get_string(source),
+                     assign=get_strings(assign),
+                     args=get_strings(args),
+                     tags=list(get_strings(tags)),
+                     doc=doc)
+        if type == Keyword.SETUP:
+            kw = parent.setup.config(**attrs)
+        elif type == Keyword.TEARDOWN:
+            kw = parent.teardown.config(**attrs)
+        else:
+            kw = parent.body.create_keyword(type=type, **attrs)
+        self._stack.append(kw)
+
+    def _keyword_end(self, record):
+        kw = self._stack.pop()
+        kw.timeout = record[1]
+        self._set_status(kw, *record[2:])
+
+    def _for(self, record):
+        _, flavor, variables, values, doc = record
+        for_ = self._stack[-1].body.create_for(
+            variables=self._get_strings(variables),
+            flavor=self._get_string(flavor),
+            values=self._get_strings(values),
+            doc=doc
+        )
+        self._stack.append(for_)
+
+    def _for_iteration(self, record):
+        iteration = self._stack[-1].body.create_iteration(doc=record[2])
+        for name, value in record[1]:
+            iteration.variables[self._get_string(name)] = value
+        self._stack.append(iteration)
+
+    def _while(self, record):
+        while_ = self._stack[-1].body.create_while(condition=record[1], doc=record[2])
+        self._stack.append(while_)
+
+    def _while_iteration(self, record):
+        self._stack.append(self._stack[-1].body.create_iteration(doc=record[1]))
+
+    def _if(self, record):
+        self._stack.append(self._stack[-1].body.create_if(doc=record[1]))
+
+    def _if_branch(self, record):
+        branch = self._stack[-1].body.create_branch(type=self._get_string(record[1]),
+                                                    condition=record[2], doc=record[3])
+        self._stack.append(branch)
+
+    def _try(self, record):
+        self._stack.append(self._stack[-1].body.create_try(doc=record[1]))
+
+    def _try_branch(self, record):
+        branch = self._stack[-1].body.create_branch(
+            type=self._get_string(record[1]),
+            patterns=self._get_strings(record[2]),
+            variable=record[3]
+        )
+        self._stack.append(branch)
+
+    def _return(self, record):
+        return_ = self._stack[-1].body.create_return(
+            values=self._get_strings(record[1])
+        )
+        self._stack.append(return_)
+
+    def _continue(self, record):
+        self._stack.append(self._stack[-1].body.create_continue())
+
+    def _break(self, record):
+        self._stack.append(self._stack[-1].body.create_break())
+
+    def _end(self, record):
+        self._set_status(self._stack.pop(), *record[1:])
+
+    def _set_status(self, item, status, message, start, end):
+        item.status = self._get_string(status)
+        if message:
+            item.message = message
+        item.start_millis = start
+        item.end_millis = end
+
+    def _message(self, record):
+        _, message, level, html, timestamp = record
+        msg = self._stack[-1].body.create_message(message, self._get_string(level),
+                                                  html)
+        msg.timestamp_millis = timestamp
+
+    def _errors(self, record):
+        self._stack.append(self._stack[0].errors)
+        self._handlers[bf.MESSAGE] = self._error_message
+
+    def _error_message(self, record):
+        _, message, level, html, timestamp = record
+        msg = self._stack[-1].messages.create(message, self._get_string(level),
+                                              html)
+        msg.timestamp_millis = timestamp
+
+
+class _NotClosing:
+
+    def __init__(self, file):
+        self._file = file
+
+    def __enter__(self):
+        return self._file
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+class _Flattener:
+    """Flattens keywords while records are read.
+
+    Works like flattening XML outputs: Content of matching keywords and
+    control structures is removed except for messages, which are moved to
+    the flattened item, and a note is added to their documentation.
+    """
+    _starts = {bf.SUITE, bf.TEST, bf.KEYWORD, bf.FOR, bf.FOR_ITERATION, bf.WHILE,
+               bf.WHILE_ITERATION, bf.IF, bf.IF_BRANCH, bf.TRY, bf.TRY_BRANCH,
+               bf.RETURN, bf.CONTINUE, bf.BREAK}
+    _ends = {bf.SUITE_END, bf.TEST_END, bf.KEYWORD_END, bf.END}
+    _containers = {bf.KEYWORD: 'kw', bf.FOR: 'for', bf.WHILE: 'while',
+                   bf.FOR_ITERATION: 'iter', bf.WHILE_ITERATION: 'iter',
+                   bf.IF: 'if', bf.TRY: 'try'}
+    _doc_index = {bf.KEYWORD: 8, bf.FOR: 4, bf.WHILE: 2, bf.FOR_ITERATION: 2,
+                  bf.WHILE_ITERATION: 1, bf.IF: 1, bf.TRY: 1}
+    _note = '_*Keyword content flattened.*_'
+
+    def __init__(self, flattened):
+        self._by_name = FlattenByNameMatcher(flattened)
+        self._by_type = FlattenByTypeMatcher(flattened)
+        self._by_tags = FlattenByTagMatcher(flattened)
+        # Strings are needed for matching before the builder gets them.
+        self._strings = []
+
+    def flatten(self, chunks):
+        depth = 0    # larger than zero if flattening
+        for records in chunks:
+            result = []
+            for record in records:
+                kind = record[0]
+                if kind == bf.STRING:
+                    self._strings.append(record[1])
+                if depth:
+                    if kind in self._starts:
+                        depth += 1
+                    elif kind in self._ends:
+                        depth -= 1
+                        if not depth:
+                            result.append(record)
+                    elif kind in (bf.STRING, bf.MESSAGE):
+                        result.append(record)
+                    continue
+                if kind in self._containers and self._matches(record):
+                    depth = 1
+                    record = list(record)
+                    index = self._doc_index[kind]
+                    record[index] = f'{record[index]}\n\n{self._note}'.strip()
+                result.append(record)
+            yield result
+
+    def _matches(self, record):
+        kind = record[0]
+        strings = self._strings
+        if kind == bf.KEYWORD:
+            name = strings[record[2]] if record[2] is not None else ''
+            library = strings[record[3]] if record[3] is not None else None
+            tags = [strings[t] for t in record[7] if t is not None]
+        else:
+            name, library, tags = '', None, []
+        return ((self._by_name and self._by_name.match(name, library))
+                or (self._by_type and self._by_type.match(self._containers[kind]))
+                or (self._by_tags and tags and self._by_tags.match(tags)))
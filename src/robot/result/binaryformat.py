@@ -0,0 +1,182 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Binary output format.
+
+A binary output file starts with :data:`MAGIC` and is followed by chunks.
+Each chunk has a four byte little-endian length and UTF-8 encoded JSON
+array of records. Records are arrays where the first item is the record
+type and the rest are record specific fields. Every started suite, test,
+keyword and control structure has a matching end record, which makes
+the format streamable and chunks self-delimiting.
+
+Short strings that are likely to be repeated, such as keyword names,
+arguments, statuses and tags, are interned. The first time such a string is
+written, a :data:`STRING` record is written before the record using it and
+later records refer to the string by its index. Longer strings such as
+messages and documentation are written as-is. Timestamps are integers
+representing milliseconds since the epoch.
+
+This module is considered internal. Binary outputs are created with
+the ``--binaryoutput`` option and read by
+:func:`~robot.result.resultbuilder.ExecutionResult` like XML outputs.
+"""
+
+import json
+import os
+import struct
+
+from robot.errors import DataError
+from robot.utils import (create_destination_directory, get_error_message,
+                         is_bytes, is_pathlike, is_string)
+
+
+MAGIC = b'RFBIN\x01'
+
+# Record types and their fields. Fields marked with `*` are interned.
+STRING = 0             # text
+ROBOT = 1              # generator, generated, rpa
+SUITE = 2              # name*, source*
+SUITE_END = 3          # doc, metadata, status*, message, start, end
+TEST = 4               # name, lineno
+TEST_END = 5           # doc, tags*, timeout, status*, message, start, end
+KEYWORD = 6            # type*, kwname*, libname*, sourcename*, assign*,
+                       # args*, tags*, doc
+KEYWORD_END = 7        # timeout, status*, message, start, end
+FOR = 8                # flavor*, variables*, values*, doc
+FOR_ITERATION = 9      # variables (name*, value pairs), doc
+WHILE = 10             # condition, doc
+WHILE_ITERATION = 11   # doc
+IF = 12                # doc
+IF_BRANCH = 13         # type*, condition, doc
+TRY = 14               # doc
+TRY_BRANCH = 15        # type*, patterns*, variable
+RETURN = 16            # values*
+CONTINUE = 17
+BREAK = 18
+END = 19               # status*, message, start, end
+MESSAGE = 20           # message, level*, html, timestamp
+ERRORS = 21
+
+_LENGTH = struct.Struct('<I')
+
+
+def is_binary_output(source):
+    """Returns ``True`` if the source is a binary output file or data."""
+    if is_bytes(source):
+        return source[:len(MAGIC)] == MAGIC
+    if is_string(source) or is_pathlike(source):
+        try:
+            with open(source, 'rb') as file:
+                return file.read(len(MAGIC)) == MAGIC
+        except OSError:
+            return False
+    return False
+
+
+class RecordWriter:
+    """Writes records into a binary output file in chunks.
+
+    :param output: Path to the output file or an already opened binary file.
+    """
+    # Long strings are written once per use even if they are passed to
+    # `string()` to avoid remembering them all.
+    max_interned = 80
+    # Records can be split to chunks freely. Chunks are written when they
+    # have this many records to limit memory usage.
+    chunk_size = 10000
+
+    def __init__(self, output):
+        self._output = self._open(output)
+        self._output.write(MAGIC)
+        self._records = []
+        self._strings = {}
+        self._count = 0
+
+    def _open(self, output):
+        if not (is_string(output) or is_pathlike(output)):
+            return output
+        output = str(output)
+        create_destination_directory(output, 'binary output file')
+        try:
+            return open(output, 'wb', buffering=1024 * 1024)
+        except OSError:
+            raise DataError(f"Opening binary output file '{output}' failed: "
+                            f"{get_error_message()}")
+
+    def string(self, text):
+        """Writes the string if it is not yet written and returns its index."""
+        if text is None:
+            return None
+        index = self._strings.get(text)
+        if index is None:
+            index = self._count
+            self._count += 1
+            self._records.append((STRING, text))
+            if len(text) <= self.max_interned:
+                self._strings[text] = index
+        return index
+
+    def strings(self, texts):
+        return [self.string(text) for text in texts]
+
+    def write(self, *record):
+        self._records.append(record)
+        if len(self._records) >= self.chunk_size:
+            self._write_chunk()
+
+    def _write_chunk(self):
+        data = json.dumps(self._records, ensure_ascii=False,
+                          check_circular=False, separators=(',', ':'))
+        data = data.encode('UTF-8')
+        self._output.write(_LENGTH.pack(len(data)))
+        self._output.write(data)
+        self._records = []
+
+    def flush(self, sync=False):
+        """Writes buffered records as a chunk and flushes the file.
+
+        If ``sync`` is true, the file is also synced to the disk.
+        """
+        if self._records:
+            self._write_chunk()
+        self._output.flush()
+        if sync:
+            os.fsync(self._output.fileno())
+
+    def close(self):
+        self.flush()
+        self._output.close()
+
+
+def read_chunks(file):
+    """Yields records of the binary output in the given file chunk by chunk.
+
+    Raises :class:`EOFError` if the data is truncated.
+    """
+    if file.read(len(MAGIC)) != MAGIC:
+        raise ValueError('Not a binary output file.')
+    read = file.read
+    while True:
+        header = read(4)
+        if not header:
+            return
+        if len(header) < 4:
+            raise EOFError('Binary output is truncated.')
+        length = _LENGTH.unpack(header)[0]
+        data = read(length)
+        if len(data) < length:
+            raise EOFError('Binary output is truncated.')
+        yield json.loads(data)
@@ -16,14 +16,18 @@
 from robot import model
 from robot.utils import is_string, secs_to_timestamp, timestamp_to_secs
 
+from .keywordremover import KeywordRemover
+from .messagefilter import MessageFilter
+
 
 class SuiteConfigurer(model.SuiteConfigurer):
     """Result suite configured.
 
-    Calls suite's
+    Removes keywords and filters messages like suite's
     :meth:`~robot.result.testsuite.TestSuite.remove_keywords` and
-    :meth:`~robot.result.testsuite.TestSuite.filter_messages` methods
-    and sets its start and end time based on the given named parameters.
+    :meth:`~robot.result.testsuite.TestSuite.filter_messages` methods,
+    but using one :class:`~robot.model.visitor.CompositeVisitor`, and sets
+    its start and end time based on the given named parameters.
 
     ``base_config`` is forwarded to
     :class:`robot.model.SuiteConfigurer <robot.model.configurer.SuiteConfigurer>`
@@ -56,13 +60,15 @@ class SuiteConfigurer(model.SuiteConfigurer):
 
     def visit_suite(self, suite):
         model.SuiteConfigurer.visit_suite(self, suite)
-        self._remove_keywords(suite)
+        self._remove_keywords_and_filter_messages(suite)
         self._set_times(suite)
-        suite.filter_messages(self.log_level)
 
-    def _remove_keywords(self, suite):
-        for how in self.remove_keywords:
-            suite.remove_keywords(how)
+    def _remove_keywords_and_filter_messages(self, suite):
+        # Keywords are removed and messages filtered using one traversal
+        # to avoid walking through all keywords multiple times.
+        visitors = [KeywordRemover(how) for how in self.remove_keywords]
+        visitors.append(MessageFilter(self.log_level))
+        suite.visit(model.CompositeVisitor(*visitors))
 
     def _set_times(self, suite):
         if self.start_time:
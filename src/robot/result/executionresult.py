@@ -96,14 +96,17 @@ class Result:
         self._status_rc = status_rc
         self._stat_config = stat_config or {}
 
-    def save(self, path=None):
+    def save(self, path=None, binary=False):
         """Save results as a new output XML file.
 
         :param path: Path to save results to. If omitted, overwrites the
             original file.
+        :param binary: When ``True``, results are saved in the
+            :mod:`binary format <robot.result.binaryformat>` instead of XML.
         """
-        from robot.reporting.outputwriter import OutputWriter
-        self.visit(OutputWriter(path or self.source, rpa=self.rpa))
+        from robot.reporting.outputwriter import BinaryOutputWriter, OutputWriter
+        writer = BinaryOutputWriter if binary else OutputWriter
+        self.visit(writer(path or self.source, rpa=self.rpa))
 
     def visit(self, visitor):
         """An entry point to visit the whole result object.
@@ -42,7 +42,8 @@ class _KeywordRemover(SuiteVisitor):
         self._removal_message = RemovalMessage(self._message)
 
     def _clear_content(self, item):
-        item.body.clear()
+        if item.has_body:
+            item.body.clear()
         self._removal_message.set(item)
 
     def _failed_or_warning_or_error(self, item):
@@ -75,9 +76,14 @@ class PassedKeywordRemover(_KeywordRemover):
                     self._clear_content(keyword)
 
     def visit_test(self, test):
-        if not self._failed_or_warning_or_error(test):
-            for keyword in test.body:
-                self._clear_content(keyword)
+        lazy = test._lazy_keywords
+        if lazy and test.passed and not lazy.has_warnings:
+            # Content of the cleared keywords is not built at all.
+            lazy.load(test, shallow=True)
+        elif self._failed_or_warning_or_error(test):
+            return
+        for keyword in test.body:
+            self._clear_content(keyword)
 
     def visit_keyword(self, keyword):
         pass
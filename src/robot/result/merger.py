@@ -24,6 +24,7 @@ class Merger(SuiteVisitor):
         self.result = result
         self.current = None
         self.rpa = rpa
+        self._indices = {}
 
     def merge(self, merged):
         self.result.set_execution_mode(merged)
@@ -34,7 +35,7 @@ class Merger(SuiteVisitor):
         if self.current is None:
             old = self._find_root(suite.name)
         else:
-            old = self._find(self.current.suites, suite.name)
+            old = self._index(self.current).suites.get(suite.name)
         if old is not None:
             old.starttime = old.endtime = None
             old.setup = suite.setup
@@ -43,6 +44,7 @@ class Merger(SuiteVisitor):
         else:
             suite.message = self._create_add_message(suite, suite=True)
             self.current.suites.append(suite)
+            self._index(self.current).suites.setdefault(suite.name, suite)
         return bool(old)
 
     def _find_root(self, name):
@@ -53,25 +55,31 @@ class Merger(SuiteVisitor):
                             % (root.name, name))
         return root
 
-    def _find(self, items, name):
-        for item in items:
-            if item.name == name:
-                return item
-        return None
+    def _index(self, suite):
+        # Indices are kept over merges because same suites are visited again
+        # with every merged output. Suites are never removed from the result,
+        # so their ids stay valid.
+        key = id(suite)
+        if key not in self._indices:
+            self._indices[key] = _SuiteIndex(suite)
+        return self._indices[key]
 
     def end_suite(self, suite):
         self.current = self.current.parent
 
     def visit_test(self, test):
-        old = self._find(self.current.tests, test.name)
-        if old is None:
+        tests = self._index(self.current).tests
+        index = tests.get(test.name)
+        if index is None:
             test.message = self._create_add_message(test)
             self.current.tests.append(test)
+            tests[test.name] = len(self.current.tests) - 1
         elif test.skipped:
+            old = self.current.tests[index]
             old.message = self._create_skip_message(old, test)
         else:
+            old = self.current.tests[index]
             test.message = self._create_merge_message(test, old)
-            index = self.current.tests.index(old)
             self.current.tests[index] = test
 
     def _create_add_message(self, item, suite=False):
@@ -132,3 +140,18 @@ class Merger(SuiteVisitor):
         if not test.message:
             return msg
         return '%s<hr>Original message:\n%s' % (msg, self._html(test.message))
+
+
+class _SuiteIndex:
+    """Child suites by their names and indices of tests by their names.
+
+    If there are multiple items with the same name, the first one is used.
+    """
+
+    def __init__(self, suite):
+        self.suites = {}
+        for child in suite.suites:
+            self.suites.setdefault(child.name, child)
+        self.tests = {}
+        for index, test in enumerate(suite.tests):
+            self.tests.setdefault(test.name, index)
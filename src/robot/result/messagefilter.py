@@ -28,6 +28,8 @@ class MessageFilter(SuiteVisitor):
             return False
 
     def start_keyword(self, keyword):
+        if not keyword.has_body:
+            return
         for item in list(keyword.body):
             if item.type == item.MESSAGE and not self.is_logged(item.level):
                 keyword.body.remove(item)
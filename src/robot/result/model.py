@@ -38,7 +38,7 @@ import warnings
 
 from robot import model
 from robot.model import BodyItem, Keywords, TotalStatisticsBuilder
-from robot.utils import get_elapsed_time, setter
+from robot.utils import millis_to_timestamp, setter, timestamp_to_millis
 
 from .configurer import SuiteConfigurer
 from .messagefilter import MessageFilter
@@ -81,10 +81,41 @@ class StatusMixin:
     NOT_RUN = 'NOT RUN'
     NOT_SET = 'NOT SET'
 
+    @property
+    def starttime(self):
+        """Execution start time in format ``%Y%m%d %H:%M:%S.%f``.
+
+        Start time is stored as milliseconds after the epoch in
+        :attr:`start_millis` and converted to a timestamp when accessed.
+        """
+        if self.start_millis is None:
+            return None
+        return millis_to_timestamp(self.start_millis)
+
+    @starttime.setter
+    def starttime(self, starttime):
+        self.start_millis = timestamp_to_millis(starttime) if starttime else None
+
+    @property
+    def endtime(self):
+        """Execution end time in format ``%Y%m%d %H:%M:%S.%f``.
+
+        See :attr:`starttime` for more information.
+        """
+        if self.end_millis is None:
+            return None
+        return millis_to_timestamp(self.end_millis)
+
+    @endtime.setter
+    def endtime(self, endtime):
+        self.end_millis = timestamp_to_millis(endtime) if endtime else None
+
     @property
     def elapsedtime(self):
         """Total execution time in milliseconds."""
-        return get_elapsed_time(self.starttime, self.endtime)
+        if self.start_millis is None or self.end_millis is None:
+            return 0
+        return self.end_millis - self.start_millis
 
     @property
     def passed(self):
@@ -133,12 +164,44 @@ class StatusMixin:
         self.status = self.NOT_RUN
 
 
-class ForIteration(BodyItem, StatusMixin, DeprecatedAttributesMixin):
+class LazyBodyMixin:
+    """Creates the body of an item only when it is needed.
+
+    Most keywords and many control structure items have no children. Not
+    creating empty :class:`Body` objects for them considerably reduces
+    memory usage with large results. Use :attr:`has_body` to check does
+    an item have children without creating the body.
+
+    Classes using this mixin must have ``_body`` in their ``__slots__``.
+    """
+    __slots__ = []
+
+    @property
+    def body(self):
+        """Child keywords and messages as a :class:`~.Body` object.
+
+        The body is created when it is accessed the first time.
+        """
+        if self._body is None:
+            self._body = self.body_class(self)
+        return self._body
+
+    @body.setter
+    def body(self, body):
+        self._body = self.body_class(self, body) if body else None
+
+    @property
+    def has_body(self):
+        """``True`` if the item has children. Does not create the body."""
+        return bool(self._body)
+
+
+class ForIteration(LazyBodyMixin, BodyItem, StatusMixin, DeprecatedAttributesMixin):
     """Represents one FOR loop iteration."""
     type = BodyItem.ITERATION
     body_class = Body
     repr_args = ('variables',)
-    __slots__ = ['variables', 'status', 'starttime', 'endtime', 'doc']
+    __slots__ = ['variables', 'status', 'start_millis', 'end_millis', 'doc', '_body']
 
     def __init__(self, variables=None, status='FAIL', starttime=None, endtime=None,
                  doc='', parent=None):
@@ -150,10 +213,6 @@ class ForIteration(BodyItem, StatusMixin, DeprecatedAttributesMixin):
         self.doc = doc
         self.body = None
 
-    @setter
-    def body(self, body):
-        return self.body_class(self, body)
-
     def visit(self, visitor):
         visitor.visit_for_iteration(self)
 
@@ -167,7 +226,7 @@ class ForIteration(BodyItem, StatusMixin, DeprecatedAttributesMixin):
 class For(model.For, StatusMixin, DeprecatedAttributesMixin):
     iterations_class = Iterations
     iteration_class = ForIteration
-    __slots__ = ['status', 'starttime', 'endtime', 'doc']
+    __slots__ = ['status', 'start_millis', 'end_millis', 'doc']
 
     def __init__(self, variables=(),  flavor='IN', values=(), status='FAIL',
                  starttime=None, endtime=None, doc='', parent=None):
@@ -188,11 +247,11 @@ class For(model.For, StatusMixin, DeprecatedAttributesMixin):
                                  ' | '.join(self.values))
 
 
-class WhileIteration(BodyItem, StatusMixin, DeprecatedAttributesMixin):
+class WhileIteration(LazyBodyMixin, BodyItem, StatusMixin, DeprecatedAttributesMixin):
     """Represents one WHILE loop iteration."""
     type = BodyItem.ITERATION
     body_class = Body
-    __slots__ = ['status', 'starttime', 'endtime', 'doc']
+    __slots__ = ['status', 'start_millis', 'end_millis', 'doc', '_body']
 
     def __init__(self, status='FAIL', starttime=None, endtime=None,
                  doc='', parent=None):
@@ -203,10 +262,6 @@ class WhileIteration(BodyItem, StatusMixin, DeprecatedAttributesMixin):
         self.doc = doc
         self.body = None
 
-    @setter
-    def body(self, body):
-        return self.body_class(self, body)
-
     def visit(self, visitor):
         visitor.visit_while_iteration(self)
 
@@ -220,7 +275,7 @@ class WhileIteration(BodyItem, StatusMixin, DeprecatedAttributesMixin):
 class While(model.While, StatusMixin, DeprecatedAttributesMixin):
     iterations_class = Iterations
     iteration_class = WhileIteration
-    __slots__ = ['status', 'starttime', 'endtime', 'doc']
+    __slots__ = ['status', 'start_millis', 'end_millis', 'doc']
 
     def __init__(self, condition=None, parent=None, status='FAIL', starttime=None, endtime=None, doc=''):
         super().__init__(condition, parent)
@@ -241,7 +296,7 @@ class While(model.While, StatusMixin, DeprecatedAttributesMixin):
 
 class IfBranch(model.IfBranch, StatusMixin, DeprecatedAttributesMixin):
     body_class = Body
-    __slots__ = ['status', 'starttime', 'endtime', 'doc']
+    __slots__ = ['status', 'start_millis', 'end_millis', 'doc']
 
     def __init__(self, type=BodyItem.IF, condition=None, status='FAIL',
                  starttime=None, endtime=None, doc='', parent=None):
@@ -261,7 +316,7 @@ class IfBranch(model.IfBranch, StatusMixin, DeprecatedAttributesMixin):
 class If(model.If, StatusMixin, DeprecatedAttributesMixin):
     branch_class = IfBranch
     branches_class = Branches
-    __slots__ = ['status', 'starttime', 'endtime', 'doc']
+    __slots__ = ['status', 'start_millis', 'end_millis', 'doc']
 
     def __init__(self, status='FAIL', starttime=None, endtime=None, doc='', parent=None):
         super().__init__(parent)
@@ -273,7 +328,7 @@ class If(model.If, StatusMixin, DeprecatedAttributesMixin):
 
 class TryBranch(model.TryBranch, StatusMixin, DeprecatedAttributesMixin):
     body_class = Body
-    __slots__ = ['status', 'starttime', 'endtime', 'doc']
+    __slots__ = ['status', 'start_millis', 'end_millis', 'doc']
 
     def __init__(self, type=BodyItem.TRY, patterns=(), variable=None, status='FAIL',
                  starttime=None, endtime=None, doc='', parent=None):
@@ -296,7 +351,7 @@ class TryBranch(model.TryBranch, StatusMixin, DeprecatedAttributesMixin):
 class Try(model.Try, StatusMixin, DeprecatedAttributesMixin):
     branch_class = TryBranch
     branches_class = Branches
-    __slots__ = ['status', 'starttime', 'endtime', 'doc']
+    __slots__ = ['status', 'start_millis', 'end_millis', 'doc']
 
     def __init__(self, status='FAIL', starttime=None, endtime=None, doc='', parent=None):
         super().__init__(parent)
@@ -307,8 +362,14 @@ class Try(model.Try, StatusMixin, DeprecatedAttributesMixin):
 
 
 @Body.register
-class Return(model.Return, StatusMixin, DeprecatedAttributesMixin):
-    __slots__ = ['status', 'starttime', 'endtime']
+class Return(LazyBodyMixin, model.Return, StatusMixin, DeprecatedAttributesMixin):
+    """Represents results of RETURN.
+
+    :attr:`body` is typically empty. It only contains something if running
+    RETURN has failed due to a syntax error or listeners have logged
+    messages or executed keywords.
+    """
+    __slots__ = ['status', 'start_millis', 'end_millis', '_body']
     body_class = Body
 
     def __init__(self, values=(), status='FAIL', starttime=None, endtime=None, parent=None):
@@ -318,16 +379,6 @@ class Return(model.Return, StatusMixin, DeprecatedAttributesMixin):
         self.endtime = endtime
         self.body = None
 
-    @setter
-    def body(self, body):
-        """Child keywords and messages as a :class:`~.Body` object.
-
-        Typically empty. Only contains something if running RETURN has failed
-        due to a syntax error or listeners have logged messages or executed
-        keywords.
-        """
-        return self.body_class(self, body)
-
     @property
     @deprecated
     def args(self):
@@ -340,8 +391,14 @@ class Return(model.Return, StatusMixin, DeprecatedAttributesMixin):
 
 
 @Body.register
-class Continue(model.Continue, StatusMixin, DeprecatedAttributesMixin):
-    __slots__ = ['status', 'starttime', 'endtime']
+class Continue(LazyBodyMixin, model.Continue, StatusMixin, DeprecatedAttributesMixin):
+    """Represents results of CONTINUE.
+
+    :attr:`body` is typically empty. It only contains something if running
+    CONTINUE has failed due to a syntax error or listeners have logged
+    messages or executed keywords.
+    """
+    __slots__ = ['status', 'start_millis', 'end_millis', '_body']
     body_class = Body
 
     def __init__(self, status='FAIL', starttime=None, endtime=None, parent=None):
@@ -351,16 +408,6 @@ class Continue(model.Continue, StatusMixin, DeprecatedAttributesMixin):
         self.endtime = endtime
         self.body = None
 
-    @setter
-    def body(self, body):
-        """Child keywords and messages as a :class:`~.Body` object.
-
-        Typically empty. Only contains something if running CONTINUE has failed
-        due to a syntax error or listeners have logged messages or executed
-        keywords.
-        """
-        return self.body_class(self, body)
-
     @property
     @deprecated
     def args(self):
@@ -373,8 +420,14 @@ class Continue(model.Continue, StatusMixin, DeprecatedAttributesMixin):
 
 
 @Body.register
-class Break(model.Break, StatusMixin, DeprecatedAttributesMixin):
-    __slots__ = ['status', 'starttime', 'endtime']
+class Break(LazyBodyMixin, model.Break, StatusMixin, DeprecatedAttributesMixin):
+    """Represents results of BREAK.
+
+    :attr:`body` is typically empty. It only contains something if running
+    BREAK has failed due to a syntax error or listeners have logged
+    messages or executed keywords.
+    """
+    __slots__ = ['status', 'start_millis', 'end_millis', '_body']
     body_class = Body
 
     def __init__(self, status='FAIL', starttime=None, endtime=None, parent=None):
@@ -384,16 +437,6 @@ class Break(model.Break, StatusMixin, DeprecatedAttributesMixin):
         self.endtime = endtime
         self.body = None
 
-    @setter
-    def body(self, body):
-        """Child keywords and messages as a :class:`~.Body` object.
-
-        Typically empty. Only contains something if running BREAK has failed
-        due to a syntax error or listeners have logged messages or executed
-        keywords.
-        """
-        return self.body_class(self, body)
-
     @property
     @deprecated
     def args(self):
@@ -408,14 +451,14 @@ class Break(model.Break, StatusMixin, DeprecatedAttributesMixin):
 @Body.register
 @Branches.register
 @Iterations.register
-class Keyword(model.Keyword, StatusMixin):
+class Keyword(LazyBodyMixin, model.Keyword, StatusMixin):
     """Represents results of a single keyword.
 
     See the base class for documentation of attributes not documented here.
     """
     body_class = Body
-    __slots__ = ['kwname', 'libname', 'status', 'starttime', 'endtime', 'message',
-                 'sourcename']
+    __slots__ = ['kwname', 'libname', 'status', 'start_millis', 'end_millis', 'message',
+                 'sourcename', '_body']
 
     def __init__(self, kwname='', libname='', doc='', args=(), assign=(), tags=(),
                  timeout=None, type=BodyItem.KEYWORD, status='FAIL', starttime=None,
@@ -427,9 +470,7 @@ class Keyword(model.Keyword, StatusMixin):
         self.libname = libname
         #: Execution status as a string. ``PASS``, ``FAIL``, ``SKIP`` or ``NOT RUN``.
         self.status = status
-        #: Keyword execution start time in format ``%Y%m%d %H:%M:%S.%f``.
         self.starttime = starttime
-        #: Keyword execution end time in format ``%Y%m%d %H:%M:%S.%f``.
         self.endtime = endtime
         #: Keyword status message. Used only if suite teardowns fails.
         self.message = ''
@@ -437,11 +478,6 @@ class Keyword(model.Keyword, StatusMixin):
         self.sourcename = sourcename
         self.body = None
 
-    @setter
-    def body(self, body):
-        """Child keywords and messages as a :class:`~.Body` object."""
-        return self.body_class(self, body)
-
     @property
     def keywords(self):
         """Deprecated since Robot Framework 4.0.
@@ -504,22 +540,22 @@ class TestCase(model.TestCase, StatusMixin):
 
     See the base class for documentation of attributes not documented here.
     """
-    __slots__ = ['status', 'message', 'starttime', 'endtime']
+    __slots__ = ['status', 'message', 'start_millis', 'end_millis', '_lazy_keywords']
     body_class = Body
     fixture_class = Keyword
 
     def __init__(self, name='', doc='', tags=None, timeout=None, lineno=None,
                  status='FAIL', message='', starttime=None, endtime=None,
                  parent=None):
+        # Set by `ExecutionResultBuilder` when keywords are loaded lazily.
+        self._lazy_keywords = None
         super().__init__(name, doc, tags, timeout, lineno, parent)
         #: Status as a string ``PASS`` or ``FAIL``. See also :attr:`passed`.
         self.status = status
         #: Test message. Typically a failure message but can be set also when
         #: test passes.
         self.message = message
-        #: Test case execution start time in format ``%Y%m%d %H:%M:%S.%f``.
         self.starttime = starttime
-        #: Test case execution end time in format ``%Y%m%d %H:%M:%S.%f``.
         self.endtime = endtime
 
     @property
@@ -531,13 +567,66 @@ class TestCase(model.TestCase, StatusMixin):
         warnings.warn("'TestCase.critical' is deprecated and always returns 'True'.")
         return True
 
+    @property
+    def body(self):
+        """Test body as a :class:`~robot.result.Body` object."""
+        self._load_keywords()
+        return self._setter__body
+
+    @body.setter
+    def body(self, body):
+        self._load_keywords()
+        model.TestCase.body.__set__(self, body)
+
+    @property
+    def setup(self):
+        """Test setup as a :class:`~robot.result.Keyword` object.
+
+        See :attr:`robot.model.TestCase.setup` for more information.
+        """
+        self._load_keywords()
+        return super().setup
+
+    @setup.setter
+    def setup(self, setup):
+        self._load_keywords()
+        model.TestCase.setup.fset(self, setup)
+
+    @property
+    def has_setup(self):
+        self._load_keywords()
+        return super().has_setup
+
+    @property
+    def teardown(self):
+        """Test teardown as a :class:`~robot.result.Keyword` object.
+
+        See :attr:`robot.model.TestCase.setup` for more information.
+        """
+        self._load_keywords()
+        return super().teardown
+
+    @teardown.setter
+    def teardown(self, teardown):
+        self._load_keywords()
+        model.TestCase.teardown.fset(self, teardown)
+
+    @property
+    def has_teardown(self):
+        self._load_keywords()
+        return super().has_teardown
+
+    def _load_keywords(self):
+        if self._lazy_keywords:
+            self._lazy_keywords.load(self)
+
 
 class TestSuite(model.TestSuite, StatusMixin):
     """Represents results of a single test suite.
 
     See the base class for documentation of attributes not documented here.
     """
-    __slots__ = ['message', 'starttime', 'endtime']
+    __slots__ = ['message', 'start_millis', 'end_millis']
     test_class = TestCase
     fixture_class = Keyword
 
@@ -546,9 +635,7 @@ class TestSuite(model.TestSuite, StatusMixin):
         super().__init__(name, doc, metadata, source, rpa, parent)
         #: Possible suite setup or teardown error message.
         self.message = message
-        #: Suite execution start time in format ``%Y%m%d %H:%M:%S.%f``.
         self.starttime = starttime
-        #: Suite execution end time in format ``%Y%m%d %H:%M:%S.%f``.
         self.endtime = endtime
 
     @property
@@ -615,8 +702,8 @@ class TestSuite(model.TestSuite, StatusMixin):
     @property
     def elapsedtime(self):
         """Total execution time in milliseconds."""
-        if self.starttime and self.endtime:
-            return get_elapsed_time(self.starttime, self.endtime)
+        if self.start_millis is not None and self.end_millis is not None:
+            return self.end_millis - self.start_millis
         return sum(child.elapsedtime for child in
                    chain(self.suites, self.tests, (self.setup, self.teardown)))
 
@@ -13,15 +13,26 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from multiprocessing import get_context
+
 from robot.errors import DataError
 from robot.model import SuiteVisitor
-from robot.utils import ET, ETSource, get_error_message
+from robot.utils import ET, ETSource, get_error_message, is_bytes, is_pathlike, is_string
 
+from .binarybuilder import BinaryResultBuilder
+from .binaryformat import is_binary_output
+from .executionerrors import ExecutionErrors
 from .executionresult import Result, CombinedResult
 from .flattenkeywordmatcher import (FlattenByNameMatcher, FlattenByTypeMatcher,
                                     FlattenByTagMatcher)
 from .merger import Merger
-from .xmlelementhandlers import XmlElementHandler
+from .model import TestSuite
+from .xmlelementhandlers import SuiteHandler, XmlElementHandler
 
 
 def ExecutionResult(*sources, **options):
@@ -36,7 +47,9 @@ def ExecutionResult(*sources, **options):
         Setting ``rpa`` either to ``True`` (RPA mode) or ``False`` (test
         automation) sets execution mode explicitly. By default it is got
         from processed output files and conflicting modes cause an error.
-        Other options are passed directly to the
+        Using ``processes`` larger than one builds results from multiple
+        sources in that many processes in parallel. Results are the same
+        as when building them sequentially. Other options are passed directly to the
         :class:`ExecutionResultBuilder` object used internally.
     :returns: :class:`~.executionresult.Result` instance.
 
@@ -45,27 +58,63 @@ def ExecutionResult(*sources, **options):
     """
     if not sources:
         raise DataError('One or more data source needed.')
+    processes = options.pop('processes', 1)
     if options.pop('merge', False):
-        return _merge_results(sources[0], sources[1:], options)
+        return _merge_results(sources, options, processes)
     if len(sources) > 1:
-        return _combine_results(sources, options)
+        return _combine_results(sources, options, processes)
     return _single_result(sources[0], options)
 
 
-def _merge_results(original, merged, options):
-    result = ExecutionResult(original, **options)
+def _merge_results(sources, options, processes=1):
+    results = _build_results(sources, options, processes)
+    result = next(results)
     merger = Merger(result, rpa=result.rpa)
-    for path in merged:
-        merged = ExecutionResult(path, **options)
+    for merged in results:
         merger.merge(merged)
     return result
 
 
-def _combine_results(sources, options):
-    return CombinedResult(ExecutionResult(src, **options) for src in sources)
+def _build_results(sources, options, processes=1):
+    """Yields results built from the sources in the original order.
+
+    With multiple processes results are built in worker processes and
+    transferred back pickled. Keywords of tests are not transferred if
+    ``lazy_keywords`` is used, they are read from the source when needed.
+    Only a limited number of results is built ahead to avoid having all of
+    them in memory at the same time when processing them is slower.
+    """
+    if processes < 2 or len(sources) < 2 or not all(
+            is_string(s) or is_bytes(s) or is_pathlike(s) for s in sources):
+        for source in sources:
+            yield ExecutionResult(source, **options)
+        return
+    processes = min(processes, len(sources))
+    with ProcessPoolExecutor(processes, get_context('spawn')) as executor:
+        pending = deque()
+        try:
+            for source in sources:
+                pending.append(executor.submit(_build_result, source, options))
+                if len(pending) > processes * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _build_result(source, options):
+    return ExecutionResult(source, **options)
+
+
+def _combine_results(sources, options, processes=1):
+    return CombinedResult(_build_results(sources, options, processes))
 
 
 def _single_result(source, options):
+    if is_binary_output(source):
+        return _single_binary_result(source, options)
     ets = ETSource(source)
     result = Result(source, rpa=options.pop('rpa', None))
     try:
@@ -77,6 +126,18 @@ def _single_result(source, options):
     raise DataError(f"Reading XML source '{ets}' failed: {error}")
 
 
+def _single_binary_result(source, options):
+    result = Result(source, rpa=options.pop('rpa', None))
+    try:
+        return BinaryResultBuilder(source, **options).build(result)
+    except IOError as err:
+        error = err.strerror
+    except:
+        error = get_error_message()
+    name = 'bytes' if is_bytes(source) else source
+    raise DataError(f"Reading binary output '{name}' failed: {error}")
+
+
 class ExecutionResultBuilder:
     """Builds :class:`~.executionresult.Result` objects based on output files.
 
@@ -84,7 +145,8 @@ class ExecutionResultBuilder:
     :func:`ExecutionResult` factory method.
     """
 
-    def __init__(self, source, include_keywords=True, flattened_keywords=None):
+    def __init__(self, source, include_keywords=True, flattened_keywords=None,
+                 lazy_keywords=False, recover=False):
         """
         :param source: Path to the XML output file to build
             :class:`~.executionresult.Result` objects from.
@@ -95,17 +157,38 @@ class ExecutionResultBuilder:
         :param flatten_keywords: List of patterns controlling what keywords to
             flatten. See the documentation of ``--flattenkeywords`` option for
             more details.
+        :param lazy_keywords: When ``True`` and the source is a path to an
+            uncompressed output file, keywords and control structures of tests
+            are built only when the body, setup or teardown of the test is
+            accessed first time. Makes processing results faster and saves
+            memory when most of the keywords are not needed.
+        :param recover: When ``True``, results are built also from output
+            files that have been truncated, for example, because execution
+            was killed. Tests, keywords and suites that did not finish are
+            failed with a message telling that execution was interrupted.
         """
         self._source = source \
             if isinstance(source, ETSource) else ETSource(source)
         self._include_keywords = include_keywords
         self._flattened_keywords = flattened_keywords
+        self._lazy_keywords = lazy_keywords
+        self._recover = recover
+        self._lazy_path = None
+        self._declaration = b''
 
     def build(self, result):
         # Parsing is performance optimized. Do not change without profiling!
-        handler = XmlElementHandler(result)
         with self._source as source:
-            self._parse(source, handler.start, handler.end)
+            if not (self._lazy_keywords and self._include_keywords
+                    and self._is_path(source) and self._lazy_parse(source, result)):
+                handler = XmlElementHandler(result)
+                try:
+                    self._parse(source, handler.start, handler.end)
+                except (ET.ParseError, EOFError) as error:
+                    if not (self._recover and handler.started
+                            and self._is_truncated(error)):
+                        raise
+                    handler.interrupt()
         result.handle_suite_teardown_failures()
         if not self._include_keywords:
             result.suite.visit(RemoveKeywords())
@@ -124,6 +207,131 @@ class ExecutionResultBuilder:
                 end(elem)
                 elem.clear()
 
+    def _is_truncated(self, error):
+        # Expat error codes for "no element found", "unclosed token" and
+        # "partial character". Truncated gzip files cause `EOFError`.
+        return isinstance(error, EOFError) or error.code in (3, 5, 6)
+
+    def _is_path(self, source):
+        # Compressed files and other file objects are not seekable cheaply.
+        return is_string(source) or is_bytes(source) or is_pathlike(source)
+
+    def _lazy_parse(self, source, result):
+        # Test keywords are skipped and the byte offsets of each test element
+        # are recorded so that keywords can be built from the file later.
+        # `iterparse` does not expose offsets, so they are got by scanning
+        # the raw data it reads. Returns `False`, and leaves `result` clean,
+        # if the scanned elements do not match the parsed tests.
+        handler = XmlElementHandler(result)
+        tests = []
+        warnings = []
+        with open(source, 'rb') as file:
+            scanner = _TestOffsetScanner(file)
+            context = ET.iterparse(scanner, events=('start', 'end'))
+            context = self._omit_test_keywords(context, warnings)
+            if self._flattened_keywords:
+                context = self._flatten_keywords(context, self._flattened_keywords)
+            try:
+                for event, elem in context:
+                    if event == 'start':
+                        item = handler.start(elem)
+                        if elem.tag == 'test':
+                            tests.append((item, elem.get('name', '')))
+                    else:
+                        handler.end(elem)
+                        elem.clear()
+            except ET.ParseError:
+                # Truncated files are recovered by parsing them normally.
+                if not self._recover:
+                    raise
+                tests = None
+        if tests is None or not len(tests) == len(scanner.starts) == len(scanner.ends):
+            result.suite = TestSuite()
+            result.errors = ExecutionErrors()
+            return False
+        self._lazy_path = os.path.abspath(source)
+        self._declaration = scanner.declaration
+        for (test, name), start, end, has_warnings \
+                in zip(tests, scanner.starts, scanner.ends, warnings):
+            test._lazy_keywords = LazyKeywords(self, start, end, name, has_warnings)
+        return True
+
+    def _omit_test_keywords(self, context, warnings):
+        body = {'kw', 'for', 'while', 'if', 'try', 'return', 'break', 'continue',
+                'msg'}
+        in_test = False
+        omitted = 0
+        for event, elem in context:
+            start = event == 'start'
+            if omitted:
+                if start:
+                    omitted += 1
+                    if elem.tag == 'msg' and elem.get('level') in ('WARN', 'ERROR'):
+                        warnings[-1] = True
+                else:
+                    omitted -= 1
+                    elem.clear()
+            elif in_test and start and elem.tag in body:
+                omitted = 1
+                if elem.tag == 'msg' and elem.get('level') in ('WARN', 'ERROR'):
+                    warnings[-1] = True
+            else:
+                if elem.tag == 'test':
+                    in_test = start
+                    if start:
+                        warnings.append(False)
+                yield event, elem
+
+    def _build_test(self, start, end, shallow=False):
+        with open(self._lazy_path, 'rb') as file:
+            file.seek(start)
+            data = file.read(end - start)
+        suite = TestSuite()
+        handler = XmlElementHandler(suite, root_handler=SuiteHandler())
+        context = ET.iterparse(BytesIO(self._declaration + data),
+                               events=('start', 'end'))
+        if shallow:
+            context = self._omit_nested_keywords(context)
+        if self._flattened_keywords:
+            context = self._flatten_keywords(context, self._flattened_keywords)
+        for event, elem in context:
+            if event == 'start':
+                handler.start(elem)
+            else:
+                handler.end(elem)
+                elem.clear()
+        return suite.tests[0]
+
+    def _omit_nested_keywords(self, context):
+        # Omits body items inside keywords and control structures in the test
+        # body. Test setup and teardown as well as keyword teardowns are kept.
+        body = {'kw', 'for', 'while', 'iter', 'if', 'branch', 'try', 'return',
+                'break', 'continue', 'msg'}
+        depth = 0
+        omitted = 0
+        fixture = False
+        for event, elem in context:
+            start = event == 'start'
+            if omitted:
+                if start:
+                    omitted += 1
+                else:
+                    omitted -= 1
+                    elem.clear()
+                continue
+            if start:
+                depth += 1
+                if depth == 2:
+                    fixture = elem.get('type') in ('SETUP', 'TEARDOWN')
+                elif (depth == 3 and not fixture and elem.tag in body
+                      and elem.get('type') != 'TEARDOWN'):
+                    depth -= 1
+                    omitted = 1
+                    continue
+            else:
+                depth -= 1
+            yield event, elem
+
     def _omit_keywords(self, context):
         omitted_kws = 0
         for event, elem in context:
@@ -195,6 +403,78 @@ class ExecutionResultBuilder:
         return matcher.match, bool(matcher)
 
 
+class LazyKeywords:
+    """Builds keywords of a test from the output file when they are needed.
+
+    Used by :class:`ExecutionResultBuilder` when keywords are loaded lazily.
+    ``has_warnings`` tells does the test contain warnings or errors without
+    building its keywords.
+    """
+    __slots__ = ['builder', 'start', 'end', 'name', 'has_warnings']
+
+    def __init__(self, builder, start, end, name, has_warnings=False):
+        self.builder = builder
+        self.start = start
+        self.end = end
+        self.name = name
+        self.has_warnings = has_warnings
+
+    def load(self, test, shallow=False):
+        """Adds keywords to the given test.
+
+        If ``shallow`` is ``True``, keywords and control structures in the
+        test body are created without their content.
+        """
+        test._lazy_keywords = None
+        try:
+            loaded = self.builder._build_test(self.start, self.end, shallow)
+        except Exception:
+            loaded = None
+            error = get_error_message()
+        else:
+            error = 'File has changed.'
+        if not loaded or loaded.name != self.name:
+            raise DataError(f"Reading keywords of test '{self.name}' from "
+                            f"'{self.builder._lazy_path}' failed: {error}")
+        test.body = loaded.body
+        if loaded.has_setup:
+            test.setup = loaded.setup
+        if loaded.has_teardown:
+            test.teardown = loaded.teardown
+
+
+class _TestOffsetScanner:
+    _pattern = re.compile(rb'<(/?)test[\s>]')
+
+    def __init__(self, file):
+        self._file = file
+        self._offset = 0
+        self._tail = b''
+        self.declaration = b''
+        self.starts = []
+        self.ends = []
+
+    def read(self, size=-1):
+        data = self._file.read(size)
+        if not self._offset and data.startswith(b'<?xml'):
+            self.declaration = data[:data.find(b'?>') + 2]
+        # The end of the data is kept and scanned again with the next chunk
+        # so that elements split between chunks are found.
+        buffer = self._tail + data
+        base = self._offset - len(self._tail)
+        limit = max(len(buffer) - 6, 0) if data else len(buffer)
+        for match in self._pattern.finditer(buffer):
+            if match.start() >= limit:
+                break
+            if match.group(1):
+                self.ends.append(base + match.end())
+            else:
+                self.starts.append(base + match.start())
+        self._tail = buffer[limit:]
+        self._offset += len(data)
+        return data
+
+
 class RemoveKeywords(SuiteVisitor):
 
     def start_suite(self, suite):
@@ -13,6 +13,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from sys import intern
+
 from robot.errors import DataError
 
 
@@ -28,12 +30,24 @@ class XmlElementHandler:
         if result is not None:
             result = handler.start(elem, result)
         self._stack.append((handler, result))
+        return result
 
     def end(self, elem):
         handler, result = self._stack.pop()
         if result is not None:
             handler.end(elem, result)
 
+    @property
+    def started(self):
+        return len(self._stack) > 1
+
+    def interrupt(self):
+        """Ends elements left open when the parsed data was truncated."""
+        while self.started:
+            handler, result = self._stack.pop()
+            if result is not None:
+                handler.interrupt(result)
+
 
 class ElementHandler:
     element_handlers = {}
@@ -59,6 +73,15 @@ class ElementHandler:
     def end(self, elem, result):
         pass
 
+    def interrupt(self, result):
+        pass
+
+    def _interned(self, elem, attr_name, default=None):
+        # Values repeated a lot in big outputs, such as statuses and keyword
+        # names, are interned to share same string objects in the model.
+        value = elem.get(attr_name, default)
+        return intern(value) if value is not None else None
+
     def _timestamp(self, elem, attr_name):
         timestamp = elem.get(attr_name)
         return timestamp if timestamp != 'N/A' else None
@@ -96,6 +119,10 @@ class SuiteHandler(ElementHandler):
                                     source=elem.get('source'),
                                     rpa=result.rpa)
 
+    def interrupt(self, result):
+        if result.end_millis is None:
+            result.message = 'Suite did not finish because execution was interrupted.'
+
     def get_child_handler(self, tag):
         if tag == 'status':
             return StatusHandler(set_status=False)
@@ -115,6 +142,11 @@ class TestHandler(ElementHandler):
             lineno = int(lineno)
         return result.tests.create(name=elem.get('name', ''), lineno=lineno)
 
+    def interrupt(self, result):
+        if result.end_millis is None:
+            result.status = result.FAIL
+            result.message = 'Test did not finish because execution was interrupted.'
+
 
 @ElementHandler.register
 class KeywordHandler(ElementHandler):
@@ -132,14 +164,19 @@ class KeywordHandler(ElementHandler):
             creator = getattr(self, '_create_%s' % elem_type.lower().replace(' ', '_'))
         return creator(elem, result)
 
+    def interrupt(self, result):
+        if result.end_millis is None:
+            result.status = result.FAIL
+            result.message = 'Keyword did not finish because execution was interrupted.'
+
     def _create_keyword(self, elem, result):
         try:
             body = result.body
         except AttributeError:
             body = self._get_body_for_suite_level_keyword(result)
-        return body.create_keyword(kwname=elem.get('name', ''),
-                                   libname=elem.get('library'),
-                                   sourcename=elem.get('sourcename'))
+        return body.create_keyword(kwname=self._interned(elem, 'name', ''),
+                                   libname=self._interned(elem, 'library'),
+                                   sourcename=self._interned(elem, 'sourcename'))
 
     def _get_body_for_suite_level_keyword(self, result):
         # Someone, most likely a listener, has created a `<kw>` element on suite level.
@@ -154,12 +191,12 @@ class KeywordHandler(ElementHandler):
         return keyword.body
 
     def _create_setup(self, elem, result):
-        return result.setup.config(kwname=elem.get('name', ''),
-                                   libname=elem.get('library'))
+        return result.setup.config(kwname=self._interned(elem, 'name', ''),
+                                   libname=self._interned(elem, 'library'))
 
     def _create_teardown(self, elem, result):
-        return result.teardown.config(kwname=elem.get('name', ''),
-                                      libname=elem.get('library'))
+        return result.teardown.config(kwname=self._interned(elem, 'name', ''),
+                                      libname=self._interned(elem, 'library'))
 
     # RF < 4 compatibility.
 
@@ -271,7 +308,7 @@ class MessageHandler(ElementHandler):
     def end(self, elem, result):
         html_true = ('true', 'yes')    # 'yes' is compatibility for RF < 4.
         result.body.create_message(elem.text or '',
-                                   elem.get('level', 'INFO'),
+                                   self._interned(elem, 'level', 'INFO'),
                                    elem.get('html') in html_true,
                                    self._timestamp(elem, 'timestamp'))
 
@@ -285,7 +322,7 @@ class StatusHandler(ElementHandler):
 
     def end(self, elem, result):
         if self.set_status:
-            result.status = elem.get('status', 'FAIL')
+            result.status = self._interned(elem, 'status', 'FAIL')
         result.starttime = self._timestamp(elem, 'starttime')
         result.endtime = self._timestamp(elem, 'endtime')
         if elem.text:
@@ -95,6 +95,14 @@ Options
                           extension is needed, separate them with a colon.
                           Examples: `--extension txt`, `--extension robot:txt`
                           Only `*.robot` files are parsed by default.
+    --parsecache dir      Cache parsed suite and resource files into this
+                          directory to make parsing them faster in subsequent
+                          executions. Cached data is not used if a file has
+                          been modified. Files are not cached by default and
+                          the special value `NONE` can be used to disable
+                          caching if it has been enabled earlier, for example,
+                          using the ROBOT_OPTIONS environment variable.
+                          Example: --parsecache ~/.cache/robot
  -N --name name           Set the name of the top level suite. By default the
                           name is created based on the executed file or
                           directory.
@@ -138,6 +146,13 @@ Options
                           individually using --test.
  -S --rerunfailedsuites output  Select failed suites from an earlier output
                           file to be re-executed.
+    --resume output       Resume an earlier execution that was interrupted.
+                          Tests that were completed according to the given
+                          output file are not executed again, but their
+                          results are copied to the new output. Suites where
+                          all tests were completed are not executed at all.
+                          The output file can be the same as the new output.
+                          Cannot be used with --processes. See also --journal.
     --runemptysuite       Executes suite even if it contains no tests. Useful
                           e.g. with --include/--exclude when it is not an error
                           that no test matches the condition.
@@ -169,6 +184,12 @@ Options
                           can also be further processed with Rebot tool. Can be
                           disabled by giving a special value `NONE`.
                           Default: output.xml
+    --journal             Flush the output file when tests and suites start
+                          and end and sync it to the disk at most once per
+                          second. If execution is interrupted, results of the
+                          finished tests can then be processed with Rebot
+                          using its --recover option or execution continued
+                          with --resume.
  -l --log file            HTML log file. Can be disabled by giving a special
                           value `NONE`. Default: log.html
                           Examples: `--log mylog.html`, `-l NONE`
@@ -176,6 +197,11 @@ Options
                           similarly as --log. Default: report.html
  -x --xunit file          xUnit compatible result file. Not created unless this
                           option is specified.
+    --binaryoutput file   Binary output file containing same data as the XML
+                          output. Binary outputs are faster to write and read
+                          than XML outputs and can be processed with Rebot
+                          similarly. Not created unless this option is
+                          specified. Default extension is `.bin`.
  -b --debugfile file      Debug file written during execution. Not created
                           unless this option is specified.
  -T --timestampoutputs    When this option is used, timestamp in a format
@@ -186,6 +212,13 @@ Options
                           `report-20070503-154410.html`.
     --splitlog            Split the log file into smaller pieces that open in
                           browsers transparently.
+    --sharedstrings       When used with --splitlog, write long strings used
+                          by split log files only once to a separate
+                          `<log>-strings.js` file that is loaded when needed.
+    --logcompression level  Compression level between 0 and 9 to use with
+                          long strings in log and report files. Lower levels
+                          make creating outputs faster but files bigger and
+                          0 disables compression. Default is 9.
     --logtitle title      Title for the generated log file. The default title
                           is `<SuiteName> Log`.
     --reporttitle title   Title for the generated report file. The default
@@ -306,6 +339,31 @@ Options
                           The seed must be an integer.
                           Examples: --randomize all
                                     --randomize tests:1234
+    --processes count     Run suites in parallel using this many processes.
+                          Suites that do not contain other suites are executed
+                          as separate units and their results are combined
+                          in the original suite order. Setups and teardowns
+                          of higher level suites are run separately in every
+                          unit, so they are run multiple times. Only one
+                          result of each of them is preserved, and a failed
+                          result is preferred over a passed one.
+                          Also test data files are parsed in parallel.
+                          Default is 1 meaning no parallel execution.
+                          Example: --processes 4
+    --timeoutengine default|watchdog
+                          How to implement test and keyword timeouts.
+                          default:  Use signals on POSIX systems and a timer
+                                    thread on Windows (default). The watchdog
+                                    is used if execution is not started from
+                                    the main thread.
+                          watchdog: Use one shared watchdog thread. Blocking
+                                    calls like long sleeps are not interrupted
+                                    similarly as on Windows.
+    --resultsinmemory     Collect keywords and messages into the result model
+                          during execution and create log and report based on
+                          it instead of reading the output file afterwards.
+                          Makes creating results faster but requires more
+                          memory during execution. Not used with --processes.
     --prerunmodifier class *  Class to programmatically modify the suite
                           structure before execution.
     --prerebotmodifier class *  Class to programmatically modify the result
@@ -427,7 +485,9 @@ class RobotFramework(Application):
         builder = TestSuiteBuilder(settings.suite_names,
                                    included_extensions=settings.extension,
                                    rpa=settings.rpa,
-                                   allow_empty_suite=settings.run_empty_suite)
+                                   allow_empty_suite=settings.run_empty_suite,
+                                   parse_cache=settings.parse_cache,
+                                   processes=settings.processes)
         suite = builder.build(*datasources)
         settings.rpa = suite.rpa
         if settings.pre_run_modifiers:
@@ -444,8 +504,12 @@ class RobotFramework(Application):
             LOGGER.info("Tests execution ended. Statistics:\n%s"
                         % result.suite.stat_message)
             if settings.log or settings.report or settings.xunit:
-                writer = ResultWriter(settings.output if settings.log
-                                      else result)
+                if not settings.log:
+                    writer = ResultWriter(result)
+                elif settings.results_in_memory and settings.processes == 1:
+                    writer = ResultWriter(result, prune_input=True)
+                else:
+                    writer = ResultWriter(settings.output)
                 writer.write_results(settings.get_rebot_settings())
         return result.return_code
 
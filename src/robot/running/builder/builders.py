@@ -14,10 +14,13 @@
 #  limitations under the License.
 
 import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
 
 from robot.errors import DataError
-from robot.output import LOGGER
+from robot.output import LOGGER, Message
 from robot.parsing import SuiteStructureBuilder, SuiteStructureVisitor
+from robot.parsing.parser import ParseCache
 
 from .parsers import RobotParser, NoInitFileDirectoryParser, RestParser
 from .testsettings import TestDefaults
@@ -47,7 +50,8 @@ class TestSuiteBuilder:
     """
 
     def __init__(self, included_suites=None, included_extensions=('robot',),
-                 rpa=None, allow_empty_suite=False, process_curdir=True):
+                 rpa=None, allow_empty_suite=False, process_curdir=True,
+                 parse_cache=None, processes=1):
         """
         :param include_suites:
             List of suite names to include. If ``None`` or an empty list, all
@@ -65,12 +69,21 @@ class TestSuiteBuilder:
             Control processing the special ``${CURDIR}`` variable. It is
             resolved already at parsing time by default, but that can be
             changed by giving this argument ``False`` value.
+        :param parse_cache:
+            Directory where to cache parsed files to make parsing them again
+            faster. By default parsed files are not cached.
+            Same as `--parsecache`.
+        :param processes:
+            Number of processes to use for parsing files. By default files
+            are parsed serially in the current process. Same as `--processes`.
         """
         self.rpa = rpa
         self.included_suites = included_suites
         self.included_extensions = included_extensions
         self.allow_empty_suite = allow_empty_suite
         self.process_curdir = process_curdir
+        self.parse_cache = parse_cache
+        self.processes = processes
 
     def build(self, *paths):
         """
@@ -79,8 +92,14 @@ class TestSuiteBuilder:
         """
         structure = SuiteStructureBuilder(self.included_extensions,
                                           self.included_suites).build(paths)
-        parser = SuiteStructureParser(self.included_extensions,
-                                      self.rpa, self.process_curdir)
+        if self.processes > 1 and structure.is_directory:
+            parser = ParallelSuiteStructureParser(self.included_extensions,
+                                                  self.rpa, self.process_curdir,
+                                                  self.parse_cache, self.processes)
+        else:
+            parser = SuiteStructureParser(self.included_extensions,
+                                          self.rpa, self.process_curdir,
+                                          self.parse_cache)
         suite = parser.parse(structure)
         if not self.included_suites and not self.allow_empty_suite:
             self._validate_test_counts(suite, multisource=len(paths) > 1)
@@ -101,16 +120,20 @@ class TestSuiteBuilder:
 
 class SuiteStructureParser(SuiteStructureVisitor):
 
-    def __init__(self, included_extensions, rpa=None, process_curdir=True):
+    def __init__(self, included_extensions, rpa=None, process_curdir=True,
+                 parse_cache=None):
         self.rpa = rpa
         self._rpa_given = rpa is not None
         self.suite = None
         self._stack = []
-        self.parsers = self._get_parsers(included_extensions, process_curdir)
+        self.parsers = self._get_parsers(included_extensions, process_curdir,
+                                         parse_cache)
 
-    def _get_parsers(self, extensions, process_curdir):
-        robot_parser = RobotParser(process_curdir)
-        rest_parser = RestParser(process_curdir)
+    def _get_parsers(self, extensions, process_curdir, parse_cache=None):
+        if parse_cache:
+            parse_cache = ParseCache(parse_cache)
+        robot_parser = RobotParser(process_curdir, parse_cache)
+        rest_parser = RestParser(process_curdir, parse_cache)
         parsers = {
             None: NoInitFileDirectoryParser(),
             'robot': robot_parser,
@@ -159,20 +182,24 @@ class SuiteStructureParser(SuiteStructureVisitor):
     def _build_suite(self, structure):
         parent_defaults = self._stack[-1][-1] if self._stack else None
         source = structure.source
-        defaults = TestDefaults(parent_defaults)
-        parser = self._get_parser(structure.extension)
         try:
-            if structure.is_directory:
-                suite = parser.parse_init_file(structure.init_file or source, defaults)
-            else:
-                suite = parser.parse_suite_file(source, defaults)
-                if not suite.tests:
-                    LOGGER.info("Data source '%s' has no tests or tasks." % source)
+            suite, defaults = self._parse(structure, TestDefaults(parent_defaults))
+            if not structure.is_directory and not suite.tests:
+                LOGGER.info("Data source '%s' has no tests or tasks." % source)
             self._validate_execution_mode(suite)
         except DataError as err:
             raise DataError("Parsing '%s' failed: %s" % (source, err.message))
         return suite, defaults
 
+    def _parse(self, structure, defaults):
+        parser = self._get_parser(structure.extension)
+        if structure.is_directory:
+            suite = parser.parse_init_file(structure.init_file or structure.source,
+                                           defaults)
+        else:
+            suite = parser.parse_suite_file(structure.source, defaults)
+        return suite, defaults
+
     def _validate_execution_mode(self, suite):
         if self._rpa_given:
             suite.rpa = self.rpa
@@ -188,10 +215,107 @@ class SuiteStructureParser(SuiteStructureVisitor):
                             "execution mode explicitly." % (this, that))
 
 
+class ParallelSuiteStructureParser(SuiteStructureParser):
+    """Parses files using multiple processes.
+
+    All files are submitted to a process pool before the suite structure is
+    assembled in the original order. Messages logged in worker processes are
+    collected and logged when the suite created from the file is added to the
+    structure, which makes the results and logged messages identical to
+    parsing files serially.
+
+    Suite initialization files affect test defaults of all files in their
+    directories and thus they must be parsed before files in them are
+    submitted. They are parsed in worker processes as well to get their
+    messages logged in the right order.
+    """
+
+    def __init__(self, included_extensions, rpa=None, process_curdir=True,
+                 parse_cache=None, processes=2):
+        super().__init__(included_extensions, rpa, process_curdir, parse_cache)
+        self.processes = processes
+        self._results = {}
+
+    def parse(self, structure):
+        with ProcessPoolExecutor(self.processes, get_context('spawn'),
+                                 initializer=_initialize_parsing_worker) as executor:
+            try:
+                self._submit(structure, executor)
+                return super().parse(structure)
+            finally:
+                for result in self._results.values():
+                    result.cancel()
+
+    def _submit(self, structure, executor, parent_defaults=None):
+        parser = self._get_parser(structure.extension)
+        defaults = TestDefaults(parent_defaults)
+        if not structure.is_directory:
+            self._results[structure] = executor.submit(parse_file, parser,
+                                                       structure.source, defaults)
+            return
+        if structure.init_file:
+            result = executor.submit(parse_file, parser, structure.init_file,
+                                     defaults, init=True)
+        else:
+            # Directories without init files do not need actual parsing.
+            suite = parser.parse_init_file(structure.source, defaults)
+            result = Future()
+            result.set_result((suite, defaults, [], None))
+        self._results[structure] = result
+        defaults = result.result()[1]
+        for child in structure.children:
+            self._submit(child, executor, defaults)
+
+    def _parse(self, structure, defaults):
+        suite, defaults, messages, error = self._results.pop(structure).result()
+        for message, level, html, timestamp in messages:
+            LOGGER.message(Message(message, level, html, timestamp))
+        if error:
+            raise DataError(error)
+        return suite, defaults
+
+
+def _initialize_parsing_worker():
+    LOGGER.unregister_console_logger()
+    LOGGER.disable_message_cache()
+
+
+def parse_file(parser, source, defaults, init=False):
+    """Parses a file and returns ``(suite, defaults, messages, error)``.
+
+    Used by :class:`ParallelSuiteStructureParser` for parsing files in worker
+    processes. ``messages`` contains messages logged during parsing as
+    ``(message, level, html, timestamp)`` tuples and ``error`` is the message
+    of the possible :class:`~robot.errors.DataError`.
+    """
+    collector = _MessageCollector()
+    LOGGER.register_logger(collector)
+    try:
+        if init:
+            suite = parser.parse_init_file(source, defaults)
+        else:
+            suite = parser.parse_suite_file(source, defaults)
+    except DataError as err:
+        return None, defaults, collector.messages, err.message
+    finally:
+        LOGGER.unregister_logger(collector)
+    return suite, defaults, collector.messages, None
+
+
+class _MessageCollector:
+
+    def __init__(self):
+        self.messages = []
+
+    def message(self, msg):
+        self.messages.append((msg.message, msg.level, msg.html, msg.timestamp))
+
+
 class ResourceFileBuilder:
 
-    def __init__(self, process_curdir=True):
+    def __init__(self, process_curdir=True, parse_cache=None):
         self.process_curdir = process_curdir
+        self.parse_cache = ParseCache(parse_cache) if parse_cache else None
 
     def build(self, source):
         LOGGER.info("Parsing resource file '%s'." % source)
@@ -205,5 +329,7 @@ class ResourceFileBuilder:
 
     def _parse(self, source):
         if os.path.splitext(source)[1].lower() in ('.rst', '.rest'):
-            return RestParser(self.process_curdir).parse_resource_file(source)
-        return RobotParser(self.process_curdir).parse_resource_file(source)
+            parser = RestParser(self.process_curdir, self.parse_cache)
+        else:
+            parser = RobotParser(self.process_curdir, self.parse_cache)
+        return parser.parse_resource_file(source)
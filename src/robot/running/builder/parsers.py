@@ -40,8 +40,9 @@ class BaseParser:
 
 class RobotParser(BaseParser):
 
-    def __init__(self, process_curdir=True):
+    def __init__(self, process_curdir=True, parse_cache=None):
         self.process_curdir = process_curdir
+        self.parse_cache = parse_cache
 
     def parse_init_file(self, source, defaults=None):
         directory = os.path.dirname(source)
@@ -61,8 +62,7 @@ class RobotParser(BaseParser):
         if defaults is None:
             defaults = TestDefaults()
         if model is None:
-            model = get_model(self._get_source(source), data_only=True,
-                              curdir=self._get_curdir(source))
+            model = self._get_model(get_model, source)
         ErrorReporter(source).visit(model)
         SettingsBuilder(suite, defaults).visit(model)
         SuiteBuilder(suite, defaults).visit(model)
@@ -74,12 +74,18 @@ class RobotParser(BaseParser):
             return None
         return os.path.dirname(source).replace('\\', '\\\\')
 
+    def _get_model(self, get_model, source):
+        curdir = self._get_curdir(source)
+        if self.parse_cache:
+            get_cached = getattr(self.parse_cache, get_model.__name__)
+            return get_cached(source, curdir, lambda: self._get_source(source))
+        return get_model(self._get_source(source), data_only=True, curdir=curdir)
+
     def _get_source(self, source):
         return source
 
     def parse_resource_file(self, source):
-        model = get_resource_model(self._get_source(source), data_only=True,
-                                   curdir=self._get_curdir(source))
+        model = self._get_model(get_resource_model, source)
         resource = ResourceFile(source=source)
         ErrorReporter(source).visit(model)
         ResourceBuilder(resource).visit(model)
@@ -17,6 +17,7 @@ from operator import attrgetter
 
 from robot.errors import DataError, KeywordError
 from robot.utils import NormalizedDict
+from robot.variables import search_variable
 
 from .usererrorhandler import UserErrorHandler
 
@@ -30,11 +31,11 @@ class HandlerStore:
         self.source = source
         self.source_type = source_type
         self._normal = NormalizedDict(ignore='_')
-        self._embedded = []
+        self._embedded = EmbeddedHandlers()
 
     def add(self, handler, embedded=False):
         if embedded:
-            self._embedded.append(handler)
+            self._embedded.add(handler)
         elif handler.name not in self._normal:
             self._normal[handler.name] = handler
         else:
@@ -44,7 +45,7 @@ class HandlerStore:
             raise error
 
     def __iter__(self):
-        handlers = list(self._normal.values()) + self._embedded
+        handlers = list(self._normal.values()) + list(self._embedded)
         return iter(sorted(handlers, key=attrgetter('name')))
 
     def __len__(self):
@@ -53,7 +54,8 @@ class HandlerStore:
     def __contains__(self, name):
         if name in self._normal:
             return True
-        return any(template.matches(name) for template in self._embedded)
+        return any(template.matches(name)
+                   for template in self._embedded.get_candidates(name))
 
     def create_runner(self, name):
         return self[name].create_runner(name)
@@ -65,7 +67,8 @@ class HandlerStore:
             return self._find_embedded(name)
 
     def _find_embedded(self, name):
-        embedded = [template for template in self._embedded if template.matches(name)]
+        embedded = [template for template in self._embedded.get_candidates(name)
+                    if template.matches(name)]
         if len(embedded) == 1:
             return embedded[0]
         self._raise_no_single_match(name, embedded)
@@ -82,3 +85,79 @@ class HandlerStore:
                  % (source, name)]
         names = sorted(handler.name for handler in found)
         raise KeywordError('\n    '.join(error + names))
+
+
+class EmbeddedHandlers:
+    """Keywords with embedded arguments indexed by their literal parts.
+
+    Keywords are indexed by the literal text before their first embedded
+    argument or, if there is no such text, by the literal text after their
+    last embedded argument. :meth:`get_candidates` returns only keywords
+    whose indexed text matches the searched name, which avoids matching
+    the name against regular expressions of all keywords.
+
+    Matching is case-insensitive. Only ASCII texts are indexed because
+    some non-ASCII characters match ASCII characters case-insensitively
+    and lowercasing some characters changes their length. Keywords that
+    cannot be indexed are always returned as candidates.
+    """
+
+    def __init__(self):
+        self._handlers = []
+        self._prefixes = {}
+        self._suffixes = {}
+        self._unindexed = []
+
+    def add(self, handler):
+        item = (len(self._handlers), handler)
+        self._handlers.append(handler)
+        prefix, suffix = self._get_literals(handler.name)
+        if prefix and self._is_ascii(prefix):
+            self._add_to_index(self._prefixes, prefix, item)
+        elif suffix and self._is_ascii(suffix):
+            self._add_to_index(self._suffixes, suffix, item)
+        else:
+            self._unindexed.append(item)
+
+    def _get_literals(self, name):
+        prefix = suffix = None
+        match = search_variable(name, identifiers='$', ignore_errors=True)
+        while match:
+            if prefix is None:
+                prefix = match.before
+            suffix = match.after
+            match = search_variable(suffix, identifiers='$', ignore_errors=True)
+        return prefix, suffix
+
+    def _is_ascii(self, string):
+        return len(string.encode('UTF-8')) == len(string)
+
+    def _add_to_index(self, index, literal, item):
+        index.setdefault(len(literal), {}).setdefault(literal.lower(), []).append(item)
+
+    def get_candidates(self, name):
+        """Returns keywords that may match the given name.
+
+        Returned keywords are in the order they were added.
+        """
+        if not self._is_ascii(name):
+            return list(self._handlers)
+        candidates = dict(self._unindexed)
+        name = name.lower()
+        for length, index in self._prefixes.items():
+            candidates.update(index.get(name[:length], ()))
+        if self._suffixes:
+            # Embedded argument regexps end with '$' that matches also
+            # before a trailing newline.
+            names = [name, name[:-1]] if name.endswith('\n') else [name]
+            for length, index in self._suffixes.items():
+                for name in names:
+                    if len(name) >= length:
+                        candidates.update(index.get(name[-length:], ()))
+        return [candidates[i] for i in sorted(candidates)]
+
+    def __iter__(self):
+        return iter(self._handlers)
+
+    def __len__(self):
+        return len(self._handlers)
@@ -31,12 +31,13 @@ RESOURCE_EXTENSIONS = ('.resource', '.robot', '.txt', '.tsv', '.rst', '.rest')
 
 class Importer:
 
-    def __init__(self):
+    def __init__(self, parse_cache=None):
         self._library_cache = ImportCache()
         self._resource_cache = ImportCache()
+        self._parse_cache = parse_cache
 
-    def reset(self):
-        self.__init__()
+    def reset(self, parse_cache=None):
+        self.__init__(parse_cache)
 
     def close_global_library_listeners(self):
         for lib in self._library_cache.values():
@@ -57,7 +58,8 @@ class Importer:
         if path in self._resource_cache:
             LOGGER.info("Found resource file '%s' from cache" % path)
         else:
-            resource = ResourceFileBuilder().build(path)
+            builder = ResourceFileBuilder(parse_cache=self._parse_cache)
+            resource = builder.build(path)
             self._resource_cache[path] = resource
         return self._resource_cache[path]
 
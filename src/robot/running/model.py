@@ -383,6 +383,11 @@ class TestSuite(model.TestSuite):
         is needed, the created output XML file needs to be read  using the
         :class:`~robot.result.resultbuilder.ExecutionResult` factory method.
 
+        If the ``processes`` option is larger than one, suites not containing
+        other suites are executed in parallel in separate processes and their
+        results are combined. In that case the returned result is read from
+        the partial outputs and contains also keywords.
+
         See the :mod:`package level <robot.running>` documentation for
         more examples, including how to construct executable test suites and
         how to create logs and reports based on the execution results.
@@ -391,18 +396,29 @@ class TestSuite(model.TestSuite):
         API for executing tests in files or directories.
         """
         from .namespace import IMPORTER
+        from .resume import ResumedResults
         from .signalhandler import STOP_SIGNAL_MONITOR
         from .suiterunner import SuiteRunner
+        from .timeouts import timeout_engine
 
         with LOGGER:
             if not settings:
                 settings = RobotSettings(options)
                 LOGGER.register_console_logger(**settings.console_output_config)
+            if settings.processes > 1 and self.suites:
+                from .parallel import ParallelRunner
+                return ParallelRunner(self, settings).run()
             with pyloggingconf.robot_handler_enabled(settings.log_level):
-                with STOP_SIGNAL_MONITOR:
-                    IMPORTER.reset()
+                with STOP_SIGNAL_MONITOR, timeout_engine(settings.timeout_engine):
+                    IMPORTER.reset(settings.parse_cache)
+                    # Earlier results must be read before the output file is
+                    # opened, because it can be the same file.
+                    resume = ResumedResults(settings.resume) \
+                        if settings.resume else None
                     output = Output(settings)
-                    runner = SuiteRunner(output, settings)
+                    if resume:
+                        output.replay_errors(resume.errors)
+                    runner = SuiteRunner(output, settings, resume=resume)
                     self.visit(runner)
                 output.close(runner.result)
         return runner.result
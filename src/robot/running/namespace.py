@@ -85,6 +85,7 @@ class Namespace:
             self.variables.set_from_variable_table(resource.variables, overwrite)
             user_library = UserLibrary(resource)
             self._kw_store.resources[path] = user_library
+            self._kw_store.clear_cache()
             self._handle_imports(resource.imports)
             LOGGER.imported("Resource", user_library.name,
                             importer=import_setting.source,
@@ -137,6 +138,7 @@ class Namespace:
                             importer=import_setting.source,
                             source=lib.source)
         self._kw_store.libraries[lib.name] = lib
+        self._kw_store.clear_cache()
         lib.start_suite()
         if self._running_test:
             lib.start_test()
@@ -211,6 +213,7 @@ class Namespace:
     def reload_library(self, libname_or_instance):
         library = self._kw_store.get_library(libname_or_instance)
         library.reload()
+        self._kw_store.clear_cache()
         return library
 
     def get_runner(self, name):
@@ -226,7 +229,25 @@ class KeywordStore:
         self.user_keywords = UserLibrary(resource, UserLibrary.TEST_CASE_FILE_TYPE)
         self.libraries = OrderedDict()
         self.resources = ImportCache()
-        self.search_order = ()
+        self._search_order = ()
+        self._runner_cache = {}
+
+    @property
+    def search_order(self):
+        return self._search_order
+
+    @search_order.setter
+    def search_order(self, search_order):
+        self._search_order = search_order
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Clears cached keyword runners.
+
+        Must be called when libraries or resources are imported or reloaded,
+        because that can change what keywords names match.
+        """
+        self._runner_cache.clear()
 
     def get_library(self, name_or_instance):
         if name_or_instance is None:
@@ -255,9 +276,17 @@ class KeywordStore:
         self._no_library_found(instance)
 
     def get_runner(self, name):
-        runner = self._get_runner(name)
+        # Runners are cached by the name used in the data. Finding them is
+        # otherwise slow because all resource files and libraries are searched.
+        runner = self._runner_cache.get(name) if is_string(name) else None
         if runner is None:
-            self._raise_no_keyword_found(name)
+            runner = self._get_runner(name)
+            if runner is None:
+                self._raise_no_keyword_found(name)
+            # Runners with pre-run messages are not cached to get messages
+            # logged with correct timestamps.
+            if not getattr(runner, 'pre_run_messages', None):
+                self._runner_cache[name] = runner
         return runner
 
     def _raise_no_keyword_found(self, name):
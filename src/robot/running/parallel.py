@@ -0,0 +1,244 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Parallel execution of suites using multiple processes.
+
+The executed suite structure is split into work units so that each suite
+not containing other suites forms its own unit. A unit contains the leaf
+suite along with copies of its parent suites so that parent suite setups,
+teardowns, variables and imports work the same way as in normal execution.
+
+Units are executed in a process pool and each process writes its results
+into a separate output file. These partial results are combined into one
+:class:`~robot.result.executionresult.Result` object so that suites are
+in the same order as they would be in normal serial execution.
+
+This module is considered internal. Parallel execution is enabled by using
+the ``--processes`` option.
+"""
+
+import os
+import tempfile
+from concurrent.futures import as_completed, ProcessPoolExecutor
+from multiprocessing import get_context
+
+from robot.output import LOGGER, Output, pyloggingconf
+from robot.result import ExecutionResult, Result
+from robot.utils import text
+
+from .namespace import IMPORTER
+from .signalhandler import STOP_SIGNAL_MONITOR
+from .status import Exit
+from .suiterunner import SuiteRunner
+from .timeouts import timeout_engine
+
+
+class ParallelRunner:
+
+    def __init__(self, suite, settings):
+        self._suite = suite
+        self._settings = settings
+
+    def run(self):
+        paths, units = zip(*get_work_units(self._suite))
+        context = get_context('spawn')
+        exit_event = context.Event()
+        LOGGER.start_suite(self._suite)
+        with tempfile.TemporaryDirectory() as tempdir:
+            outputs = [os.path.join(tempdir, f'unit-{index}.xml')
+                       for index in range(len(units))]
+            with ProcessPoolExecutor(self._settings.processes, context,
+                                     initializer=_initialize_worker,
+                                     initargs=(exit_event,)) as executor:
+                futures = {executor.submit(run_unit, unit,
+                                           self._settings.get_unit_settings(output)):
+                           index for index, (unit, output) in enumerate(zip(units, outputs))}
+                results = [None] * len(units)
+                for future in as_completed(futures):
+                    index = futures[future]
+                    future.result()
+                    results[index] = ExecutionResult(outputs[index])
+                    self._report(results[index].suite)
+        result = self._merge(paths, results)
+        LOGGER.end_suite(result.suite)
+        if self._settings.output:
+            result.save(self._settings.output)
+            LOGGER.output_file('Output', self._settings.output)
+        if self._settings.binary_output:
+            result.save(self._settings.binary_output, binary=True)
+            LOGGER.output_file('Binary output', self._settings.binary_output)
+        return result
+
+    def _report(self, suite):
+        while suite.suites:
+            suite = suite.suites[0]
+        LOGGER.start_suite(suite)
+        for test in suite.tests:
+            LOGGER.start_test(test)
+            LOGGER.end_test(test)
+        LOGGER.end_suite(suite)
+
+    def _merge(self, paths, results):
+        merged = Result(rpa=self._settings.rpa)
+        suites = {}
+        for path, result in zip(paths, results):
+            merged.errors.add(result.errors)
+            suite, parent = result.suite, None
+            for depth in range(len(path) + 1):
+                existing = suites.get(path[:depth])
+                if existing is None:
+                    self._add_suite(suite, parent, merged, path, depth, suites)
+                    break
+                existing.start_millis = self._earlier(existing.start_millis,
+                                                      suite.start_millis)
+                existing.end_millis = self._later(existing.end_millis, suite.end_millis)
+                self._merge_fixtures(existing, suite)
+                parent, suite = existing, suite.suites[0]
+        if self._exit_occurred(merged.suite):
+            # A new list is created to avoid changing lists shared with
+            # other settings objects.
+            combine = self._settings['TagStatCombine']
+            exit_combine = ('NOT robot:exit', '')
+            if exit_combine not in combine:
+                self._settings['TagStatCombine'] = combine + [exit_combine]
+        merged.configure(status_rc=self._settings.status_rc,
+                         stat_config=self._settings.statistics_config)
+        return merged
+
+    def _merge_fixtures(self, existing, suite):
+        # Parent suite setups and teardowns are run in every unit. The first
+        # setup and the last teardown are kept unless results of some other
+        # unit are worse, so that failures are not lost.
+        if self._severity(suite.setup) > self._severity(existing.setup):
+            existing.setup = suite.setup
+        if self._severity(suite.teardown) >= self._severity(existing.teardown):
+            existing.teardown = suite.teardown
+        if suite.message and not existing.message:
+            existing.message = suite.message
+
+    def _severity(self, fixture):
+        if not fixture:
+            return -1
+        return {'FAIL': 2, 'SKIP': 1}.get(fixture.status, 0)
+
+    def _exit_occurred(self, suite):
+        return (any('robot:exit' in test.tags for test in suite.tests)
+                or any(self._exit_occurred(child) for child in suite.suites))
+
+    def _add_suite(self, suite, parent, result, path, depth, suites):
+        if parent is None:
+            result.suite = suite
+        else:
+            parent.suites.append(suite)
+        for depth in range(depth, len(path) + 1):
+            suites[path[:depth]] = suite
+            if suite.suites:
+                suite = suite.suites[0]
+
+    def _earlier(self, time1, time2):
+        times = [t for t in (time1, time2) if t is not None]
+        return min(times) if times else None
+
+    def _later(self, time1, time2):
+        times = [t for t in (time1, time2) if t is not None]
+        return max(times) if times else None
+
+
+def get_work_units(suite, path=()):
+    """Yields ``(path, unit)`` pairs for suites not containing other suites.
+
+    ``path`` contains indices of the leaf suite and its parents in the original
+    suite structure. ``unit`` is the root of a suite structure that contains
+    copies of the parent suites and the leaf suite itself.
+    """
+    if not suite.suites:
+        yield path, _create_unit(suite)
+    for index, child in enumerate(suite.suites):
+        yield from get_work_units(child, path + (index,))
+
+
+def _create_unit(suite):
+    unit, parent = suite, suite.parent
+    while parent is not None:
+        unit = parent.copy(suites=[unit],
+                           setup=parent.setup.copy() if parent.has_setup else None,
+                           teardown=parent.teardown.copy() if parent.has_teardown else None)
+        parent = parent.parent
+    return unit
+
+
+_exit_event = None
+
+
+def _initialize_worker(exit_event):
+    global _exit_event
+    _exit_event = exit_event
+    # Parallel processes would otherwise overwrite the syslog of the main process.
+    os.environ['ROBOT_SYSLOG_FILE'] = 'NONE'
+
+
+def run_unit(suite, settings):
+    """Runs a work unit in a worker process. Results are written to the output."""
+    LOGGER.register_console_logger(**settings.console_output_config)
+    text.MAX_ERROR_LINES = settings.max_error_lines
+    exit = SharedExit(_exit_event, settings.exit_on_failure, settings.exit_on_error,
+                      settings.skip_teardown_on_exit)
+    with LOGGER:
+        with pyloggingconf.robot_handler_enabled(settings.log_level):
+            with STOP_SIGNAL_MONITOR, timeout_engine(settings.timeout_engine):
+                IMPORTER.reset(settings.parse_cache)
+                output = Output(settings)
+                runner = SuiteRunner(output, settings, exit)
+                suite.visit(runner)
+            output.close(runner.result)
+
+
+class SharedExit(Exit):
+    """Exit status that is shared with other processes using an event.
+
+    When execution should be stopped in one process, the event is set and
+    other processes stop the execution as if the failure had occurred locally.
+    """
+
+    def __init__(self, event, failure_mode=False, error_mode=False,
+                 skip_teardown_mode=False):
+        super().__init__(failure_mode, error_mode, skip_teardown_mode)
+        self._event = event
+
+    def failure_occurred(self, fatal=False):
+        super().failure_occurred(fatal)
+        self._notify_others()
+
+    def error_occurred(self):
+        super().error_occurred()
+        self._notify_others()
+
+    def _notify_others(self):
+        if self._local_exit and self._event is not None:
+            self._event.set()
+
+    @property
+    def _local_exit(self):
+        return super().__bool__()
+
+    def __bool__(self):
+        if not self._local_exit and self._event is not None and self._event.is_set():
+            if self.failure_mode:
+                self.failure = True
+            elif self.error_mode:
+                self.error = True
+            else:
+                self.fatal = True
+        return self._local_exit
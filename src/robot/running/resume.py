@@ -0,0 +1,129 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Resuming interrupted executions.
+
+Results of an earlier execution are read from its output file, which may
+have been truncated if the execution was killed. When the suite is executed
+again, tests completed earlier are not run but their results are written to
+the new output as they were. Suites where all tests were completed are handled
+the same way, which means that also their setups and teardowns are not run.
+
+Tests and suites are matched by their names. Because results are replayed
+in the order they are executed, the new output can be used for resuming
+again if also the resumed execution is interrupted.
+
+This module is considered internal. Resuming is enabled by using the
+``--resume`` option.
+"""
+
+import os
+
+from robot.model import SuiteVisitor
+from robot.output import LOGGER
+from robot.result import ExecutionResult
+from robot.result.executionerrors import ExecutionErrors
+
+from .modelcombiner import ModelCombiner
+
+
+class ResumedResults:
+
+    def __init__(self, path):
+        self.errors = ExecutionErrors()
+        self._suites = {}
+        self._tests = {}
+        if not os.path.exists(path):
+            LOGGER.info(f"Output file '{path}' to resume execution from does "
+                        f"not exist. All tests are executed.")
+            return
+        result = ExecutionResult(path, recover=True)
+        self.errors = result.errors
+        self._collect(result.suite)
+        count = sum(len(tests) for tests in self._tests.values())
+        LOGGER.info(f"Resuming execution from '{path}'. Results of {count} "
+                    f"completed tests are reused.")
+
+    def _collect(self, suite):
+        for child in suite.suites:
+            self._collect(child)
+        for test in suite.tests:
+            if test.end_millis is not None:
+                self._tests.setdefault((suite.longname, test.name), []).append(test)
+        # Suites are ended only after all their children have been ended.
+        if suite.end_millis is not None:
+            self._suites[suite.longname] = suite
+
+    def suite(self, suite):
+        """Returns earlier results of the suite if all its tests are completed."""
+        previous = self._suites.get(suite.longname)
+        if previous and previous.test_count == suite.test_count \
+                and self._all_tests_completed(suite):
+            return previous
+        return None
+
+    def _all_tests_completed(self, suite):
+        return (all((suite.longname, test.name) in self._tests for test in suite.tests)
+                and all(self._all_tests_completed(child) for child in suite.suites))
+
+    def test(self, test):
+        """Returns earlier results of the test if it was completed."""
+        tests = self._tests.get((test.parent.longname, test.name))
+        return tests.pop(0) if tests else None
+
+
+class ResultReplayer(SuiteVisitor):
+    """Reports results of an earlier execution like they were executed now.
+
+    Suites and tests are reported to all loggers and listeners combined with
+    the matching running suites and tests given as ``data``. Keywords and
+    messages, that are already part of the reported results, are only written
+    to the output file.
+    """
+
+    def __init__(self, output, data):
+        self._output = output
+        self._data = data
+        self._suites = []
+
+    def start_suite(self, suite):
+        data = self._get_data(suite, 'suites')
+        self._suites.append(data)
+        self._output.start_suite(ModelCombiner(data, suite))
+
+    def end_suite(self, suite):
+        data = self._suites.pop()
+        self._output.end_suite(ModelCombiner(data, suite))
+
+    def visit_test(self, test):
+        data = self._get_data(test, 'tests')
+        self._output.start_test(ModelCombiner(data, test))
+        if test.has_setup:
+            self._output.replay(test.setup)
+        self._output.replay(*test.body)
+        if test.has_teardown:
+            self._output.replay(test.teardown)
+        self._output.end_test(ModelCombiner(data, test))
+
+    def _get_data(self, item, children):
+        if not self._suites:
+            return self._data
+        for child in getattr(self._suites[-1], children):
+            if child.name == item.name:
+                return child
+        raise ValueError(f"No data found for '{item.longname}'.")
+
+    def visit_keyword(self, kw):
+        self._output.replay(kw)
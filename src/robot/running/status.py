@@ -150,11 +150,9 @@ class _ExecutionStatus:
 class SuiteStatus(_ExecutionStatus):
 
     def __init__(self, parent=None, exit_on_failure=False, exit_on_error=False,
-                 skip_teardown_on_exit=False):
-        if parent is None:
+                 skip_teardown_on_exit=False, exit=None):
+        if parent is None and exit is None:
             exit = Exit(exit_on_failure, exit_on_error, skip_teardown_on_exit)
-        else:
-            exit = None
         super().__init__(parent, exit)
 
     def _my_message(self):
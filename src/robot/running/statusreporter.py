@@ -15,7 +15,7 @@
 
 from robot.errors import (ExecutionFailed, ExecutionStatus, DataError,
                           HandlerExecutionFailed, KeywordError, VariableError)
-from robot.utils import ErrorDetails, get_timestamp
+from robot.utils import ErrorDetails, get_epoch_millis
 
 from .modelcombiner import ModelCombiner
 
@@ -38,7 +38,7 @@ class StatusReporter:
         context = self.context
         result = self.result
         self.initial_test_status = context.test.status if context.test else None
-        result.starttime = get_timestamp()
+        result.start_millis = get_epoch_millis()
         context.start_keyword(ModelCombiner(self.data, result))
         self._warn_if_deprecated(result.doc, result.name)
         return self
@@ -60,7 +60,7 @@ class StatusReporter:
                 result.message = failure.message
         if self.initial_test_status == 'PASS':
             context.test.status = result.status
-        result.endtime = get_timestamp()
+        result.end_millis = get_epoch_millis()
         context.end_keyword(ModelCombiner(self.data, result))
         if failure is not exc_val:
             raise failure
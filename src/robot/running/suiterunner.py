@@ -16,23 +16,26 @@
 from robot.errors import ExecutionFailed, ExecutionStatus, DataError, PassExecution
 from robot.model import SuiteVisitor, TagPatterns
 from robot.result import TestSuite, Result
-from robot.utils import get_timestamp, is_list_like, NormalizedDict, test_or_task
+from robot.utils import get_epoch_millis, is_list_like, NormalizedDict, test_or_task
 from robot.variables import VariableScopes
 
 from .bodyrunner import BodyRunner, KeywordRunner
 from .context import EXECUTION_CONTEXTS
 from .modelcombiner import ModelCombiner
 from .namespace import Namespace
+from .resume import ResultReplayer
 from .status import SuiteStatus, TestStatus
 from .timeouts import TestTimeout
 
 
 class SuiteRunner(SuiteVisitor):
 
-    def __init__(self, output, settings):
+    def __init__(self, output, settings, exit=None, resume=None):
         self.result = None
         self._output = output
         self._settings = settings
+        self._exit = exit
+        self._resume = resume
         self._variables = VariableScopes(settings)
         self._suite = None
         self._suite_status = None
@@ -44,13 +47,17 @@ class SuiteRunner(SuiteVisitor):
         return EXECUTION_CONTEXTS.current
 
     def start_suite(self, suite):
+        previous = self._resume.suite(suite) if self._resume else None
+        if previous:
+            self._replay_suite(suite, previous)
+            return False
         self._output.library_listeners.new_suite_scope()
         result = TestSuite(source=suite.source,
                            name=suite.name,
                            doc=suite.doc,
                            metadata=suite.metadata,
-                           starttime=get_timestamp(),
                            rpa=self._settings.rpa)
+        result.start_millis = get_epoch_millis()
         if not self.result:
             self.result = Result(root_suite=result, rpa=self._settings.rpa)
             self.result.configure(status_rc=self._settings.status_rc,
@@ -61,7 +68,8 @@ class SuiteRunner(SuiteVisitor):
         self._suite_status = SuiteStatus(self._suite_status,
                                          self._settings.exit_on_failure,
                                          self._settings.exit_on_error,
-                                         self._settings.skip_teardown_on_exit)
+                                         self._settings.skip_teardown_on_exit,
+                                         self._exit)
         ns = Namespace(self._variables, result, suite.resource)
         ns.start_suite()
         ns.variables.set_from_variable_table(suite.resource.variables)
@@ -83,6 +91,15 @@ class SuiteRunner(SuiteVisitor):
         self._run_setup(suite.setup, self._suite_status)
         self._executed_tests = NormalizedDict(ignore='_')
 
+    def _replay_suite(self, suite, previous):
+        if not self.result:
+            self.result = Result(root_suite=previous, rpa=self._settings.rpa)
+            self.result.configure(status_rc=self._settings.status_rc,
+                                  stat_config=self._settings.statistics_config)
+        else:
+            self._suite.suites.append(previous)
+        previous.visit(ResultReplayer(self._output, suite))
+
     def _resolve_setting(self, value):
         if is_list_like(value):
             return self._variables.replace_list(value, ignore_errors=True)
@@ -99,7 +116,7 @@ class SuiteRunner(SuiteVisitor):
                     self._suite.suite_teardown_skipped(str(failure))
                 else:
                     self._suite.suite_teardown_failed(str(failure))
-        self._suite.endtime = get_timestamp()
+        self._suite.end_millis = get_epoch_millis()
         self._suite.message = self._suite_status.message
         self._context.end_suite(ModelCombiner(suite, self._suite))
         self._suite = self._suite.parent
@@ -115,12 +132,17 @@ class SuiteRunner(SuiteVisitor):
                 test_or_task(f"Multiple {{test}}s with name '{test.name}' executed in "
                              f"suite '{self._suite.longname}'.", settings.rpa))
         self._executed_tests[test.name] = True
+        previous = self._resume.test(test) if self._resume else None
+        if previous:
+            self._suite.tests.append(previous)
+            previous.visit(ResultReplayer(self._output, test))
+            return
         result = self._suite.tests.create(self._resolve_setting(test.name),
                                           self._resolve_setting(test.doc),
                                           self._resolve_setting(test.tags),
                                           self._get_timeout(test),
-                                          test.lineno,
-                                          starttime=get_timestamp())
+                                          test.lineno)
+        result.start_millis = get_epoch_millis()
         self._context.start_test(result)
         self._output.start_test(ModelCombiner(test, result))
         status = TestStatus(self._suite_status, result, settings.skip_on_failure,
@@ -169,7 +191,7 @@ class SuiteRunner(SuiteVisitor):
         if status.skip_on_failure_after_tag_changes:
             result.message = status.message or result.message
         result.status = status.status
-        result.endtime = get_timestamp()
+        result.end_millis = get_epoch_millis()
         failed_before_listeners = result.failed
         self._output.end_test(ModelCombiner(test, result))
         if result.failed and not failed_before_listeners:
@@ -14,6 +14,8 @@
 #  limitations under the License.
 
 import time
+from contextlib import contextmanager
+from threading import current_thread, main_thread
 
 from robot.utils import Sortable, secs_to_timestr, timestr_to_secs, WINDOWS
 from robot.errors import TimeoutError, DataError, FrameworkError
@@ -22,9 +24,28 @@ if WINDOWS:
     from .windows import Timeout
 else:
     from .posix import Timeout
+from .watchdog import Timeout as WatchdogTimeout
+
+
+@contextmanager
+def timeout_engine(engine):
+    """Sets the engine used for running timeouts within the ``with`` block.
+
+    :param engine: ``DEFAULT`` to use signals on POSIX systems and a timer
+        thread on Windows, or ``WATCHDOG`` to use a shared watchdog thread.
+        The watchdog is used also by default if code is not run in the main
+        thread, because signals work only in it.
+    """
+    orig = _Timeout.engine
+    _Timeout.engine = engine.upper()
+    try:
+        yield
+    finally:
+        _Timeout.engine = orig
 
 
 class _Timeout(Sortable):
+    engine = 'DEFAULT'
 
     def __init__(self, timeout=None, variables=None):
         self.string = timeout or ''
@@ -75,7 +96,12 @@ class _Timeout(Sortable):
         if timeout <= 0:
             raise error
         executable = lambda: runnable(*(args or ()), **(kwargs or {}))
-        return Timeout(timeout, error).execute(executable)
+        return self._get_runner(timeout, error).execute(executable)
+
+    def _get_runner(self, timeout, error):
+        if self.engine == 'WATCHDOG' or current_thread() is not main_thread():
+            return WatchdogTimeout(timeout, error)
+        return Timeout(timeout, error)
 
     def get_message(self):
         if not self.active:
@@ -0,0 +1,133 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import ctypes
+import heapq
+import time
+from itertools import count
+from threading import Condition, Thread, get_ident
+
+
+class Watchdog:
+    """Thread that raises timeouts in threads running timed code.
+
+    Deadlines of all active timeouts are kept in a priority queue and the
+    thread sleeps until the nearest deadline. Starting and finishing a timeout
+    only adds it to the queue or marks it finished, so there is no per-call
+    cost of starting threads or installing signal handlers, and any number
+    of timeouts in any number of threads can be active at the same time.
+
+    The thread is started when the first timeout is added and it is
+    a daemon thread so it does not prevent the process from exiting.
+    """
+
+    def __init__(self):
+        self._condition = Condition()
+        self._queue = []
+        self._counter = count()
+        self._finished = 0
+        self._thread = None
+
+    def add(self, timeout):
+        with self._condition:
+            heapq.heappush(self._queue, (timeout.deadline, next(self._counter), timeout))
+            if not (self._thread and self._thread.is_alive()):
+                self._thread = Thread(target=self._run, name='RobotTimeoutWatchdog',
+                                      daemon=True)
+                self._thread.start()
+            elif self._queue[0][-1] is timeout:
+                self._condition.notify()
+
+    def finish(self, timeout):
+        """Marks the timeout finished and returns did it occur."""
+        with self._condition:
+            timeout.finished = True
+            if not timeout.occurred:
+                self._finished += 1
+                # Finished timeouts are removed lazily. Rebuild the queue if
+                # they are the majority to avoid it growing with long timeouts.
+                if self._finished > len(self._queue) // 2:
+                    self._queue = [item for item in self._queue
+                                   if not item[-1].finished]
+                    heapq.heapify(self._queue)
+                    self._finished = 0
+            return timeout.occurred
+
+    def _run(self):
+        with self._condition:
+            while True:
+                while self._queue and self._queue[0][-1].finished:
+                    heapq.heappop(self._queue)
+                    self._finished -= 1
+                if not self._queue:
+                    self._condition.wait()
+                    continue
+                deadline, _, timeout = self._queue[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                heapq.heappop(self._queue)
+                timeout.occurred = True
+                timeout.raise_timeout()
+
+
+WATCHDOG = Watchdog()
+
+
+class Timeout:
+    """Timeout implementation using the shared :class:`Watchdog` thread.
+
+    Works in any thread, but like with the thread based timeouts on Windows,
+    the timeout error is raised only when the timed code executes Python
+    code. Blocking calls like long sleeps are thus not interrupted.
+    """
+
+    def __init__(self, timeout, error):
+        self._timeout = timeout
+        self._error = error
+        self._runner_thread_id = None
+        self.deadline = None
+        self.finished = False
+        self.occurred = False
+
+    def execute(self, runnable):
+        self._runner_thread_id = get_ident()
+        self.deadline = time.monotonic() + self._timeout
+        WATCHDOG.add(self)
+        try:
+            try:
+                result = runnable()
+            finally:
+                occurred = WATCHDOG.finish(self)
+            if occurred:
+                self._wait_for_raised_timeout()
+            return result
+        finally:
+            if self.occurred:
+                raise self._error
+
+    def _wait_for_raised_timeout(self):
+        while True:
+            time.sleep(0)
+
+    def raise_timeout(self):
+        # See, for example, http://tomerfiliba.com/recipes/Thread2/
+        # for more information about using PyThreadState_SetAsyncExc
+        tid = ctypes.c_long(self._runner_thread_id)
+        error = ctypes.py_object(type(self._error))
+        while ctypes.pythonapi.PyThreadState_SetAsyncExc(tid, error) > 1:
+            ctypes.pythonapi.PyThreadState_SetAsyncExc(tid, None)
+            time.sleep(0)
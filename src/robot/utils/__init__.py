@@ -51,7 +51,8 @@ from .importer import Importer
 from .match import eq, Matcher, MultiMatcher
 from .misc import (isatty, plural_or_not, printable_name, roundup, seq2str, seq2str2,
                    test_or_task)
-from .normalizing import normalize, normalize_whitespace, NormalizedDict
+from .normalizing import (normalize, normalize_whitespace, ChainedNormalizedDict,
+                          NormalizedDict)
 from .platform import PY_VERSION, PYPY, UNIXY, WINDOWS, RERAISED_EXCEPTIONS
 from .recommendations import RecommendationFinder
 from .robotenv import get_env_var, set_env_var, del_env_var, get_env_vars
@@ -59,8 +60,9 @@ from .robotinspect import is_init
 from .robotio import binary_file_writer, create_destination_directory, file_writer
 from .robotpath import abspath, find_file, get_link_path, normpath
 from .robottime import (elapsed_time_to_string, format_time, get_elapsed_time,
-                        get_time, get_timestamp, secs_to_timestamp,
-                        secs_to_timestr, timestamp_to_secs, timestr_to_secs,
+                        get_epoch_millis, get_time, get_timestamp,
+                        millis_to_timestamp, secs_to_timestamp, secs_to_timestr,
+                        timestamp_to_millis, timestamp_to_secs, timestr_to_secs,
                         parse_time)
 from .robottypes import (FALSE_STRINGS, TRUE_STRINGS, is_bytes, is_dict_like, is_falsy,
                          is_integer, is_list_like, is_number, is_pathlike, is_string,
@@ -13,6 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import gzip
 from io import BytesIO
 from os import fsdecode
 import re
@@ -39,13 +40,23 @@ class ETSource:
         return self._opened or self._source
 
     def _open_if_necessary(self, source):
-        if self._is_path(source) or self._is_already_open(source):
+        if self._is_path(source):
+            return self._open_if_compressed(source)
+        if self._is_already_open(source):
             return None
         if is_bytes(source):
             return BytesIO(source)
         encoding = self._find_encoding(source)
         return BytesIO(source.encode(encoding))
 
+    def _open_if_compressed(self, path):
+        try:
+            with open(path, 'rb') as file:
+                compressed = file.read(2) == b'\x1f\x8b'
+        except OSError:
+            return None
+        return gzip.open(path, 'rb') if compressed else None
+
     def _is_path(self, source):
         if is_pathlike(source):
             return True
@@ -81,7 +81,7 @@ class FileReader:
 
     def readlines(self):
         first_line = True
-        for line in self.file.readlines():
+        for line in self.file:
             yield self._decode(line, remove_bom=first_line)
             first_line = False
 
@@ -14,6 +14,7 @@
 #  limitations under the License.
 
 from collections.abc import MutableMapping
+from functools import partial
 import re
 
 from .robottypes import is_dict_like, is_string
@@ -60,7 +61,8 @@ class NormalizedDict(MutableMapping):
         """
         self._data = {}
         self._keys = {}
-        self._normalize = lambda s: normalize(s, ignore, caseless, spaceless)
+        self._normalize = partial(normalize, ignore=ignore, caseless=caseless,
+                                  spaceless=spaceless)
         if initial:
             self._add_initial(initial)
 
@@ -113,3 +115,75 @@ class NormalizedDict(MutableMapping):
     def clear(self):
         self._data.clear()
         self._keys.clear()
+
+
+class ChainedNormalizedDict(NormalizedDict):
+    """Normalized dictionary storing its changes on top of a parent dictionary.
+
+    Items are looked up first from the dictionary itself and then from the
+    parent. Setting and removing items never modifies the parent, but changes
+    to the parent are visible unless items have been set or removed locally.
+    Avoids copying the parent when only few items are changed.
+
+    The parent must be a normal :class:`NormalizedDict` and its normalization
+    spec is used also by this dictionary.
+    """
+
+    def __init__(self, parent):
+        NormalizedDict.__init__(self)
+        self._normalize = parent._normalize
+        self._parent = parent
+        self._removed = set()
+
+    def __getitem__(self, key):
+        norm_key = self._normalize(key)
+        if norm_key in self._data:
+            return self._data[norm_key]
+        if norm_key in self._removed:
+            raise KeyError(norm_key)
+        return self._parent._data[norm_key]
+
+    def __delitem__(self, key):
+        norm_key = self._normalize(key)
+        if norm_key in self._data:
+            del self._data[norm_key]
+            del self._keys[norm_key]
+        elif norm_key in self._removed or norm_key not in self._parent._data:
+            raise KeyError(norm_key)
+        self._removed.add(norm_key)
+
+    def _get_keys(self):
+        keys = {norm_key: key for norm_key, key in self._parent._keys.items()
+                if norm_key not in self._removed}
+        for norm_key, key in self._keys.items():
+            keys.setdefault(norm_key, key)
+        return keys
+
+    def __iter__(self):
+        keys = self._get_keys()
+        return (keys[norm_key] for norm_key in sorted(keys))
+
+    def __len__(self):
+        return len(self._get_keys())
+
+    def __eq__(self, other):
+        return self.copy() == other
+
+    def copy(self):
+        """Returns a normal :class:`NormalizedDict` containing all items."""
+        copy = NormalizedDict()
+        copy._keys = self._get_keys()
+        copy._data = {norm_key: self._data[norm_key] if norm_key in self._data
+                      else self._parent._data[norm_key] for norm_key in copy._keys}
+        copy._normalize = self._normalize
+        return copy
+
+    def __contains__(self, key):
+        norm_key = self._normalize(key)
+        if norm_key in self._data:
+            return True
+        return norm_key not in self._removed and norm_key in self._parent._data
+
+    def clear(self):
+        NormalizedDict.clear(self)
+        self._removed.update(self._parent._data)
@@ -13,6 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import gzip
 import io
 import os.path
 
@@ -22,20 +23,39 @@ from .error import get_error_message
 from .robottypes import is_pathlike
 
 
-def file_writer(path=None, encoding='UTF-8', newline=None, usage=None):
+def file_writer(path=None, encoding='UTF-8', newline=None, usage=None,
+                buffer_size=-1):
+    """Opens a text file for writing.
+
+    If the ``path`` has a ``.gz`` extension, the written data is compressed
+    using gzip. ``buffer_size`` is the size of the write buffer in bytes.
+    By default the system default buffer size is used.
+    """
     if not path:
         return io.StringIO(newline=newline)
     if is_pathlike(path):
         path = str(path)
     create_destination_directory(path, usage)
     try:
-        return io.open(path, 'w', encoding=encoding, newline=newline)
+        if path.lower().endswith('.gz'):
+            return _gzip_file_writer(path, encoding, newline, buffer_size)
+        return io.open(path, 'w', buffering=buffer_size, encoding=encoding,
+                       newline=newline)
     except EnvironmentError:
         usage = '%s file' % usage if usage else 'file'
         raise DataError("Opening %s '%s' failed: %s"
                         % (usage, path, get_error_message()))
 
 
+def _gzip_file_writer(path, encoding, newline, buffer_size):
+    # Compression level 6 is the zlib default. The gzip module uses 9 by
+    # default, which is a lot slower and compresses only marginally better.
+    compressed = gzip.GzipFile(path, 'wb', compresslevel=6)
+    if buffer_size > 0:
+        compressed = io.BufferedWriter(compressed, buffer_size)
+    return io.TextIOWrapper(compressed, encoding=encoding, newline=newline)
+
+
 def binary_file_writer(path=None):
     if path:
         if is_pathlike(path):
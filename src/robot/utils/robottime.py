@@ -322,6 +322,29 @@ def timestamp_to_secs(timestamp, seps=None):
         return roundup(secs, 3)
 
 
+def get_epoch_millis():
+    """Returns the current time as milliseconds after the epoch."""
+    return TIMESTAMP_CACHE.get_epoch_millis()
+
+
+def timestamp_to_millis(timestamp):
+    """Converts timestamp in format ``YYYYMMDD hh:mm:ss.mil`` to epoch millis.
+
+    Optimized for converting lots of timestamps that are close to each other.
+    Also timestamps without millis or with more precision are accepted, and
+    ``'N/A'`` is converted to ``None``.
+    """
+    return TIMESTAMP_MILLIS_CACHE.timestamp_to_millis(timestamp)
+
+
+def millis_to_timestamp(millis):
+    """Converts epoch millis to timestamp in format ``YYYYMMDD hh:mm:ss.mil``.
+
+    Optimized for converting lots of times that are close to each other.
+    """
+    return TIMESTAMP_MILLIS_CACHE.millis_to_timestamp(millis)
+
+
 def secs_to_timestamp(secs, seps=None, millis=False):
     if not seps:
         seps = ('', ' ', ':', '.' if millis else None)
@@ -416,6 +439,10 @@ class TimestampCache:
         self._cache_timestamp(secs, timestamp, daysep, daytimesep, timesep, millissep)
         return timestamp
 
+    def get_epoch_millis(self):
+        secs, millis = _float_secs_to_secs_and_millis(self._get_epoch())
+        return secs * 1000 + millis
+
     # Seam for mocking
     def _get_epoch(self):
         return time.time()
@@ -437,3 +464,73 @@ class TimestampCache:
 
 
 TIMESTAMP_CACHE = TimestampCache()
+
+
+class TimestampMillisCache:
+    """Caches the expensive parts of conversions between timestamps and millis.
+
+    The epoch time of the start of each hour is cached when converting
+    timestamps to millis. Hours during which the local time offset changes
+    are not cached. When converting millis to timestamps, the timestamp of
+    the previous second is reused.
+    """
+
+    def __init__(self):
+        self._hours = {}
+        self._previous = (None, None)
+
+    def timestamp_to_millis(self, timestamp):
+        if timestamp == 'N/A':
+            return None
+        if not self._has_default_format(timestamp):
+            return self._parse_timestamp(timestamp)
+        hour = timestamp[:11]
+        try:
+            base = self._hours[hour]
+        except KeyError:
+            try:
+                base = self._get_hour_start(hour)
+            except (ValueError, OverflowError):
+                return self._parse_timestamp(timestamp)
+            self._hours[hour] = base
+        try:
+            if base is None:
+                return _timestamp_to_millis(timestamp)
+            return (base + int(timestamp[12:14]) * 60000
+                    + int(timestamp[15:17]) * 1000 + int(timestamp[18:21]))
+        except (ValueError, OverflowError):
+            raise ValueError("Invalid timestamp '%s'." % timestamp)
+
+    def _has_default_format(self, timestamp):
+        return (len(timestamp) == 21 and timestamp[8] == ' ' and timestamp[11] == ':'
+                and timestamp[14] == ':' and timestamp[17] == '.')
+
+    def _parse_timestamp(self, timestamp):
+        # Other formats accepted by `timestamp_to_secs` like timestamps
+        # without millis or with micros. Not cached because they are rare.
+        try:
+            return _timestamp_to_millis(timestamp, seps=(' ', ':', '.', '-', '_'))
+        except (ValueError, OverflowError):
+            raise ValueError("Invalid timestamp '%s'." % timestamp)
+
+    def _get_hour_start(self, hour):
+        millis = _timestamp_to_millis(hour + ':00:00.000')
+        secs = millis // 1000
+        expected = int(hour[9:11])
+        if (time.localtime(secs)[3:6] != (expected, 0, 0)
+                or time.localtime(secs + 3599)[3:6] != (expected, 59, 59)
+                or time.localtime(secs - 1)[3] == expected
+                or time.localtime(secs + 3600)[3] == expected):
+            return None
+        return millis
+
+    def millis_to_timestamp(self, millis):
+        secs, millis = divmod(millis, 1000)
+        previous_secs, timestamp = self._previous
+        if secs != previous_secs:
+            timestamp = format_time(time.localtime(secs)[:6])
+            self._previous = (secs, timestamp)
+        return '%s.%03d' % (timestamp, millis)
+
+
+TIMESTAMP_MILLIS_CACHE = TimestampMillisCache()
@@ -64,7 +64,9 @@ class StoredFinder:
         self._store = store
 
     def find(self, name):
-        return self._store.get(name, NOT_FOUND)
+        # Names come from already found variables and validating them again
+        # is not needed. Invalid names cannot exist in the store anyway.
+        return self._store.get(name[2:-1], NOT_FOUND, decorated=False)
 
 
 class NumberFinder:
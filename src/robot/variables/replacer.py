@@ -19,7 +19,7 @@ from robot.utils import (DotDict, escape, get_error_message, is_dict_like, is_li
                          is_string, safe_str, type_name, unescape)
 
 from .finders import VariableFinder
-from .search import VariableMatch, search_variable
+from .search import VariableMatch, get_variable_template, search_variable
 
 
 class VariableReplacer:
@@ -62,6 +62,15 @@ class VariableReplacer:
                 yield value
 
     def _replace_list_item(self, item, ignore_errors):
+        template = self._get_template(item, ignore_errors)
+        if template:
+            if not template.is_variable:
+                return [self._replace_template(template, unescape, ignore_errors)]
+            match = template.first_match()
+            value = self._get_variable_value(match, ignore_errors)
+            if match.is_list_variable() and is_list_like(value):
+                return value
+            return [value]
         match = search_variable(item, ignore_errors=ignore_errors)
         if not match:
             return [unescape(match.string)]
@@ -77,11 +86,23 @@ class VariableReplacer:
         its value is returned. Otherwise possible variables are replaced with
         'replace_string'. Result may be any object.
         """
+        template = self._get_template(item, ignore_errors)
+        if template:
+            if template.is_variable:
+                return self._get_variable_value(template.first_match(), ignore_errors)
+            return self._replace_template(template, unescape, ignore_errors)
         match = self._search_variable(item, ignore_errors=ignore_errors)
         if not match:
             return unescape(match.string)
         return self._replace_scalar(match, ignore_errors)
 
+    def _get_template(self, item, ignore_errors):
+        # Templates are cached only for strings possibly containing variables
+        # to avoid filling the cache with all kind of values created at run time.
+        if is_string(item) and '{' in item:
+            return get_variable_template(item, ignore_errors)
+        return None
+
     def _search_variable(self, item, ignore_errors):
         if isinstance(item, VariableMatch):
             return item
@@ -97,7 +118,10 @@ class VariableReplacer:
 
         Input can also be an already found VariableMatch.
         """
+        template = self._get_template(item, ignore_errors)
         unescaper = custom_unescaper or unescape
+        if template:
+            return self._replace_template(template, unescaper, ignore_errors)
         match = self._search_variable(item, ignore_errors=ignore_errors)
         if not match:
             return safe_str(unescaper(match.string))
@@ -114,6 +138,16 @@ class VariableReplacer:
         parts.append(unescaper(match.string))
         return ''.join(parts)
 
+    def _replace_template(self, template, unescaper, ignore_errors):
+        parts = []
+        for before, match in template.matches(unescaper):
+            parts.extend([
+                before,
+                safe_str(self._get_variable_value(match, ignore_errors))
+            ])
+        parts.append(template.tail(unescaper))
+        return ''.join(parts)
+
     def _get_variable_value(self, match, ignore_errors):
         match.resolve_base(self, ignore_errors)
         # TODO: Do we anymore need to reserve `*{var}` syntax for anything?
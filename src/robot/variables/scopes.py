@@ -76,7 +76,10 @@ class VariableScopes:
         self._variables_set.end_test()
 
     def start_keyword(self):
-        kw = self._suite.copy()
+        # Keyword scopes store only their own variables on top of the suite
+        # scope. Changes to suite variables are done to all scopes until the
+        # suite anyway, so copying the whole suite scope is not needed.
+        kw = self._suite.copy(chained=True)
         self._variables_set.start_keyword()
         self._variables_set.update(kw)
         self._scopes.append(kw)
@@ -16,7 +16,7 @@
 import re
 
 from robot.errors import VariableError
-from robot.utils import is_string
+from robot.utils import is_string, unescape
 
 
 def search_variable(string, identifiers='$@&%*', ignore_errors=False):
@@ -80,7 +80,8 @@ class VariableMatch:
         self.end = end
 
     def resolve_base(self, variables, ignore_errors=False):
-        if self.identifier:
+        # Base can only change if it contains variables or escapes.
+        if self.identifier and ('{' in self.base or '\\' in self.base):
             internal = search_variable(self.base)
             self.base = variables.replace_string(
                 internal,
@@ -160,7 +161,17 @@ class VariableSearcher:
         self._escaped = False
 
     def search(self, string):
-        if not self._search(string):
+        start = self._find_variable_start(string)
+        if start == -1:
+            return VariableMatch(string)
+        end = self._find_simple_variable_end(string, start)
+        if end != -1:
+            return VariableMatch(string=string,
+                                 identifier=string[start],
+                                 base=string[start+2:end-1],
+                                 start=start,
+                                 end=end)
+        if not self._search(string, start):
             return VariableMatch(string)
         match = VariableMatch(string=string,
                               identifier=self.variable_chars[0],
@@ -172,10 +183,20 @@ class VariableSearcher:
             match.end += sum(len(i) for i in self.items) + 2 * len(self.items)
         return match
 
-    def _search(self, string):
-        start = self._find_variable_start(string)
-        if start == -1:
-            return False
+    def _find_simple_variable_end(self, string, start):
+        # Fast path for the common case of variables without nested variables,
+        # escapes or items. Others are handled by the state machine below.
+        end = string.find('}', start + 2) + 1
+        if not end:
+            return -1
+        base = string[start+2:end-1]
+        if '{' in base or '\\' in base:
+            return -1
+        if string[end:end+1] == '[' and string[start] in '$@&':
+            return -1
+        return end
+
+    def _search(self, string, start):
         self.start = start
         self._open_brackets += 1
         self.variable_chars = [string[start], '{']
@@ -262,6 +283,78 @@ class VariableSearcher:
                                 "properly." % (variable, items, incomplete))
 
 
+def get_variable_template(string, ignore_errors=False):
+    """Returns a cached :class:`VariableTemplate` for the given string.
+
+    Returns ``None`` if the string contains invalid variable syntax. Callers
+    should then use :func:`search_variable` to get the same error as earlier.
+    """
+    cache = _templates[ignore_errors]
+    try:
+        return cache[string]
+    except KeyError:
+        pass
+    try:
+        template = VariableTemplate(string, ignore_errors)
+    except VariableError:
+        return None
+    if len(cache) >= _TEMPLATE_CACHE_SIZE:
+        cache.clear()
+    cache[string] = template
+    return template
+
+
+_TEMPLATE_CACHE_SIZE = 10000
+_templates = {True: {}, False: {}}
+
+
+class VariableTemplate:
+    """String parsed into literal parts and variables between them.
+
+    Strings like keyword arguments are used repeatedly, for example, inside
+    loops. Parsing them once and caching the result with
+    :func:`get_variable_template` avoids searching variables every time.
+    Templates are never modified and :meth:`matches` returns new
+    :class:`VariableMatch` objects that can be resolved freely.
+
+    Literal parts are unescaped with :func:`robot.utils.unescape` only once.
+    Other unescapers are called every time.
+    """
+    __slots__ = ['string', 'is_variable', '_parts', '_tail']
+
+    def __init__(self, string, ignore_errors=False):
+        self.string = string
+        parts = []
+        match = search_variable(string, ignore_errors=ignore_errors)
+        while match:
+            parts.append((match.before, unescape(match.before),
+                          (match.string, match.identifier, match.base,
+                           match.items, match.start, match.end)))
+            match = search_variable(match.after, ignore_errors=ignore_errors)
+        self._parts = tuple(parts)
+        self._tail = (match.string, unescape(match.string))
+        self.is_variable = len(parts) == 1 and self.first_match().is_variable()
+
+    @property
+    def has_variables(self):
+        return bool(self._parts)
+
+    def first_match(self):
+        return VariableMatch(*self._parts[0][2])
+
+    def matches(self, unescaper=unescape):
+        """Yields ``(before, match)`` tuples with ``before`` unescaped."""
+        for before, unescaped, match in self._parts:
+            if unescaper is not unescape:
+                unescaped = unescaper(before)
+            yield unescaped, VariableMatch(*match)
+
+    def tail(self, unescaper=unescape):
+        """Returns the unescaped literal part after the last variable."""
+        tail, unescaped = self._tail
+        return unescaped if unescaper is unescape else unescaper(tail)
+
+
 def unescape_variable_syntax(item):
 
     def handle_escapes(match):
@@ -13,7 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from robot.utils import is_list_like, type_name
+from robot.utils import ChainedNormalizedDict, is_list_like, type_name
 
 from .filesetter import VariableFileSetter
 from .replacer import VariableReplacer
@@ -68,9 +68,18 @@ class Variables:
     def clear(self):
         self.store.clear()
 
-    def copy(self):
+    def copy(self, chained=False):
+        """Returns a copy of these variables.
+
+        If ``chained`` is true, the copy contains only its own changes and
+        gets other variables from these variables. Changes to these variables
+        are thus visible in the copy unless they have been overridden.
+        """
         variables = Variables()
-        variables.store.data = self.store.data.copy()
+        if chained:
+            variables.store.data = ChainedNormalizedDict(self.store.data)
+        else:
+            variables.store.data = self.store.data.copy()
         return variables
 
     def update(self, variables):
@@ -8,7 +8,7 @@ import signal
 import logging
 from io import StringIO
 from os.path import abspath, curdir, dirname, exists, join
-from os import chdir, getenv
+from os import chdir, getenv, remove
 
 from robot import run, run_cli, rebot, rebot_cli
 from robot.model import SuiteVisitor
@@ -202,6 +202,21 @@ class TestRebot(RunningTestCase):
                              stderr=[('[ ERROR ]', 1), (self.nonex, (1, 2)),
                                      ('--help', 1)])
 
+    def test_recover_truncated_output(self):
+        truncated = join(TEMP, 'truncated-output.xml')
+        with open(self.data, encoding='UTF-8') as source:
+            data = source.read()
+        with open(truncated, 'w', encoding='UTF-8') as output:
+            output.write(data[:data.index('</test>')])
+        try:
+            assert_equal(rebot(truncated, outputdir=TEMP, report='NONE',
+                               stderr=StringIO()), 252)
+            assert_equal(rebot(truncated, outputdir=TEMP, report='NONE',
+                               recover=True), 1)
+        finally:
+            remove(truncated)
+        self._assert_outputs([(LOG, 1)])
+
     def test_custom_stdout(self):
         stdout = StringIO()
         assert_equal(rebot(self.data, report='None', stdout=stdout,
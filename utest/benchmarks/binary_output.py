@@ -0,0 +1,93 @@
+"""Benchmark for reading and writing binary outputs compared to XML outputs.
+
+Creates an output with the given number of tests, each having keywords with
+arguments and messages, and saves it both as XML and in the binary format.
+Reports how long writing and reading both formats take. Parsing is also
+measured separately from building the result model, because building the
+model takes the same time regardless of the format.
+
+Usage: python binary_output.py [tests] [keywords] [rounds]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from time import perf_counter
+
+CURDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(CURDIR, '..', '..', 'src'))
+
+from robot.result import ExecutionResult, Result, TestSuite
+from robot.result.binaryformat import read_chunks
+
+
+def create_result(tests, keywords):
+    root = TestSuite(name='Root', source='/path/to/root')
+    for index in range(tests):
+        suite = root.suites[-1] if index % 100 else root.suites.create(
+            name=f'Suite {index // 100}', source=f'/path/to/suite_{index // 100}.robot')
+        test = suite.tests.create(name=f'Test {index}', tags=['a', 'b'],
+                                  status='PASS', starttime='20221012 12:00:00.000',
+                                  endtime='20221012 12:00:01.000')
+        for kw_index in range(keywords):
+            kw = test.body.create_keyword(kwname='Log', libname='BuiltIn',
+                                          args=[f'Message {kw_index}', 'INFO'],
+                                          status='PASS',
+                                          starttime='20221012 12:00:00.000',
+                                          endtime='20221012 12:00:00.100')
+            kw.body.create_message(f'Message {kw_index} of test {index}',
+                                   timestamp='20221012 12:00:00.050')
+    return Result(root_suite=root)
+
+
+def timed(func, rounds):
+    best = None
+    for _ in range(rounds):
+        start = perf_counter()
+        func()
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def parse_xml(path):
+    for event, elem in ET.iterparse(path, events=('start', 'end')):
+        if event == 'end':
+            elem.clear()
+
+
+def parse_binary(path):
+    with open(path, 'rb') as file:
+        for records in read_chunks(file):
+            pass
+
+
+def main(tests=5000, keywords=10, rounds=3):
+    directory = tempfile.mkdtemp()
+    xml = os.path.join(directory, 'output.xml')
+    binary = os.path.join(directory, 'output.bin')
+    try:
+        result = create_result(tests, keywords)
+        print(f'{tests} tests, {keywords} keywords each, best of {rounds} rounds')
+        times = {
+            'write': (timed(lambda: result.save(xml), rounds),
+                      timed(lambda: result.save(binary, binary=True), rounds)),
+            'parse': (timed(lambda: parse_xml(xml), rounds),
+                      timed(lambda: parse_binary(binary), rounds)),
+            'read': (timed(lambda: ExecutionResult(xml), rounds),
+                     timed(lambda: ExecutionResult(binary), rounds)),
+        }
+        print(f'{"":8}{"XML":>10}{"binary":>10}{"speedup":>10}')
+        print(f'{"size":8}{os.path.getsize(xml) / 1e6:9.2f}M'
+              f'{os.path.getsize(binary) / 1e6:9.2f}M')
+        for name, (xml_time, binary_time) in times.items():
+            print(f'{name:8}{xml_time:9.3f}s{binary_time:9.3f}s'
+                  f'{xml_time / binary_time:9.1f}x')
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,64 @@
+"""Benchmark for finding keywords with embedded arguments.
+
+Creates a resource with 1000 Gherkin style keywords with embedded arguments
+and measures how long it takes to find keywords by names and to check does
+the resource contain keywords. Results are compared to matching names
+against all keywords linearly.
+
+Usage: python embedded_keywords.py [keywords] [rounds]
+"""
+
+import os
+import sys
+from timeit import timeit
+
+CURDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(CURDIR, '..', '..', 'src'))
+
+from robot.running.model import ResourceFile, UserKeyword
+from robot.running.userkeyword import UserLibrary
+
+
+def create_handlers(count):
+    resource = ResourceFile(source='benchmark.resource')
+    resource.keywords = [UserKeyword(name) for i in range(count)
+                         for name in (f'Given user {i} has ${{count}} items',
+                                      f'${{user}} buys item {i}')][:count]
+    return UserLibrary(resource, UserLibrary.RESOURCE_FILE_TYPE).handlers
+
+
+def get_names(count):
+    names = [f'Given user {i} has 42 items' for i in range(0, count // 2, 10)]
+    names += [f'john buys item {i}' for i in range(0, count // 2, 10)]
+    return names
+
+
+def indexed(handlers, names):
+    for name in names:
+        handlers[name]
+        assert name in handlers
+        assert name + ' nonex' not in handlers
+
+
+def linear(handlers, names):
+    embedded = list(handlers._embedded)
+    for name in names:
+        found = [h for h in embedded if h.matches(name)]
+        assert len(found) == 1
+        assert any(h.matches(name) for h in embedded)
+        assert not any(h.matches(name + ' nonex') for h in embedded)
+
+
+def main(count=1000, rounds=10):
+    handlers = create_handlers(count)
+    names = get_names(count)
+    print(f'{count} keywords, {len(names)} names, {rounds} rounds')
+    results = {}
+    for func in indexed, linear:
+        results[func] = timeit(lambda: func(handlers, names), number=rounds)
+        print(f'{func.__name__:8} {results[func]:.3f}s')
+    print(f'speedup  {results[linear] / results[indexed]:.1f}x')
+
+
+if __name__ == '__main__':
+    main(*(int(a) for a in sys.argv[1:]))
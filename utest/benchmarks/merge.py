@@ -0,0 +1,101 @@
+"""Benchmark for merging outputs like `rebot --merge` does.
+
+Creates outputs that each contain different tests in same suites, similarly
+as outputs of sharded executions, and measures how long merging them takes
+when the number of outputs grows. Time used per test should stay the same
+regardless of the number of outputs. Results are compared to finding suites
+and tests to merge linearly.
+
+Usage: python merge.py [outputs] [tests] [processes]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from time import perf_counter
+
+CURDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(CURDIR, '..', '..', 'src'))
+
+from robot.result import Result, TestSuite, resultbuilder
+from robot.result.merger import Merger
+
+
+class LinearMerger(Merger):
+
+    def _index(self, suite):
+        return _LinearIndex(suite)
+
+
+class _LinearIndex:
+
+    def __init__(self, suite):
+        self.suites = _LinearLookup(suite.suites, lambda item: item)
+        self.tests = _LinearLookup(suite.tests, lambda item: suite.tests.index(item))
+
+
+class _LinearLookup(dict):
+
+    def __init__(self, items, value):
+        super().__init__()
+        self._items = items
+        self._value = value
+
+    def get(self, name):
+        for item in self._items:
+            if item.name == name:
+                return self._value(item)
+        return None
+
+    def __setitem__(self, name, value):
+        pass
+
+    def setdefault(self, name, value):
+        pass
+
+
+def create_outputs(directory, count, tests, suites=10):
+    paths = []
+    for index in range(count):
+        root = TestSuite(name='Root')
+        for suite in range(suites):
+            child = root.suites.create(name=f'Suite {suite}')
+            for test in range(tests // suites):
+                child.tests.create(name=f'Test {index}-{test}', status='PASS')
+        path = os.path.join(directory, f'output-{index}.xml')
+        Result(root_suite=root).save(path)
+        paths.append(path)
+    return paths
+
+
+def merge(paths, merger, processes):
+    resultbuilder.Merger = merger
+    try:
+        start = perf_counter()
+        result = resultbuilder.ExecutionResult(*paths, merge=True,
+                                               processes=processes)
+        return perf_counter() - start, result.suite.test_count
+    finally:
+        resultbuilder.Merger = Merger
+
+
+def main(outputs=64, tests=1000, processes=1):
+    directory = tempfile.mkdtemp()
+    try:
+        paths = create_outputs(directory, outputs, tests)
+        print(f'{outputs} outputs, {tests} tests each, {processes} processes')
+        for merger in Merger, LinearMerger:
+            print(merger.__name__)
+            count = max(outputs // 8, 1)
+            while count <= outputs:
+                elapsed, total = merge(paths[:count], merger, processes)
+                print(f'  {count:5} outputs {elapsed:8.3f}s '
+                      f'{elapsed / total * 1e6:8.1f}us/test')
+                count *= 2
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,74 @@
+"""Benchmark for creating tokens from test data.
+
+Tokenizes all test case and resource files in the acceptance test data and
+reports how many tokens are created per second and how much memory tokens
+take. Files are read into memory before measuring so that disk access does
+not affect results. Memory usage is measured with ``tracemalloc`` while all
+tokens are kept in memory and it includes token values.
+
+Usage: python tokens.py [rounds]
+"""
+
+import os
+import sys
+import tracemalloc
+from time import perf_counter
+
+CURDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(CURDIR, '..', '..', 'src'))
+
+from robot.api import get_resource_tokens, get_tokens
+
+
+TESTDATA = os.path.join(CURDIR, '..', '..', 'atest', 'testdata')
+
+
+def read_data():
+    data = []
+    for root, dirs, files in os.walk(TESTDATA):
+        for name in files:
+            if name.endswith(('.robot', '.resource')):
+                with open(os.path.join(root, name), 'rb') as file:
+                    content = file.read()
+                try:
+                    content = content.decode('UTF-8')
+                except UnicodeDecodeError:
+                    continue
+                resource = name.endswith('.resource')
+                data.append((content, resource))
+    return data
+
+
+def tokenize(data, data_only=False):
+    tokens = []
+    for content, resource in data:
+        getter = get_resource_tokens if resource else get_tokens
+        tokens.extend(getter(content, data_only=data_only))
+    return tokens
+
+
+def measure(data, data_only, rounds):
+    best = None
+    for _ in range(rounds):
+        start = perf_counter()
+        tokens = tokenize(data, data_only)
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    tokens = tokenize(data, data_only)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return len(tokens), best, memory
+
+
+def main(rounds=3):
+    data = read_data()
+    print(f'{len(data)} files, best of {rounds} rounds')
+    print(f'{"":12}{"tokens":>10}{"tokens/s":>12}{"bytes/token":>14}')
+    for name, data_only in ('all', False), ('data only', True):
+        count, elapsed, memory = measure(data, data_only, rounds)
+        print(f'{name:12}{count:10}{count / elapsed:12.0f}{memory / count:14.1f}')
+
+
+if __name__ == '__main__':
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,74 @@
+"""Benchmark for searching variables from strings.
+
+Compares searching variables using the fast path for simple variables to
+using only the state machine that was earlier used with all variables.
+Strings are arguments and other data values collected from the acceptance
+test data. Additionally, synthetic corpora with only simple variables and
+only variables with items or nested variables are used.
+
+Usage: python variable_search.py [rounds]
+"""
+
+import os
+import sys
+from timeit import timeit
+
+CURDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(CURDIR, '..', '..', 'src'))
+
+from robot.api import get_tokens, Token
+from robot.variables.search import VariableSearcher
+
+
+TESTDATA = os.path.join(CURDIR, '..', '..', 'atest', 'testdata')
+
+
+class StateMachineSearcher(VariableSearcher):
+
+    def _find_simple_variable_end(self, string, start):
+        return -1
+
+
+def get_testdata_corpus():
+    corpus = []
+    for root, dirs, files in os.walk(TESTDATA):
+        for name in files:
+            if name.endswith('.robot'):
+                try:
+                    tokens = get_tokens(os.path.join(root, name), data_only=True)
+                    corpus.extend(t.value for t in tokens
+                                  if t.type in (Token.ARGUMENT, Token.ASSIGN,
+                                                Token.NAME) and '{' in t.value)
+                except Exception:
+                    pass
+    return corpus
+
+
+def get_simple_corpus():
+    return [f'Value ${{var {i}}} and @{{list}} in ${{longer variable name {i}}}'
+            for i in range(1000)] + [f'${{var {i}}}' for i in range(1000)]
+
+
+def get_complex_corpus():
+    return [f'${{dict}}[key {i}][0] and ${{var_${{index}}}} and \\${{escaped}}'
+            for i in range(1000)]
+
+
+def search(searcher, corpus):
+    for string in corpus:
+        searcher('$@&%*', ignore_errors=True).search(string)
+
+
+def main(rounds=10):
+    corpora = {'test data': get_testdata_corpus(),
+               'simple': get_simple_corpus(),
+               'complex': get_complex_corpus()}
+    print(f'{"":12}{"strings":>10}{"state":>10}{"fast":>10}{"speedup":>10}')
+    for name, corpus in corpora.items():
+        slow = timeit(lambda: search(StateMachineSearcher, corpus), number=rounds)
+        fast = timeit(lambda: search(VariableSearcher, corpus), number=rounds)
+        print(f'{name:12}{len(corpus):10}{slow:9.3f}s{fast:9.3f}s{slow / fast:9.1f}x')
+
+
+if __name__ == '__main__':
+    main(*(int(a) for a in sys.argv[1:]))
@@ -1,10 +1,12 @@
+import os
+import tempfile
 from os.path import abspath, dirname, join, normpath
 import unittest
 
 from robot.conf.settings import _BaseSettings, RobotSettings, RebotSettings
 from robot.errors import DataError
 from robot.utils import WINDOWS
-from robot.utils.asserts import assert_equal, assert_true
+from robot.utils.asserts import assert_equal, assert_raises_with_msg, assert_true
 
 
 class SettingWrapper(_BaseSettings):
@@ -45,7 +47,7 @@ class TestRobotAndRebotSettings(unittest.TestCase):
         assert_equal(RebotSettings({'exclude': 'two'})['Exclude'], ['two'])
 
     def test_output_files_as_none_string(self):
-        for name in 'Output', 'Report', 'Log', 'XUnit', 'DebugFile':
+        for name in 'Output', 'Report', 'Log', 'XUnit', 'BinaryOutput', 'DebugFile':
             attr = (name[:-4] if name.endswith('File') else name).lower()
             settings = RobotSettings({name.lower(): 'NoNe'})
             assert_equal(settings[name], None)
@@ -53,13 +55,26 @@ class TestRobotAndRebotSettings(unittest.TestCase):
                 assert_equal(getattr(settings, attr), None)
 
     def test_output_files_as_none_object(self):
-        for name in 'Output', 'Report', 'Log', 'XUnit', 'DebugFile':
+        for name in 'Output', 'Report', 'Log', 'XUnit', 'BinaryOutput', 'DebugFile':
             attr = (name[:-4] if name.endswith('File') else name).lower()
             settings = RobotSettings({name.lower(): None})
             assert_equal(settings[name], None)
             if hasattr(settings, attr):
                 assert_equal(getattr(settings, attr), None)
 
+    def test_compressed_output_with_timestamp(self):
+        settings = RobotSettings(output='out.xml.gz', timestampoutputs=True,
+                                 outputdir=tempfile.gettempdir())
+        settings.start_timestamp = '20261018-123456'
+        assert_equal(os.path.basename(settings.output), 'out-20261018-123456.xml.gz')
+
+    def test_binary_output(self):
+        settings = RobotSettings(binaryoutput='out', outputdir=tempfile.gettempdir())
+        assert_equal(os.path.basename(settings.binary_output), 'out.bin')
+        assert_equal(settings.get_rebot_settings().binary_output, None)
+        assert_equal(RebotSettings(binaryoutput='x.dat').binary_output,
+                     os.path.abspath('x.dat'))
+
     def test_log_levels(self):
         self._verify_log_level('TRACE')
         self._verify_log_level('DEBUG')
@@ -117,6 +132,28 @@ class TestRobotAndRebotSettings(unittest.TestCase):
     def _verify_invalid_log_level(self, input):
         self.assertRaises(DataError, RobotSettings, {'loglevel': input})
 
+    def test_log_compression(self):
+        for cls in RobotSettings, RebotSettings:
+            assert_equal(cls().log_compression, 9)
+            assert_equal(cls(logcompression='0').log_compression, 0)
+            assert_equal(cls(logcompression=5).log_compression, 5)
+            for invalid in ('10', '-1', 'fast'):
+                self.assertRaises(DataError, cls, logcompression=invalid)
+        settings = RobotSettings(logcompression=1).get_rebot_settings()
+        assert_equal(settings.log_compression, 1)
+
+    def test_resume(self):
+        assert_equal(RobotSettings().resume, None)
+        assert_equal(RobotSettings(resume='NONE').resume, None)
+        assert_equal(RobotSettings(resume='out.xml').resume, abspath('out.xml'))
+        assert_equal(RobotSettings(journal=True).journal, True)
+
+    def test_resume_with_processes(self):
+        assert_equal(RobotSettings(resume='out.xml', processes=1).processes, 1)
+        assert_raises_with_msg(DataError, "Options '--resume' and '--processes' "
+                                          "cannot be used together.",
+                               RobotSettings, resume='out.xml', processes=2)
+
 
 if __name__ == '__main__':
     unittest.main()
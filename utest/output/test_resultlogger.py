@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+from io import StringIO
+from os.path import abspath, dirname, join
+
+from robot.conf import RobotSettings
+from robot.reporting.resultwriter import Results
+from robot.result import ExecutionResult
+from robot.running import TestSuiteBuilder
+from robot.utils.asserts import assert_equal, assert_true
+
+
+CURDIR = dirname(abspath(__file__))
+DATADIR = join(dirname(dirname(CURDIR)), 'atest', 'testdata', 'misc')
+
+
+def structure(item):
+    if getattr(item, 'type', None) == 'MESSAGE':
+        return (item.level, item.message, item.html)
+    children = list(item.body)
+    if getattr(item, 'has_setup', False):
+        children.insert(0, item.setup)
+    if getattr(item, 'has_teardown', False):
+        children.append(item.teardown)
+    name = getattr(item, 'kwname', getattr(item, 'name', ''))
+    return (getattr(item, 'type', None), name, item.doc, item.status,
+            [structure(child) for child in children])
+
+
+def suite_structure(suite):
+    return (suite.name,
+            [structure(kw) for kw in (suite.setup, suite.teardown) if kw],
+            [(test.name, structure(test)) for test in suite.tests],
+            [suite_structure(child) for child in suite.suites])
+
+
+class TestResultLogger(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.output = tempfile.mkstemp(suffix='.xml')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.output)
+
+    def _run(self, *paths, **options):
+        suite = TestSuiteBuilder().build(*[join(DATADIR, p) for p in paths])
+        settings = RobotSettings(output=self.output, log=None, report=None,
+                                 console='none', stdout=StringIO(),
+                                 stderr=StringIO(), resultsinmemory=True,
+                                 **options)
+        in_memory = suite.run(settings)
+        from_xml = ExecutionResult(self.output,
+                                   flattened_keywords=settings.flatten_keywords)
+        return in_memory, from_xml
+
+    def _verify(self, in_memory, from_xml):
+        assert_equal(suite_structure(in_memory.suite),
+                     suite_structure(from_xml.suite))
+        assert_equal([(e.level, e.message) for e in in_memory.errors],
+                     [(e.level, e.message) for e in from_xml.errors])
+        assert_equal(in_memory.source, self.output)
+
+    def test_keywords_and_messages_are_added_to_result(self):
+        in_memory, from_xml = self._run('normal.robot', 'for_loops.robot',
+                                        'if_else.robot', 'try_except.robot',
+                                        'while.robot', 'warnings_and_errors.robot')
+        test = in_memory.suite.suites[0].tests[0]
+        assert_true(test.body[0].body[0].message)
+        assert_true(in_memory.errors.messages)
+        self._verify(in_memory, from_xml)
+
+    def test_log_level(self):
+        self._verify(*self._run('normal.robot', 'pass_and_fail.robot',
+                                loglevel='TRACE'))
+        self._verify(*self._run('normal.robot', 'pass_and_fail.robot',
+                                loglevel='WARN'))
+
+    def test_flatten_keywords(self):
+        for flatten in ['for', 'while', 'iteration', 'name:*', 'name:BuiltIn.Log']:
+            in_memory, from_xml = self._run('for_loops.robot', 'while.robot',
+                                            'normal.robot', flattenkeywords=[flatten])
+            self._verify(in_memory, from_xml)
+
+    def test_results_from_memory(self):
+        in_memory, from_xml = self._run('normal.robot', 'pass_and_fail.robot',
+                                        removekeywords=['passed'])
+        settings = RobotSettings(removekeywords=['passed']).get_rebot_settings()
+        results = Results(settings, in_memory, prune_input=True)
+        assert_true(results.result is in_memory)
+        assert_true(in_memory.suite.suites[0].tests[0].body[0].doc.endswith(
+            '_Keyword data removed using --RemoveKeywords option._'))
+        expected = suite_structure(in_memory.suite)
+        assert_true(results.js_result)
+        assert_true(results.result is not in_memory)
+        assert_equal(suite_structure(results.result.suite), expected)
+        results.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
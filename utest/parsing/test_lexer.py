@@ -1,7 +1,7 @@
 import os
 import unittest
 import tempfile
-from io import StringIO
+from io import BytesIO, StringIO
 from pathlib import Path
 
 from robot.utils.asserts import assert_equal
@@ -1512,6 +1512,11 @@ Example
         self._verify(self.data)
         self._verify(self.data, data_only=True)
 
+    def test_bytes_io_with_bom_and_crlf(self):
+        data = b'\xef\xbb\xbf' + self.data.replace('\n', '\r\n').encode('UTF-8')
+        self._verify(BytesIO(data))
+        self._verify(BytesIO(data), data_only=True)
+
     def _verify(self, source, data_only=False):
         expected = self.data_tokens if data_only else self.tokens
         assert_tokens(source, expected, data_only=data_only)
@@ -0,0 +1,110 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from robot.parsing import get_init_model, get_model, get_resource_model
+from robot.parsing.parser import ParseCache
+from robot.running import TestSuiteBuilder
+from robot.utils.asserts import assert_equal, assert_true
+
+from parsing_test_utils import assert_model
+
+
+DATA = '''\
+*** Settings ***
+Documentation    Example in ${CURDIR}
+
+*** Test Cases ***
+Example
+    Keyword    ${CURDIR}
+    FOR    ${x}    IN    a    b
+        Log    ${x}
+    END
+
+*** Keywords ***
+Keyword
+    [Arguments]    ${arg}
+    Log    ${arg}
+'''
+
+
+class TestParseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = Path(tempfile.mkdtemp())
+        self.path = self.tempdir / 'example.robot'
+        self.path.write_text(DATA, encoding='UTF-8')
+        self.cache = ParseCache(self.tempdir / 'cache')
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_model_is_same_as_without_cache(self):
+        for cached, uncached in [(self.cache.get_model, get_model),
+                                 (self.cache.get_resource_model, get_resource_model),
+                                 (self.cache.get_init_model, get_init_model)]:
+            expected = uncached(self.path, data_only=True, curdir='/dir')
+            assert_model(cached(self.path, '/dir'), expected, source=str(self.path))
+            assert_model(cached(self.path, '/dir'), expected, source=str(self.path))
+        assert_equal(len(self._entries()), 3)
+
+    def test_curdir_is_not_part_of_cached_data(self):
+        self.cache.get_model(self.path, '/first')
+        model = self.cache.get_model(self.path, '/second')
+        expected = get_model(self.path, data_only=True, curdir='/second')
+        assert_model(model, expected, source=str(self.path))
+        assert_equal(len(self._entries()), 1)
+
+    def test_modified_file_is_parsed_again(self):
+        self.cache.get_model(self.path)
+        self.path.write_text(DATA.replace('Example', 'Modified'), encoding='UTF-8')
+        model = self.cache.get_model(self.path)
+        assert_equal(model.sections[1].body[0].name, 'Modified')
+
+    def test_file_with_same_size_and_new_mtime_is_parsed_again(self):
+        self.cache.get_model(self.path)
+        self.path.write_text(DATA.replace('Example', 'Changed'), encoding='UTF-8')
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        model = self.cache.get_model(self.path)
+        assert_equal(model.sections[1].body[0].name, 'Changed')
+
+    def test_touched_file_uses_cache(self):
+        self.cache.get_model(self.path)
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.cache.get_model(self.path, data=self._fail)
+
+    def test_data_is_read_only_when_cache_is_not_valid(self):
+        read = []
+        self.cache.get_model(self.path, data=lambda: read.append(1) or DATA)
+        self.cache.get_model(self.path, data=self._fail)
+        assert_equal(read, [1])
+
+    def test_invalid_cache_entry_is_ignored(self):
+        self.cache.get_model(self.path)
+        for entry in self._entries():
+            entry.write_bytes(b'invalid')
+        model = self.cache.get_model(self.path)
+        assert_equal(model.sections[1].body[0].name, 'Example')
+
+    def test_suite_builder(self):
+        for _ in range(2):
+            suite = TestSuiteBuilder(parse_cache=self.tempdir / 'cache').build(self.path)
+            assert_equal(suite.doc, f'Example in {self.tempdir}')
+            assert_equal(suite.tests[0].body[0].args, (str(self.tempdir),))
+            assert_equal(suite.resource.keywords[0].name, 'Keyword')
+        assert_true(self._entries())
+
+    def _entries(self):
+        return [path for path in (self.tempdir / 'cache').iterdir()
+                if path.suffix == '.pickle']
+
+    def _fail(self):
+        raise AssertionError('Data should not have been read.')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
+from io import StringIO
 
-from robot.utils.asserts import assert_equal
+from robot.utils.asserts import assert_equal, assert_true
 
 from robot.parsing.lexer.tokenizer import Tokenizer
 from robot.parsing.lexer.tokens import Token
@@ -783,5 +784,36 @@ class TestComments(unittest.TestCase):
                       (EOL, '', 1, 17)])
 
 
+class TestTokenizeLines(unittest.TestCase):
+
+    def test_lines_are_tokenized_like_string(self):
+        data = ('*** Test Cases ***\nName\tKeyword  arg\n    ...    cont\r\n'
+                '| Pipes | here |\rform\x0cfeed\n\n  # comment\nlast    line')
+        lines = StringIO(data, newline='')
+        for data_only in True, False:
+            expected = list(Tokenizer().tokenize(data, data_only))
+            lines.seek(0)
+            actual = list(Tokenizer().tokenize(lines, data_only))
+            assert_equal([[repr(t) for t in s] for s in actual],
+                         [[repr(t) for t in s] for s in expected])
+
+    def test_values_are_interned(self):
+        data = 'Keyword    argument\nKeyword    argument\n'
+        first, second = Tokenizer().tokenize(data)
+        for t1, t2 in zip(first, second):
+            assert_equal(t1.value, t2.value)
+            assert_true(t1.value is t2.value, t1)
+
+    def test_lines_are_consumed_lazily(self):
+        def lines():
+            yield 'first    statement\n'
+            yield '...    continues\n'
+            yield 'second\n'
+            raise AssertionError('Should not be read.')
+        statements = Tokenizer().tokenize(lines(), data_only=True)
+        assert_equal([t.value for t in next(statements)],
+                     ['first', 'statement', 'continues'])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+
+from robot.parsing import (get_model, get_resource_model, update_model,
+                           update_resource_model)
+from robot.utils.asserts import assert_equal, assert_raises, assert_true
+
+from parsing_test_utils import assert_model
+
+
+DATA = '''\
+*** Settings ***
+Documentation    Example
+
+*** Test Cases ***
+First
+    Log    1
+
+Second
+    Log    2
+    FOR    ${x}    IN    a    b
+        Log    ${x}
+    END
+
+Third
+    Log    3
+
+*** Keywords ***
+Keyword
+    Log    keyword
+'''
+
+
+def edit(data, start_line, end_line, text):
+    lines = data.splitlines(True)
+    return ''.join(lines[:start_line-1] + text.splitlines(True) + lines[end_line:])
+
+
+class TestUpdateModel(unittest.TestCase):
+
+    def _verify(self, start_line, end_line, text, data=DATA, getter=get_model,
+                updater=update_model):
+        model = getter(data)
+        updated = updater(model, start_line, end_line, text)
+        assert_true(updated is model)
+        assert_model(model, getter(edit(data, start_line, end_line, text)))
+        return model
+
+    def test_edit_test(self):
+        model = get_model(DATA)
+        first, second, third = model.sections[1].body
+        keyword = model.sections[2].body[0]
+        update_model(model, 9, 9, '    Log    edited\n    Log    added\n')
+        assert_model(model, get_model(edit(DATA, 9, 9, '    Log    edited\n'
+                                                       '    Log    added\n')))
+        # The preceding test is parsed again and following nodes are reused.
+        tests = model.sections[1].body
+        assert_true(tests[0] is not first)
+        assert_true(tests[1] is not second)
+        assert_true(tests[2] is third)
+        assert_true(model.sections[2].body[0] is keyword)
+        assert_equal(third.lineno, 15)
+        assert_equal(keyword.lineno, 19)
+
+    def test_insert_and_remove_lines(self):
+        self._verify(7, 6, 'New\n    Log    new\n\n')
+        self._verify(14, 16, '')
+        self._verify(20, 19, '    Log    at end\n')
+
+    def test_edit_making_test_continue_previous_one(self):
+        self._verify(8, 8, '    Log    no longer a test\n')
+        self._verify(5, 5, '    Log    no name\n')
+
+    def test_edit_creating_new_test(self):
+        self._verify(10, 10, 'New test\n')
+
+    def test_unclosed_block(self):
+        self._verify(12, 12, '')
+
+    def test_continuation_after_header(self):
+        self._verify(5, 4, '...    continues header\n')
+
+    def test_edit_settings(self):
+        self._verify(2, 2, 'Documentation    Changed\nForce Tags    tag\n')
+
+    def test_template_change_affects_tests(self):
+        self._verify(2, 2, 'Test Template    Log\n')
+
+    def test_edit_creating_new_section(self):
+        self._verify(16, 16, '*** Variables ***\n${X}    1\n')
+
+    def test_edit_header(self):
+        self._verify(17, 17, '*** Test Cases ***\n')
+
+    def test_resource_file(self):
+        data = '*** Keywords ***\nKeyword\n    Log    x\n'
+        self._verify(3, 3, '    [Return]    x\n', data,
+                     get_resource_model, update_resource_model)
+
+    def test_invalid_range(self):
+        model = get_model(DATA)
+        for start, end in [(0, 1), (2, 0), (20, 20), (22, 21)]:
+            assert_raises(ValueError, update_model, model, start, end, '')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@ import unittest
 from robot.output.loggerhelper import LEVELS
 
 from robot.reporting.jsmodelbuilders import JsBuildingContext
+from robot.utils import timestamp_to_millis
 from robot.utils.asserts import assert_equal
 
 
@@ -43,16 +44,19 @@ class TestTimestamp(unittest.TestCase):
         self._context = JsBuildingContext()
 
     def test_timestamp(self):
-        assert_equal(self._context.timestamp('20110603 12:00:00.042'), 0)
-        assert_equal(self._context.timestamp('20110603 12:00:00.043'), 1)
-        assert_equal(self._context.timestamp('20110603 12:00:00.000'), -42)
-        assert_equal(self._context.timestamp('20110603 12:00:01.041'), 999)
-        assert_equal(self._context.timestamp('20110604 12:00:00.042'),
+        assert_equal(self._timestamp('20110603 12:00:00.042'), 0)
+        assert_equal(self._timestamp('20110603 12:00:00.043'), 1)
+        assert_equal(self._timestamp('20110603 12:00:00.000'), -42)
+        assert_equal(self._timestamp('20110603 12:00:01.041'), 999)
+        assert_equal(self._timestamp('20110604 12:00:00.042'),
                       24 * 60 * 60 * 1000)
 
     def test_none_timestamp(self):
         assert_equal(self._context.timestamp(None), None)
 
+    def _timestamp(self, timestamp):
+        return self._context.timestamp(timestamp_to_millis(timestamp))
+
 
 class TestMinLogLevel(unittest.TestCase):
 
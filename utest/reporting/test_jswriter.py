@@ -2,14 +2,15 @@ from io import StringIO
 import unittest
 
 from robot.reporting.jsexecutionresult import JsExecutionResult
-from robot.reporting.jswriter import JsResultWriter
+from robot.reporting.jswriter import JsResultWriter, ModelSpiller, SplitLogWriter
 from robot.utils.asserts import assert_equal, assert_true
 
 
 def get_lines(suite=(), strings=(), basemillis=100, start_block='',
-              end_block='', split_threshold=9999, min_level='INFO'):
+              end_block='', split_threshold=9999, min_level='INFO', spilled=None):
     output = StringIO()
-    data = JsExecutionResult(suite, None, None, strings, basemillis, min_level=min_level)
+    data = JsExecutionResult(suite, None, None, strings, basemillis,
+                             min_level=min_level, spilled=spilled)
     writer = JsResultWriter(output, start_block, end_block, split_threshold)
     writer.write(data, settings={})
     return output.getvalue().splitlines()
@@ -100,5 +101,57 @@ class TestSuiteWriter(unittest.TestCase):
         assert_separators(lines, 'foo')
 
 
+class TestModelSpiller(unittest.TestCase):
+
+    def setUp(self):
+        self.spiller = ModelSpiller(split_threshold=4)
+
+    def tearDown(self):
+        self.spiller.close()
+
+    def test_keywords_are_written_in_batches(self):
+        suite = (1, self.spiller.spill((2, 3)), self.spiller.spill((4, 5, 6)),
+                 self.spiller.spill(()))
+        expected = ['window.kParts0 = [[2,3],[4,5,6]];',
+                    'window.kParts1 = [[]];',
+                    'window.output["suite"] = '
+                    '[1,window.kParts0[0],window.kParts0[1],window.kParts1[0]];']
+        self._assert_spilling(suite, expected)
+
+    def test_large_keywords_are_written_as_separate_parts(self):
+        suite = (self.spiller.spill(((1, 2, 3, 4), 5)),)
+        expected = ['window.kPart0 = [1,2,3,4];',
+                    'window.kParts0 = [[window.kPart0,5]];',
+                    'window.output["suite"] = [window.kParts0[0]];']
+        self._assert_spilling(suite, expected)
+
+    def test_spilled_json(self):
+        first = self.spiller.spill_json([1, 'x'])
+        second = self.spiller.spill_json({'a': None})
+        assert_equal(second.read(), '{"a":null}')
+        assert_equal(first.read(), '[1,"x"]')
+        output = StringIO()
+        SplitLogWriter(output)._write_json('window.x = ', first)
+        assert_equal(output.getvalue(), 'window.x = [1,"x"];\n')
+
+    def test_split_log_with_shared_strings(self):
+        output = StringIO()
+        writer = SplitLogWriter(output)
+        writer.write([1], ['*', '#1'], 2, 'log-2.js', 'log-strings.js')
+        writer.write_shared_strings(['*', '*x'], 'log-strings.js')
+        assert_equal(output.getvalue().splitlines(),
+                     ['window.keywords2 = [1];',
+                      'window.strings2 = ["*","#1"];',
+                      'window.fileLoading.notify("log-2.js", "log-strings.js");',
+                      'window.sharedStrings = ["*","*x"];',
+                      'window.fileLoading.notify("log-strings.js");'])
+
+    def _assert_spilling(self, suite, expected):
+        lines = get_lines(suite, split_threshold=100, spilled=self.spiller)
+        parts = [l for l in lines if l.startswith(('window.kPart',
+                                                   'window.output["suite"]'))]
+        assert_equal(parts, expected)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -9,10 +9,14 @@ class LogWriterWithMockedWriting(LogWriter):
     def __init__(self, model):
         LogWriter.__init__(self, model)
         self.split_write_calls = []
+        self.shared_write_calls = []
         self.write_called = False
 
-    def _write_split_log(self, index, keywords, strings, path):
-        self.split_write_calls.append((index, keywords, strings, path))
+    def _write_split_log(self, index, keywords, strings, path, shared=None):
+        self.split_write_calls.append((index, keywords, strings, path, shared))
+
+    def _write_shared_strings(self, strings, path):
+        self.shared_write_calls.append((strings, path))
 
     def _write_file(self, output, config, template):
         self.write_called = True
@@ -26,13 +30,30 @@ class TestLogWriter(unittest.TestCase):
             split_results = [((0, 1, 2, -1), ('*', '*1', '*2')),
                              ((0, 1, 0, 42), ('*','*x')),
                              (((1, 2), (3, 4, ())), ('*',))]
+            shared_strings = None
         writer = LogWriterWithMockedWriting(model)
         writer.write('mylog.html', None)
         assert_true(writer.write_called)
-        assert_equal([(1, (0, 1, 2, -1), ('*', '*1', '*2'), 'mylog-1.js'),
-                       (2, (0, 1, 0, 42), ('*', '*x'), 'mylog-2.js'),
-                       (3, ((1, 2), (3, 4, ())), ('*',), 'mylog-3.js')],
+        assert_equal([(1, (0, 1, 2, -1), ('*', '*1', '*2'), 'mylog-1.js', None),
+                       (2, (0, 1, 0, 42), ('*', '*x'), 'mylog-2.js', None),
+                       (3, ((1, 2), (3, 4, ())), ('*',), 'mylog-3.js', None)],
                       writer.split_write_calls)
+        assert_equal(writer.shared_write_calls, [])
+
+    def test_splitting_log_with_shared_strings(self):
+        class model:
+            split_results = [((0, 1, 2, -1), ('*', '#1', '*2')),
+                             ((0, 1, 0, 42), ('*', '#1'))]
+            shared_strings = ('*', '*long')
+        writer = LogWriterWithMockedWriting(model)
+        writer.write('mylog.html', None)
+        assert_equal([(('*', '*long'), 'mylog-strings.js')],
+                     writer.shared_write_calls)
+        assert_equal([(1, (0, 1, 2, -1), ('*', '#1', '*2'), 'mylog-1.js',
+                       'mylog-strings.js'),
+                      (2, (0, 1, 0, 42), ('*', '#1'), 'mylog-2.js',
+                       'mylog-strings.js')],
+                     writer.split_write_calls)
 
 
 if __name__ == '__main__':
@@ -1,4 +1,4 @@
-from io import StringIO
+from io import BytesIO, StringIO
 import unittest
 
 from robot.output import LOGGER
@@ -24,6 +24,11 @@ class TestReporting(unittest.TestCase):
         self._write_results(output=output)
         self._verify_output(output.value)
 
+    def test_only_binary_output(self):
+        output = ClosableBinaryOutput('output.bin')
+        self._write_results(binary_output=output)
+        self._verify_output(output.value.decode('UTF-8'))
+
     def test_only_xunit(self):
         xunit = ClosableOutput('xunit.xml')
         self._write_results(xunit=xunit)
@@ -124,10 +129,13 @@ class StubSettings:
     log = None
     log_config = {}
     split_log = False
+    log_compression = 9
+    shared_strings = False
     report = None
     report_config = None
     output = None
     xunit = None
+    binary_output = None
     status_rc = True
     suite_config = {}
     statistics_config = {}
@@ -161,5 +169,15 @@ class ClosableOutput:
         return self._path
 
 
+class ClosableBinaryOutput(ClosableOutput):
+
+    def __init__(self, path):
+        self._output = BytesIO()
+        self._path = path
+
+    def flush(self):
+        pass
+
+
 if __name__ == '__main__':
     unittest.main()
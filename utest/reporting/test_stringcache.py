@@ -2,6 +2,7 @@ import time
 import random
 import string
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from robot.reporting.stringcache import StringCache, StringIndex
 from robot.utils.asserts import assert_equal, assert_true, assert_false
@@ -59,6 +60,53 @@ class TestStringCache(unittest.TestCase):
         for i1, i2 in zip(indices1, indices2):
             assert_true(i1 is i2, 'not same: %s and %s' % (i1, i2))
 
+    def test_identical_long_strings_are_compressed_once(self):
+        compressed = []
+        encode = self.cache._encode
+        self.cache._encode = lambda text: compressed.append(text) or encode(text)
+        indices = [self.cache.add('long'*100) for _ in range(3)]
+        assert_equal(compressed, ['long'*100])
+        assert_equal(len(set(indices)), 1)
+
+    def test_compression_level(self):
+        texts = ['short', 'long'*1000, self._generate_random_string(500)]
+        for level in range(1, 10):
+            cache = StringCache(compression_level=level)
+            for text in texts:
+                cache.add(text)
+            assert_equal(cache.dump()[1], '*short')
+            assert_true(len(cache.dump()[2]) < 1000)
+        cache = StringCache(compression_level=0)
+        for text in texts:
+            cache.add(text)
+        assert_equal(cache.dump(), ('*',) + tuple('*' + t for t in texts))
+
+    def test_compression_with_executor(self):
+        texts = [self._generate_random_string(i) for i in range(0, 300, 7)] * 2
+        texts += ['long'*(i+100) for i in range(100)]
+        with ThreadPoolExecutor(2) as executor:
+            cache = StringCache(executor=executor)
+            cache._batch_size = 1000
+            cache._max_batches = 2
+            indices = [cache.add(text) for text in texts]
+            parallel = cache.dump()
+        for text in texts:
+            self.cache.add(text)
+        assert_equal(parallel, self.cache.dump())
+        assert_equal(indices, [self.cache.add(text) for text in texts])
+
+    def test_shared_cache(self):
+        shared = StringCache()
+        first = StringCache(shared=shared)
+        second = StringCache(shared=shared)
+        long = 'long'*100
+        for cache in first, second:
+            assert_equal(cache.add('short'), 1)
+            assert_equal(cache.add(long), 2)
+            assert_equal(cache.add(long), 2)
+            assert_equal(cache.dump(), ('*', '*short', '#1'))
+        assert_equal(shared.dump(), ('*', self._compress(long)))
+
 
 class TestStringIndex(unittest.TestCase):
 
@@ -0,0 +1,150 @@
+import os
+import tempfile
+import unittest
+from os.path import dirname, join
+from pathlib import Path
+
+from robot.errors import DataError
+from robot.output.binarylogger import BinaryLogger
+from robot.result import ExecutionResult, Result
+from robot.result.binaryformat import is_binary_output
+from robot.utils.asserts import assert_equal, assert_false, assert_raises, assert_true
+
+
+GOLDEN = join(dirname(__file__), 'golden.xml')
+GOLDEN_TWICE = join(dirname(__file__), 'goldenTwice.xml')
+
+
+class TestBinaryOutput(unittest.TestCase):
+
+    def setUp(self):
+        temp = Path(os.getenv('TEMPDIR', tempfile.gettempdir()))
+        self.binary = temp / 'binary-output.bin'
+        self.xml = temp / 'binary-output.xml'
+
+    def tearDown(self):
+        for path in self.binary, self.xml:
+            if path.exists():
+                path.unlink()
+
+    def _save_binary(self, source):
+        ExecutionResult(source).save(self.binary, binary=True)
+        return self.binary
+
+    def _xml(self, result):
+        result.save(self.xml)
+        # Skip the XML declaration and the root element having timestamp.
+        return self.xml.read_text(encoding='UTF-8').split('\n', 2)[2]
+
+    def test_round_trip(self):
+        for source in GOLDEN, GOLDEN_TWICE:
+            binary = ExecutionResult(self._save_binary(source))
+            assert_equal(self._xml(binary), self._xml(ExecutionResult(source)))
+
+    def test_errors_and_statistics(self):
+        result = ExecutionResult(self._save_binary(GOLDEN))
+        expected = ExecutionResult(GOLDEN)
+        assert_equal([m.message for m in result.errors],
+                     [m.message for m in expected.errors])
+        assert_equal(result.statistics.total.failed, expected.statistics.total.failed)
+        assert_equal(result.statistics.total.passed, expected.statistics.total.passed)
+
+    def test_is_binary_output(self):
+        path = self._save_binary(GOLDEN)
+        assert_true(is_binary_output(path))
+        assert_true(is_binary_output(str(path)))
+        assert_true(is_binary_output(path.read_bytes()))
+        assert_false(is_binary_output(GOLDEN))
+        assert_false(is_binary_output('nonex.bin'))
+
+    def test_bytes_source(self):
+        data = self._save_binary(GOLDEN).read_bytes()
+        assert_equal(self._xml(ExecutionResult(data)),
+                     self._xml(ExecutionResult(GOLDEN)))
+
+    def test_exclude_keywords(self):
+        result = ExecutionResult(self._save_binary(GOLDEN), include_keywords=False)
+        expected = ExecutionResult(GOLDEN, include_keywords=False)
+        assert_equal(self._xml(result), self._xml(expected))
+        assert_false(result.suite.tests[0].body)
+
+    def test_flatten_keywords(self):
+        path = self._save_binary(GOLDEN_TWICE)
+        for flattened in (['name:BuiltIn.Log'], ['for'], ['iteration']):
+            result = ExecutionResult(path, flattened_keywords=flattened)
+            expected = ExecutionResult(GOLDEN_TWICE, flattened_keywords=flattened)
+            assert_equal(self._xml(result), self._xml(expected))
+
+    def test_flatten_keywords_by_tags(self):
+        path = self._save_binary(GOLDEN_TWICE)
+        result = ExecutionResult(path, flattened_keywords=['tag:*'])
+        kw = result.suite.suites[0].tests[0].body[1]
+        assert_equal(kw.name, 'logs on trace')
+        assert_equal(kw.doc, '_*Keyword content flattened.*_')
+        assert_equal(list(kw.body), [])
+
+    def test_flattened_control_structures_have_no_branches(self):
+        path = self._save_binary(GOLDEN_TWICE)
+        result = ExecutionResult(path, flattened_keywords=['name:*'])
+        if_ = result.suite.suites[0].tests[0].body[-1]
+        assert_equal(if_.doc, '_*Keyword content flattened.*_')
+        assert_equal(list(if_.body), [])
+
+    def test_none_values(self):
+        result = Result()
+        test = result.suite.tests.create(name='Test', status='FAIL')
+        for_ = test.body.create_for(variables=['${x}'], flavor=None,
+                                    values=['a'], status='FAIL')
+        for_.body.create_iteration().variables['${x}'] = 'a'
+        kw = test.body.create_keyword(kwname='Kw', libname=None, status='NOT RUN')
+        kw.body.create_return(values=['value'], status='NOT RUN')
+        branch = test.body.create_try().body.create_branch(type='EXCEPT',
+                                                           variable=None)
+        branch.status = 'NOT RUN'
+        result.save(self.binary, binary=True)
+        binary = ExecutionResult(self.binary)
+        assert_equal(binary.suite.tests[0].body[0].flavor, None)
+        assert_equal(binary.suite.tests[0].body[1].libname, None)
+        assert_equal(self._xml(binary), self._xml(result))
+
+    def test_truncated_output(self):
+        data = self._journal(GOLDEN_TWICE)
+        # Chunks are written when tests and suites start and end in journal
+        # mode. Cut the data in the middle of the chunk after the first test.
+        data = self._truncate(data, chunks=4)
+        assert_raises(DataError, ExecutionResult, data)
+        result = ExecutionResult(data, recover=True)
+        suite = result.suite.suites[0]
+        assert_equal(len(result.suite.suites), 1)
+        assert_equal(len(suite.tests), 1)
+        assert_equal(suite.tests[0].status, 'PASS')
+        for suite in result.suite, suite:
+            assert_equal(suite.message,
+                         'Suite did not finish because execution was interrupted.')
+
+    def test_truncated_output_with_started_test(self):
+        data = self._truncate(self._journal(GOLDEN_TWICE), chunks=3)
+        test = ExecutionResult(data, recover=True).suite.suites[0].tests[0]
+        assert_equal(test.status, 'FAIL')
+        assert_equal(test.message,
+                     'Test did not finish because execution was interrupted.')
+
+    def _journal(self, source):
+        logger = BinaryLogger(self.binary, journal=True)
+        ExecutionResult(source).visit(logger)
+        logger.close()
+        return self.binary.read_bytes()
+
+    def _truncate(self, data, chunks):
+        # Data starts with a 6 byte header and each chunk with its length.
+        end = 6
+        for _ in range(chunks):
+            end += 4 + int.from_bytes(data[end:end+4], 'little')
+        return data[:end + 10]
+
+    def test_invalid_output(self):
+        assert_raises(DataError, ExecutionResult, b'RFBIN\x01\x04\x00\x00\x00[[99]')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,10 @@
 from itertools import chain
+from os.path import dirname, join
 import unittest
 from robot.utils.asserts import assert_equal, assert_raises_with_msg, assert_true
 
 from robot.errors import DataError
-from robot.result import Keyword, TestCase, TestSuite
+from robot.result import ExecutionResult, Keyword, TestCase, TestSuite
 from robot.result.configurer import SuiteConfigurer
 
 
@@ -230,6 +231,30 @@ class TestRemoveKeywords(unittest.TestCase):
         assert_equal(len(t2.body[0].messages), 1)
         assert_equal(len(t2.body[1].body), 1)
 
+    def test_remove_keywords_and_filter_messages_like_separately(self):
+        golden = join(dirname(__file__), 'goldenTwice.xml')
+        options = ['passed', 'for', 'name:BuiltIn.Log', 'tag:*', 'wuks']
+        for remove, level in [(['all'], 'DEBUG'), (options, 'INFO'), (options, 'TRACE'),
+                              ([], 'WARN')]:
+            combined = ExecutionResult(golden).suite
+            combined.visit(SuiteConfigurer(remove_keywords=remove, log_level=level))
+            separate = ExecutionResult(golden).suite
+            for how in remove:
+                separate.remove_keywords(how)
+            separate.filter_messages(level)
+            assert_equal(self._dump(combined), self._dump(separate))
+
+    def _dump(self, item):
+        children = []
+        for name in 'setup', 'teardown':
+            if getattr(item, f'has_{name}', False):
+                children.append(getattr(item, name))
+        for name in 'suites', 'tests', 'body':
+            if name != 'body' or getattr(item, 'has_body', hasattr(item, 'body')):
+                children.extend(getattr(item, name, ()))
+        return (repr(item), getattr(item, 'doc', None),
+                [self._dump(child) for child in children])
+
     def _suite_with_setup_and_teardown_and_test_with_keywords(self):
         suite = TestSuite()
         suite.setup.config(kwname='S', status='PASS').body.create_message('setup message')
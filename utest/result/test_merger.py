@@ -0,0 +1,75 @@
+import unittest
+
+from robot.errors import DataError
+from robot.result import Result, TestSuite
+from robot.result.merger import Merger
+from robot.utils.asserts import assert_equal, assert_raises_with_msg, assert_true
+
+
+def create_result(*tests, suite='Root', child='Child', status='PASS'):
+    root = TestSuite(name=suite)
+    for name in tests:
+        root.suites.create(name=child).tests.create(name=name, status=status)
+    return Result(root_suite=root)
+
+
+def names_and_statuses(suite):
+    return [(test.name, test.status) for child in suite.suites
+            for test in child.tests]
+
+
+class TestMerger(unittest.TestCase):
+
+    def setUp(self):
+        self.result = create_result('A')
+        self.result.suite.suites[0].tests.create(name='B', status='PASS')
+        self.merger = Merger(self.result)
+
+    def test_merge_existing_test(self):
+        self.merger.merge(create_result('B', status='FAIL'))
+        assert_equal(names_and_statuses(self.result.suite),
+                     [('A', 'PASS'), ('B', 'FAIL')])
+        assert_equal(len(self.result.suite.suites), 1)
+
+    def test_add_new_tests_and_suites(self):
+        self.merger.merge(create_result('C', status='FAIL'))
+        self.merger.merge(create_result('D', child='Other'))
+        assert_equal(names_and_statuses(self.result.suite),
+                     [('A', 'PASS'), ('B', 'PASS'), ('C', 'FAIL'), ('D', 'PASS')])
+        assert_equal([s.name for s in self.result.suite.suites], ['Child', 'Other'])
+
+    def test_merge_added_test_again(self):
+        for status in 'FAIL', 'PASS', 'FAIL':
+            self.merger.merge(create_result('C', status=status))
+        assert_equal(names_and_statuses(self.result.suite),
+                     [('A', 'PASS'), ('B', 'PASS'), ('C', 'FAIL')])
+        assert_true('has been re-executed' in self.result.suite.suites[0].tests[2].message)
+
+    def test_merge_test_in_added_suite(self):
+        self.merger.merge(create_result('X', child='Other'))
+        self.merger.merge(create_result('X', 'Y', child='Other', status='FAIL'))
+        assert_equal(names_and_statuses(self.result.suite),
+                     [('A', 'PASS'), ('B', 'PASS'), ('X', 'FAIL'), ('Y', 'FAIL')])
+
+    def test_first_test_with_same_name_is_replaced(self):
+        self.result.suite.suites[0].tests.create(name='A', status='SKIP')
+        self.merger.merge(create_result('A', status='FAIL'))
+        assert_equal(names_and_statuses(self.result.suite),
+                     [('A', 'FAIL'), ('B', 'PASS'), ('A', 'SKIP')])
+
+    def test_skipped_test_does_not_replace_existing(self):
+        self.merger.merge(create_result('A', status='SKIP'))
+        test = self.result.suite.suites[0].tests[0]
+        assert_equal(test.status, 'PASS')
+        assert_true(test.message.startswith('*HTML* Test has been re-executed'))
+
+    def test_different_root_suites(self):
+        assert_raises_with_msg(DataError,
+                               "Cannot merge outputs containing different root "
+                               "suites. Original suite is 'Root' and merged is "
+                               "'Other'.",
+                               self.merger.merge, create_result('A', suite='Other'))
+
+
+if __name__ == '__main__':
+    unittest.main()
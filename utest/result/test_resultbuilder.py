@@ -6,6 +6,7 @@ from os.path import join, dirname
 from pathlib import Path
 
 from robot.errors import DataError
+from robot.output.xmllogger import XmlLogger
 from robot.result import ExecutionResult, ExecutionResultBuilder, Result, TestSuite
 from robot.utils.asserts import assert_equal, assert_false, assert_true, assert_raises
 
@@ -182,6 +183,12 @@ class TestMergingSuites(unittest.TestCase):
         assert_equal(message.count('<span class="old-status">'), 2)
         assert_true('<span class="old-message">Old message:</span>' not in message)
 
+    def test_merging_in_processes(self):
+        result = ExecutionResult(GOLDEN_XML, GOLDEN_XML, GOLDEN_XML,
+                                 merge=True, processes=2)
+        assert_equal(result.suite.tests[0].message, self.test.message)
+        assert_equal(result.suite.test_count, self.suite.test_count)
+
 
 class TestElements(unittest.TestCase):
 
@@ -230,6 +237,14 @@ class TestElements(unittest.TestCase):
         suite = ExecutionResult(StringIO(xml)).suite
         assert_equal(suite.message, 'Setup failed')
 
+    def test_repeated_values_are_shared(self):
+        suites = ExecutionResult(GOLDEN_XML_TWICE).suite.suites
+        first, second = (suite.tests[0].body[0] for suite in suites)
+        for attr in 'kwname', 'libname', 'status':
+            assert_true(getattr(first, attr) is getattr(second, attr))
+        assert_true(first.messages[0].level is second.messages[0].level)
+        assert_false(suites[0].setup.has_body)
+
     def test_unknown_elements_cause_an_error(self):
         assert_raises(DataError, ExecutionResult, StringIO('<some_tag/>'))
 
@@ -384,6 +399,191 @@ class TestUsingPathlibPath(unittest.TestCase):
         self.test_suite_is_built(result.suite)
         self.test_test_is_built(result.suite)
 
+    def test_save_compressed(self):
+        temp = os.getenv('TEMPDIR', tempfile.gettempdir())
+        path = Path(temp) / 'compressed.xml.gz'
+        self.result.save(path)
+        try:
+            assert_equal(path.read_bytes()[:2], b'\x1f\x8b')
+            result = ExecutionResult(path)
+        finally:
+            path.unlink()
+        self.test_suite_is_built(result.suite)
+        self.test_test_is_built(result.suite)
+
+
+class TestLazyKeywords(unittest.TestCase):
+
+    def setUp(self):
+        temp = os.getenv('TEMPDIR', tempfile.gettempdir())
+        self.path = Path(temp) / 'lazy.xml'
+        self.path.write_text(GOLDEN_XML_TWICE, encoding='UTF-8')
+
+    def tearDown(self):
+        self.path.unlink()
+
+    def _build(self, lazy=True, source=None):
+        source = source or self.path
+        builder = ExecutionResultBuilder(source, lazy_keywords=lazy)
+        return builder.build(Result(source))
+
+    def _save(self, result):
+        path = self.path.with_name('lazy-saved.xml')
+        result.save(path)
+        try:
+            # Skip the XML declaration and the root element having timestamp.
+            return path.read_text(encoding='UTF-8').split('\n', 2)[2]
+        finally:
+            path.unlink()
+
+    def test_result_is_same_as_without_lazy_loading(self):
+        assert_equal(self._save(self._build()), self._save(self._build(lazy=False)))
+
+    def test_keywords_are_built_when_accessed(self):
+        test = self._build().suite.suites[1].tests[0]
+        assert_true(test._lazy_keywords)
+        assert_equal(test.name, 'First One')
+        assert_equal(test.status, 'PASS')
+        assert_equal(len(test.body), 4)
+        assert_equal(test.body[1].name, 'logs on trace')
+        assert_false(test._lazy_keywords)
+        assert_equal(test.body[0].messages[0].message, 'Test 1')
+        assert_true(test.body[0].parent is test)
+
+    def test_suite_keywords_are_not_lazy(self):
+        suite = self._build().suite.suites[0]
+        assert_equal(suite.setup.name, 'my setup')
+        assert_false(suite.tests[0].has_setup)
+
+    def test_setting_body_loads_keywords_first(self):
+        test = self._build().suite.suites[0].tests[0]
+        test.body = []
+        assert_equal(len(test.body), 0)
+        assert_false(test._lazy_keywords)
+
+    def test_remove_passed_keywords(self):
+        lazy = self._build()
+        eager = self._build(lazy=False)
+        for result in lazy, eager:
+            result.suite.remove_keywords('PASSED')
+        assert_equal(self._save(lazy), self._save(eager))
+
+    def test_not_used_with_other_sources(self):
+        result = self._build(source=GOLDEN_XML_TWICE)
+        test = result.suite.suites[0].tests[0]
+        assert_false(test._lazy_keywords)
+        assert_true(test.body)
+
+    def test_changed_file(self):
+        test = self._build().suite.suites[0].tests[0]
+        self.path.write_text(GOLDEN_XML_TWICE.replace('First One', 'Changed'),
+                             encoding='UTF-8')
+        assert_raises(DataError, getattr, test, 'body')
+
+
+class TestBuildingInProcesses(unittest.TestCase):
+
+    def setUp(self):
+        temp = Path(os.getenv('TEMPDIR', tempfile.gettempdir()))
+        self.paths = [temp / 'golden.xml', temp / 'golden-twice.xml']
+        for path, xml in zip(self.paths, (GOLDEN_XML, GOLDEN_XML_TWICE)):
+            path.write_text(xml, encoding='UTF-8')
+        self.saved = temp / 'saved.xml'
+
+    def tearDown(self):
+        for path in self.paths + [self.saved]:
+            if path.exists():
+                path.unlink()
+
+    def _save(self, result):
+        result.save(self.saved)
+        # Skip the XML declaration and the root element having timestamp.
+        return self.saved.read_text(encoding='UTF-8').split('\n', 2)[2]
+
+    def test_combine(self):
+        for lazy in False, True:
+            sequential = ExecutionResult(*self.paths, lazy_keywords=lazy)
+            parallel = ExecutionResult(*self.paths, lazy_keywords=lazy, processes=2)
+            assert_equal(self._save(parallel), self._save(sequential))
+
+    def test_merge(self):
+        paths = self.paths[:1] * 3
+        sequential = ExecutionResult(*paths, merge=True)
+        parallel = ExecutionResult(*paths, merge=True, processes=2)
+        assert_equal(self._save(parallel), self._save(sequential))
+
+    def test_errors(self):
+        assert_raises(DataError, ExecutionResult, self.paths[0], 'nonex.xml',
+                      processes=2)
+
+
+class TestRecoveringTruncatedOutput(unittest.TestCase):
+
+    def _truncated(self, end):
+        index = GOLDEN_XML.index(end) + len(end)
+        return GOLDEN_XML[:index]
+
+    def test_truncated_output_fails_by_default(self):
+        assert_raises(DataError, ExecutionResult, self._truncated('<kw '))
+
+    def test_unfinished_test_and_keyword_are_failed(self):
+        result = ExecutionResult(self._truncated('Test 1</msg>'), recover=True)
+        test = result.suite.tests[0]
+        assert_equal(test.status, 'FAIL')
+        assert_equal(test.message,
+                     'Test did not finish because execution was interrupted.')
+        assert_equal(test.body[0].status, 'FAIL')
+        assert_equal(test.body[0].messages[0].message, 'Test 1')
+        assert_equal(result.suite.status, 'FAIL')
+        assert_equal(result.suite.message,
+                     'Suite did not finish because execution was interrupted.')
+
+    def test_finished_tests_are_preserved(self):
+        end = '</test>'
+        result = ExecutionResult(self._truncated(end) + '\n<test na', recover=True)
+        test = result.suite.tests[0]
+        assert_equal(test.status, 'PASS')
+        assert_equal(test.message, '')
+
+    def test_lazy_keywords(self):
+        temp = os.getenv('TEMPDIR', tempfile.gettempdir())
+        path = Path(temp) / 'truncated.xml'
+        path.write_text(self._truncated('Test 1</msg>'), encoding='UTF-8')
+        try:
+            result = ExecutionResult(path, recover=True, lazy_keywords=True)
+            assert_equal(result.suite.tests[0].status, 'FAIL')
+            assert_equal(result.suite.tests[0].body[0].messages[0].message, 'Test 1')
+        finally:
+            path.unlink()
+
+    def test_journal_contains_started_test(self):
+        path = Path(os.getenv('TEMPDIR', tempfile.gettempdir())) / 'journal.xml'
+        suite = TestSuite(name='Suite')
+        passed = suite.tests.create(name='Passed', status='PASS')
+        running = suite.tests.create(name='Running')
+        logger = XmlLogger(path, journal=True)
+        try:
+            logger.start_suite(suite)
+            logger.start_test(passed)
+            logger.end_test(passed)
+            logger.start_test(running)
+            logger.start_keyword(running.body.create_keyword(kwname='Keyword'))
+            # Data on the disk is what is left if the execution is killed now.
+            truncated = path.read_bytes()
+        finally:
+            logger.close()
+            path.unlink()
+        result = ExecutionResult(truncated, recover=True)
+        assert_equal([t.name for t in result.suite.tests], ['Passed', 'Running'])
+        assert_equal(result.suite.tests[0].status, 'PASS')
+        assert_equal(result.suite.tests[1].status, 'FAIL')
+        assert_equal(result.suite.tests[1].message,
+                     'Test did not finish because execution was interrupted.')
+
+    def test_invalid_output_is_not_recovered(self):
+        assert_raises(DataError, ExecutionResult, '<robot><suite><test></kw>',
+                      recover=True)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,7 @@
 import unittest
 import warnings
 
-from robot.model import Tags
+from robot.model import SuiteVisitor, Tags
 from robot.result import (Break, Continue, For, If, IfBranch, Keyword, Message,
                           Return, TestCase, TestSuite, Try, While)
 from robot.utils.asserts import (assert_equal, assert_false, assert_raises,
@@ -132,6 +132,40 @@ class TestElapsedTime(unittest.TestCase):
         suite = TestSuite()
         assert_equal(suite.elapsedtime, 0)
 
+    def test_times_are_stored_as_millis(self):
+        for item in TestSuite(), TestCase(), Keyword(), For(), If().body.create_branch():
+            item.starttime = '20010101 10:00:00.000'
+            item.endtime = '20010101 10:00:01.234'
+            assert_equal(item.end_millis - item.start_millis, 1234)
+            assert_equal(item.starttime, '20010101 10:00:00.000')
+            assert_equal(item.endtime, '20010101 10:00:01.234')
+            item.end_millis += 1
+            assert_equal(item.endtime, '20010101 10:00:01.235')
+            assert_equal(item.elapsedtime, 1235)
+            item.starttime = None
+            assert_equal(item.start_millis, None)
+            assert_equal(item.starttime, None)
+
+    def test_message_timestamp_is_stored_as_millis(self):
+        msg = Message(timestamp='20010101 10:00:00.042')
+        assert_equal(msg.timestamp_millis % 1000, 42)
+        msg.timestamp_millis += 1
+        assert_equal(msg.timestamp, '20010101 10:00:00.043')
+        assert_equal(Message().timestamp, None)
+
+    def test_times_in_other_formats(self):
+        for item in TestCase(starttime='N/A', endtime='N/A'), TestSuite(), Keyword():
+            item.starttime = 'N/A'
+            assert_equal(item.start_millis, None)
+            item.starttime = '20010101 10:00:00'
+            item.endtime = '20010101 10:00:01.234567'
+            assert_equal(item.starttime, '20010101 10:00:00.000')
+            assert_equal(item.endtime, '20010101 10:00:01.234')
+            assert_equal(item.elapsedtime, 1234)
+        assert_equal(Message(timestamp='N/A').timestamp, None)
+        assert_equal(Message(timestamp='20010101 10:00:00').timestamp,
+                     '20010101 10:00:00.000')
+
     def _test_suite_elapsed_time_is_test_time(self):
         suite = TestSuite()
         suite.tests.create(starttime='19991212 12:00:00.010',
@@ -352,6 +386,38 @@ class TestBody(unittest.TestCase):
         assert_equal(kw.body[2].body[2].id, 's1-t1-k1-k2-m2')
 
 
+class TestLazyBody(unittest.TestCase):
+
+    def test_body_is_created_when_accessed(self):
+        for item in (Keyword(), Return(), Continue(), Break(),
+                     For().body.create_iteration(), While().body.create_iteration()):
+            assert_equal(item._body, None)
+            assert_false(item.has_body)
+            body = item.body
+            assert_true(item.body is body)
+            assert_false(item.has_body)
+            assert_true(body.create_message('m').parent is item)
+            assert_true(item.has_body)
+
+    def test_set_body(self):
+        kw = Keyword()
+        kw.body = [Keyword('k'), Message('m')]
+        assert_true(kw.has_body)
+        assert_equal([item.parent for item in kw.body], [kw, kw])
+        kw.body = []
+        assert_false(kw.has_body)
+        assert_equal(kw._body, None)
+
+    def test_visiting_does_not_create_body(self):
+        test = TestSuite().tests.create()
+        kw = test.body.create_keyword('k')
+        kw.body.create_keyword('child')
+        test.visit(SuiteVisitor())
+        assert_true(kw.has_body)
+        assert_equal(kw.body[0]._body, None)
+        assert_equal(test.body[0].body[0].id, 's1-t1-k1-k1')
+
+
 class TestIterations(unittest.TestCase):
 
     def test_create_supported(self):
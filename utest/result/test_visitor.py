@@ -2,11 +2,11 @@ import unittest
 from os.path import dirname, join
 
 from robot.api.parsing import get_model
-from robot.result import ExecutionResult
-from robot.model import SuiteVisitor, TestSuite
+from robot.result import ExecutionResult, ResultVisitor
+from robot.model import CompositeVisitor, SuiteVisitor, TestSuite
 from robot.result import TestSuite as ResultSuite
 from robot.running import TestSuite as RunningSuite
-from robot.utils.asserts import assert_equal
+from robot.utils.asserts import assert_equal, assert_true
 
 
 RESULT = ExecutionResult(join(dirname(__file__), 'golden.xml'))
@@ -226,6 +226,95 @@ END IF/ELSE ROOT
             assert_equal(getattr(visitor, f'visited_{visited}_body'), True, f'{visited}_body')
 
 
+class TestCompositeVisitor(unittest.TestCase):
+
+    def test_same_events_as_when_visiting_separately(self):
+        separate = [Recorder(), Recorder(body_items=False)]
+        for visitor in separate:
+            RESULT.suite.visit(visitor)
+        combined = [Recorder(), Recorder(body_items=False)]
+        RESULT.suite.visit(CompositeVisitor(*combined))
+        for s, c in zip(separate, combined):
+            assert_equal(c.visited, s.visited)
+        assert_true(len(combined[0].visited) > len(combined[1].visited) > 0)
+
+    def test_visitors_are_called_in_order(self):
+        events = []
+        RESULT.suite.visit(CompositeVisitor(Recorder(events, 'a'), Recorder(events, 'b')))
+        assert_equal(events[:4], ['a: START SUITE Normal', 'b: START SUITE Normal',
+                                  'a: START SETUP my setup', 'b: START SETUP my setup'])
+        assert_equal(events[-2:], ['a: END SUITE Normal', 'b: END SUITE Normal'])
+
+    def test_start_can_stop_visiting_only_that_visitor(self):
+        recorder = Recorder()
+        RESULT.suite.visit(CompositeVisitor(StartSuiteStopping(), StartTestStopping(),
+                                            StartKeywordStopping(), recorder))
+        expected = Recorder()
+        RESULT.suite.visit(expected)
+        assert_equal(recorder.visited, expected.visited)
+
+    def test_overridden_visit_methods_are_called(self):
+        class VisitTest(SuiteVisitor):
+            def __init__(self):
+                self.visited = []
+
+            def visit_test(self, test):
+                self.visited.append(test.name)
+
+            def start_keyword(self, keyword):
+                if keyword.parent.__class__.__name__ == 'TestCase':
+                    raise AssertionError
+
+        visitor, recorder = VisitTest(), Recorder()
+        RESULT.suite.visit(CompositeVisitor(visitor, recorder))
+        assert_equal(visitor.visited, ['First One'])
+        assert_true('START KEYWORD BuiltIn.Log' in recorder.visited)
+
+    def test_modifications_in_start_are_seen_by_later_visitors(self):
+        suite = TestSuite()
+        suite.tests.create(name='T')
+        recorder = Recorder()
+        suite.visit(CompositeVisitor(ItemAdder(), recorder))
+        assert_equal([e for e in recorder.visited if 'KEYWORD' in e], [])
+        assert_equal([e for e in recorder.visited if 'START TEST' in e],
+                     ['START TEST T', 'START TEST Added by start_test',
+                      'START TEST Added by end_test'])
+
+
+class Recorder(ResultVisitor):
+
+    def __init__(self, events=None, prefix=None, body_items=True):
+        self.visited = events if events is not None else []
+        self.prefix = prefix
+        self.body_items = body_items
+
+    def _record(self, event, item):
+        name = getattr(item, 'name', None) or getattr(item, 'message', '')
+        event = f'{event} {item.type if hasattr(item, "type") else ""} {name}'
+        event = ' '.join(event.split())
+        self.visited.append(f'{self.prefix}: {event}' if self.prefix else event)
+
+    def start_suite(self, suite):
+        self._record('START SUITE', suite)
+
+    def end_suite(self, suite):
+        self._record('END SUITE', suite)
+
+    def start_test(self, test):
+        self._record('START TEST', test)
+
+    def end_test(self, test):
+        self._record('END TEST', test)
+
+    def start_body_item(self, item):
+        self._record('START', item)
+        if not self.body_items:
+            return False
+
+    def end_body_item(self, item):
+        self._record('END', item)
+
+
 class StartSuiteStopping(SuiteVisitor):
 
     def start_suite(self, suite):
@@ -2,6 +2,7 @@ import unittest
 from os.path import abspath, dirname, normpath, join
 
 from robot.errors import DataError
+from robot.output import LOGGER
 from robot.utils.asserts import assert_equal, assert_raises, assert_true
 from robot.running import TestSuite, TestSuiteBuilder
 
@@ -143,5 +144,46 @@ class TestTemplates(unittest.TestCase):
         assert_equal(test.template, 'Expect Exactly Three Args')
 
 
+class TestParallelParsing(unittest.TestCase):
+
+    def test_result_and_messages_are_same_as_in_serial_parsing(self):
+        serial, serial_messages = self._build('.')
+        parallel, parallel_messages = self._build('.', processes=2)
+        assert_equal(self._structure(parallel), self._structure(serial))
+        assert_equal(parallel_messages, serial_messages)
+        assert_true(any(level == 'ERROR' for level, _ in serial_messages))
+
+    def test_parsing_errors(self):
+        error = assert_raises(DataError, self._build, '../parsing')
+        parallel = assert_raises(DataError, self._build, '../parsing', processes=2)
+        assert_true(str(error).startswith("Parsing '"))
+        assert_equal(str(parallel), str(error))
+
+    def _build(self, path, **config):
+        collector = MessageCollector()
+        LOGGER.register_logger(collector)
+        collector.messages.clear()    # Ignore earlier messages relayed from cache.
+        try:
+            return build(path, **config), collector.messages
+        finally:
+            LOGGER.unregister_logger(collector)
+
+    def _structure(self, suite):
+        return (suite.name, suite.source, suite.doc, suite.rpa, str(suite.setup),
+                [(test.name, list(test.tags), str(test.setup), test.timeout,
+                  [str(kw) for kw in test.body]) for test in suite.tests],
+                [kw.name for kw in suite.resource.keywords],
+                [self._structure(child) for child in suite.suites])
+
+
+class MessageCollector:
+
+    def __init__(self):
+        self.messages = []
+
+    def message(self, msg):
+        self.messages.append((msg.level, msg.message))
+
+
 if __name__ == '__main__':
     unittest.main()
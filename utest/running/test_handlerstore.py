@@ -0,0 +1,74 @@
+import unittest
+
+from robot.errors import DataError
+from robot.running.handlerstore import EmbeddedHandlers
+from robot.running.model import ResourceFile, UserKeyword
+from robot.running.userkeyword import UserLibrary
+from robot.utils.asserts import assert_equal, assert_raises_with_msg, assert_true
+
+
+def get_handlers(*names):
+    resource = ResourceFile(source='resource.robot')
+    resource.keywords = [UserKeyword(name) for name in names]
+    return UserLibrary(resource, UserLibrary.RESOURCE_FILE_TYPE).handlers
+
+
+class TestEmbeddedHandlers(unittest.TestCase):
+
+    def test_prefix(self):
+        handlers = get_handlers('Given user ${name}', 'Given admin ${name}',
+                                'Given ${x} and ${y}')
+        assert_equal(handlers['given USER john'].name, 'Given user ${name}')
+        assert_equal(handlers['Given admin john'].name, 'Given admin ${name}')
+        assert_equal(handlers['Given a and b'].name, 'Given ${x} and ${y}')
+        assert_true('Given user' not in handlers)
+        assert_true('user john' not in handlers)
+
+    def test_suffix(self):
+        handlers = get_handlers('${user} logs in', '${user} logs out')
+        assert_equal(handlers['John LOGS IN'].name, '${user} logs in')
+        assert_equal(handlers['John logs out'].name, '${user} logs out')
+        assert_equal(handlers['John logs in\n'].name, '${user} logs in')
+        assert_true('John logs' not in handlers)
+
+    def test_no_literals(self):
+        handlers = get_handlers('${a}${b}', 'x ${y}')
+        assert_equal(handlers['xy'].name, '${a}${b}')
+
+    def test_escaped_variable_is_part_of_literal(self):
+        handlers = get_handlers(r'Value \${x} is ${y}')
+        assert_equal(handlers[r'Value \${x} is 1'].name, r'Value \${x} is ${y}')
+        assert_true('Value 1 is 1' not in handlers)
+
+    def test_non_ascii(self):
+        handlers = get_handlers('Käyttäjä ${name}', 'Key ${name}')
+        assert_equal(handlers['KÄYTTÄJÄ john'].name, 'Käyttäjä ${name}')
+        # Kelvin sign matches 'k' case-insensitively.
+        assert_equal(handlers['\u212aey x'].name, 'Key ${name}')
+
+    def test_multiple_matches(self):
+        handlers = get_handlers('Given ${x}', 'Given ${x} and ${y}', '${x} and y')
+        assert_raises_with_msg(
+            DataError,
+            "Resource file 'resource.robot' contains multiple keywords matching "
+            "name 'Given x and y':\n"
+            "    ${x} and y\n"
+            "    Given ${x}\n"
+            "    Given ${x} and ${y}",
+            handlers.__getitem__, 'Given x and y'
+        )
+
+    def test_candidates_are_in_order(self):
+        handlers = EmbeddedHandlers()
+        for name in ['${x} b', 'a ${x}', '${x}${y}', 'a b ${x}', 'A ${x} b']:
+            handlers.add(UserKeyword(name))
+        assert_equal([h.name for h in handlers.get_candidates('a b')],
+                     ['${x} b', 'a ${x}', '${x}${y}', 'A ${x} b'])
+        assert_equal([h.name for h in handlers.get_candidates('x')],
+                     ['${x}${y}'])
+        assert_equal(len(handlers), 5)
+        assert_equal(len(handlers.get_candidates('ä')), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
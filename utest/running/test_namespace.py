@@ -1,10 +1,15 @@
 import unittest
 import os
 import pkgutil
+import shutil
+import tempfile
+from io import StringIO
 
-from robot.running import namespace
+from robot.running import namespace, ResourceFileBuilder, TestSuiteBuilder
+from robot.running.model import ResourceFile
+from robot.running.userkeyword import UserLibrary
 from robot import libraries
-from robot.utils.asserts import assert_equal
+from robot.utils.asserts import assert_equal, assert_true
 
 
 class TestNamespace(unittest.TestCase):
@@ -14,3 +19,81 @@ class TestNamespace(unittest.TestCase):
         exp_libs = (name for _, name, _ in pkgutil.iter_modules([module_path])
                     if name[0].isupper() and not name.startswith('Deprecated'))
         assert_equal(set(exp_libs), namespace.STDLIBS)
+
+
+class TestKeywordCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        for name in 'a', 'b':
+            self._create(f'{name}.resource', f'''\
+*** Keywords ***
+Keyword
+    RETURN    {name}
+
+Embedded ${{arg}} in {name}
+    RETURN    ${{arg}}
+''')
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def _create(self, name, content):
+        path = os.path.join(self.tempdir, name)
+        with open(path, 'w', encoding='UTF-8') as file:
+            file.write(content)
+        return path
+
+    def _run(self, tests):
+        path = self._create('suite.robot', '*** Test Cases ***\n' + tests)
+        suite = TestSuiteBuilder().build(path)
+        result = suite.run(output=None, log=None, report=None,
+                           stdout=StringIO(), stderr=StringIO())
+        return result.suite.tests
+
+    def test_same_runner_is_returned_for_same_name(self):
+        store = namespace.KeywordStore(ResourceFile())
+        store.resources['a'] = UserLibrary(ResourceFileBuilder().build(
+            os.path.join(self.tempdir, 'a.resource')))
+        assert_true(store.get_runner('Keyword') is store.get_runner('Keyword'))
+        assert_true(store.get_runner('keyword') is not store.get_runner('Keyword'))
+        runner = store.get_runner('Keyword')
+        store.search_order = ('a',)
+        assert_true(store.get_runner('Keyword') is not runner)
+
+    def test_importing_resources_and_search_order(self):
+        test = self._run(f'''\
+Example
+    ${{x}} =    Keyword With Resource    a
+    Should Be Equal    ${{x}}    a
+    Import Resource    {self.tempdir}/b.resource
+    Run Keyword And Expect Error    Multiple keywords with name 'Keyword' found*
+    ...    Keyword
+    Set Library Search Order    b
+    ${{x}} =    Keyword
+    Should Be Equal    ${{x}}    b
+    Set Library Search Order    a
+    ${{x}} =    Keyword
+    Should Be Equal    ${{x}}    a
+    ${{x}} =    Embedded value in b
+    Should Be Equal    ${{x}}    value
+
+*** Keywords ***
+Keyword With Resource
+    [Arguments]    ${{name}}
+    Import Resource    {self.tempdir}/${{name}}.resource
+    ${{x}} =    Keyword
+    RETURN    ${{x}}
+''')[0]
+        assert_equal(test.status, 'PASS', test.message)
+
+    def test_importing_library(self):
+        test = self._run('''\
+Example
+    Run Keyword And Expect Error    No keyword with name 'Get Line Count' found.
+    ...    Get Line Count    x
+    Import Library    String
+    ${count} =    Get Line Count    x
+    Should Be Equal    ${count}    ${1}
+''')[0]
+        assert_equal(test.status, 'PASS', test.message)
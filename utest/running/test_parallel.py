@@ -0,0 +1,149 @@
+import unittest
+from io import StringIO
+from os.path import abspath, dirname, join
+
+from robot.conf import RobotSettings
+from robot.output import LOGGER
+from robot.running import TestSuite, TestSuiteBuilder
+from robot.running.parallel import get_work_units
+from robot.utils.asserts import assert_equal, assert_true
+
+
+CURDIR = dirname(abspath(__file__))
+ROOTDIR = dirname(dirname(CURDIR))
+DATADIR = join(ROOTDIR, 'atest', 'testdata', 'misc')
+
+
+def build(path):
+    return TestSuiteBuilder().build(join(DATADIR, path))
+
+
+def run(suite, **config):
+    return suite.run(output=None, log=None, report=None, console='none',
+                     stdout=StringIO(), stderr=StringIO(), **config)
+
+
+def structure(suite):
+    return (suite.name,
+            [(t.name, t.status, t.message) for t in suite.tests],
+            [structure(s) for s in suite.suites])
+
+
+class TestWorkUnits(unittest.TestCase):
+
+    def test_leaf_suites_are_units(self):
+        units = list(get_work_units(build('suites')))
+        assert_equal([path for path, _ in units],
+                     [(0,), (1, 0), (1, 1), (2, 0), (2, 1), (3,), (4,), (5,)])
+        for path, unit in units:
+            suite = unit
+            for _ in path:
+                assert_equal(len(suite.suites), 1)
+                assert_true(suite.suites[0].parent is suite)
+                suite = suite.suites[0]
+            assert_equal(len(suite.suites), 0)
+            assert_true(suite.tests)
+
+    def test_parent_fixtures_are_copied(self):
+        suite = build('suites')
+        units = [unit for _, unit in get_work_units(suite)]
+        assert_equal(units[0].setup.name, suite.setup.name)
+        assert_true(units[0].setup is not suite.setup)
+        assert_true(units[0].setup.parent is units[0])
+        assert_equal(units[-1].teardown.name, suite.teardown.name)
+
+    def test_suite_without_child_suites_is_one_unit(self):
+        suite = TestSuite(name='Single')
+        suite.tests.create(name='Test')
+        units = list(get_work_units(suite))
+        assert_equal(len(units), 1)
+        assert_true(units[0][1] is suite)
+
+
+class TestUnitSettings(unittest.TestCase):
+
+    def test_outputs_are_disabled_except_output(self):
+        settings = RobotSettings(log='log.html', report='r.html', xunit='x.xml',
+                                 debugfile='debug.txt', processes=4)
+        unit = settings.get_unit_settings('/tmp/unit.xml')
+        assert_equal(unit.output, '/tmp/unit.xml')
+        for name in 'Log', 'Report', 'XUnit', 'DebugFile':
+            assert_equal(unit[name], None)
+        assert_equal(unit.processes, 1)
+        assert_equal(unit.console_type, 'quiet')
+        assert_equal(settings.processes, 4)
+        assert_equal(settings.log.endswith('log.html'), True)
+
+    def test_console_none_is_preserved(self):
+        settings = RobotSettings(console='none', processes=2)
+        assert_equal(settings.get_unit_settings('x.xml').console_type, 'none')
+
+    def test_invalid_processes(self):
+        assert_equal(RobotSettings(processes=0).processes, 1)
+        assert_equal(RobotSettings(processes='3').processes, 3)
+
+
+class TestParallelRun(unittest.TestCase):
+
+    def test_result_is_same_as_in_serial_execution(self):
+        serial = run(build('suites'))
+        parallel = run(build('suites'), processes=3)
+        assert_equal(structure(parallel.suite), structure(serial.suite))
+        assert_equal(parallel.return_code, serial.return_code)
+        assert_equal(parallel.suite.statistics.total, 11)
+
+    def test_exit_on_failure_is_honored_across_processes(self):
+        result = run(build('suites'), processes=2, exitonfailure=True)
+        tests = list(self._tests(result.suite))
+        assert_equal(tests[0].message, 'Expected')
+        assert_true(all(t.failed for t in tests))
+        assert_true(any('robot:exit' in t.tags for t in tests))
+
+    def test_exit_combine_does_not_modify_original_list(self):
+        settings = RobotSettings(output=None, log=None, report=None, console='none',
+                                 stdout=StringIO(), stderr=StringIO(),
+                                 processes=2, exitonfailure=True)
+        LOGGER.register_console_logger(**settings.console_output_config)
+        original = settings['TagStatCombine']
+        rebot_settings = settings.get_rebot_settings()
+        for _ in range(2):
+            result = build('suites').run(settings)
+            assert_equal(settings['TagStatCombine'], [('NOT robot:exit', '')])
+        assert_equal(original, [])
+        assert_equal(rebot_settings['TagStatCombine'], [])
+        assert_equal([s.name for s in result.statistics.tags.combined],
+                     ['NOT robot:exit'])
+
+    def test_timeout_engine_is_used_in_units(self):
+        suite = TestSuite(name='Root')
+        for name in 'First', 'Second':
+            test = suite.suites.create(name=name).tests.create(name='Test')
+            test.body.create_keyword('Evaluate', assign=['${engine}'],
+                                     args=['robot.running.timeouts._Timeout.engine',
+                                           'modules=robot.running.timeouts'])
+            test.body.create_keyword('Should Be Equal', args=['${engine}', 'WATCHDOG'])
+        result = run(suite, processes=2, timeoutengine='watchdog')
+        assert_equal([t.status for t in self._tests(result.suite)], ['PASS', 'PASS'])
+
+    def test_failed_parent_teardown_is_not_overwritten(self):
+        suite = TestSuite(name='Root')
+        suite.setup.config(name='Log', args=['Setup'])
+        suite.teardown.config(name='Should Not Be Equal',
+                              args=['${PREV_TEST_NAME}', 'First test'])
+        for name in 'First', 'Second', 'Third':
+            child = suite.suites.create(name=name)
+            child.tests.create(name=f'{name} test').body.create_keyword('No Operation')
+        result = run(suite, processes=2)
+        assert_equal(result.suite.setup.status, 'PASS')
+        assert_equal(result.suite.teardown.status, 'FAIL')
+        assert_equal(result.suite.teardown.args, ('${PREV_TEST_NAME}', 'First test'))
+        assert_true(result.suite.teardown.message.startswith('First test == First test'))
+
+    def _tests(self, suite):
+        yield from suite.tests
+        for child in suite.suites:
+            yield from self._tests(child)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,14 @@
 import logging
+import os
 import signal
 import sys
+import tempfile
 import unittest
 from io import StringIO
 from os.path import abspath, dirname, join
+from pathlib import Path
 
+from robot.result import ExecutionResult
 from robot.running import TestSuite, TestSuiteBuilder
 from robot.utils.asserts import assert_equal
 
@@ -287,5 +291,113 @@ class TestListeners(RunningTestCase):
         self._assert_outputs([("[from listener 1]", 0), ("[listener close]", 0)])
 
 
+class TestResume(unittest.TestCase):
+
+    def setUp(self):
+        temp = os.getenv('TEMPDIR', tempfile.gettempdir())
+        self.output = Path(temp) / 'resume.xml'
+
+    def tearDown(self):
+        if self.output.exists():
+            self.output.unlink()
+
+    def _suite(self, message='Original'):
+        suite = TestSuite(name='Root')
+        for name in 'First', 'Second':
+            child = suite.suites.create(name=name)
+            child.setup.config(name='Log', args=['Setup'])
+            for test in 'T1', 'T2':
+                child.tests.create(name=test).body.create_keyword('Log', args=[message])
+        return suite
+
+    def _run(self, suite, **config):
+        run(suite, output=str(self.output), **config)
+        return ExecutionResult(self.output).suite
+
+    def _messages(self, suite):
+        return [test.body[0].messages[0].message
+                for child in suite.suites for test in child.tests]
+
+    def _truncate_after_test(self, index):
+        xml = self.output.read_text(encoding='UTF-8')
+        end = -1
+        for _ in range(index):
+            end = xml.index('</test>', end + 1)
+        self.output.write_text(xml[:end + len('</test>')], encoding='UTF-8')
+
+    def test_completed_suites_and_tests_are_not_run(self):
+        self._run(self._suite(), journal=True)
+        self._truncate_after_test(3)
+        suite = self._run(self._suite('Resumed'), resume=str(self.output))
+        assert_equal(self._messages(suite), ['Original'] * 3 + ['Resumed'])
+        assert_equal([s.setup.messages[0].message for s in suite.suites],
+                     ['Setup', 'Setup'])
+        assert_equal(suite.statistics.passed, 4)
+
+    def test_resumed_output_can_be_resumed(self):
+        self._run(self._suite())
+        self._truncate_after_test(1)
+        self._run(self._suite('Second'), resume=str(self.output))
+        self._truncate_after_test(2)
+        suite = self._run(self._suite('Third'), resume=str(self.output))
+        assert_equal(self._messages(suite), ['Original', 'Second', 'Third', 'Third'])
+
+    def test_non_existing_output(self):
+        suite = self._run(self._suite(), resume=str(self.output))
+        assert_equal(self._messages(suite), ['Original'] * 4)
+
+    def test_listeners(self):
+        self._run(self._suite(), journal=True)
+        self._truncate_after_test(3)
+        v2, v3 = ListenerV2(), ListenerV3()
+        suite = self._run(self._suite('Resumed'), resume=str(self.output),
+                          listener=[v2, v3])
+        assert_equal(self._messages(suite), ['Original'] * 3 + ['Resumed'])
+        expected = ['start Root', 'start First', 'start T1', 'end T1 PASS',
+                    'start T2', 'end T2 PASS', 'end First PASS', 'start Second',
+                    'start T1', 'end T1 PASS', 'start T2', 'end T2 PASS',
+                    'end Second PASS', 'end Root PASS']
+        assert_equal(v2.events, expected)
+        assert_equal(v3.events, expected)
+
+
+class ListenerV2:
+    ROBOT_LISTENER_API_VERSION = 2
+
+    def __init__(self):
+        self.events = []
+
+    def start_suite(self, name, attrs):
+        self.events.append(f"start {name}")
+
+    def end_suite(self, name, attrs):
+        self.events.append(f"end {name} {attrs['status']}")
+
+    def start_test(self, name, attrs):
+        self.events.append(f"start {attrs['originalname']}")
+
+    def end_test(self, name, attrs):
+        self.events.append(f"end {attrs['originalname']} {attrs['status']}")
+
+
+class ListenerV3:
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self):
+        self.events = []
+
+    def start_suite(self, data, result):
+        self.events.append(f"start {data.name}")
+
+    def end_suite(self, data, result):
+        self.events.append(f"end {data.name} {result.status}")
+
+    def start_test(self, data, result):
+        self.events.append(f"start {data.name}")
+
+    def end_test(self, data, result):
+        self.events.append(f"end {data.name} {result.status}")
+
+
 if __name__ == '__main__':
     unittest.main()
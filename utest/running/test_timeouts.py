@@ -2,9 +2,11 @@ import unittest
 import sys
 import time
 import os
+from threading import Thread
 
 from robot.errors import TimeoutError
-from robot.running.timeouts import TestTimeout, KeywordTimeout
+from robot.running.timeouts import TestTimeout, KeywordTimeout, timeout_engine
+from robot.running.timeouts.watchdog import WATCHDOG
 from robot.utils.asserts import (assert_equal, assert_false, assert_true,
                                  assert_raises, assert_raises_with_msg)
 
@@ -147,6 +149,76 @@ class TestRun(unittest.TestCase):
             assert_raises(TimeoutError, self.tout.run, sleeping, (10,))
 
 
+class TestRunWithWatchdog(TestRun):
+
+    def setUp(self):
+        self.engine = timeout_engine('watchdog')
+        self.engine.__enter__()
+        TestRun.setUp(self)
+
+    def tearDown(self):
+        self.engine.__exit__(None, None, None)
+
+    def test_timeouts_in_multiple_threads(self):
+        results = {}
+
+        def run(name, secs):
+            tout = KeywordTimeout(secs, variables=VariableMock())
+            tout.start()
+            try:
+                results[name] = tout.run(busy, (0.5,))
+            except TimeoutError as err:
+                results[name] = str(err)
+
+        threads = [Thread(target=run, args=('first', '0.05s')),
+                   Thread(target=run, args=('second', '5s')),
+                   Thread(target=run, args=('third', '0.1s'))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert_equal(results, {'first': 'Keyword timeout 50 milliseconds exceeded.',
+                               'second': 0.5,
+                               'third': 'Keyword timeout 100 milliseconds exceeded.'})
+
+    def test_nested_timeouts(self):
+        inner = KeywordTimeout('10ms', variables=VariableMock())
+        inner.start()
+        assert_raises_with_msg(TimeoutError, 'Keyword timeout 10 milliseconds exceeded.',
+                               self.tout.run, inner.run, (busy, (1,)))
+
+    def test_finished_timeouts_are_removed(self):
+        for _ in range(100):
+            self.tout.run(passing)
+        assert_true(len(WATCHDOG._queue) < 10)
+
+
+def busy(secs):
+    end = time.time() + secs
+    while time.time() < end:
+        pass
+    return secs
+
+
+class TestDefaultEngineInThread(unittest.TestCase):
+
+    def test_watchdog_is_used_outside_main_thread(self):
+        result = []
+
+        def run():
+            tout = KeywordTimeout('10ms', variables=VariableMock())
+            tout.start()
+            try:
+                tout.run(busy, (1,))
+            except TimeoutError as err:
+                result.append(str(err))
+
+        thread = Thread(target=run)
+        thread.start()
+        thread.join()
+        assert_equal(result, ['Keyword timeout 10 milliseconds exceeded.'])
+
+
 class TestMessage(unittest.TestCase):
 
     def test_non_active(self):
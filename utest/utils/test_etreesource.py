@@ -1,4 +1,6 @@
 import os
+import gzip
+import tempfile
 import unittest
 import pathlib
 
@@ -27,6 +29,20 @@ class TestETSource(unittest.TestCase):
     def test_pathlib_path(self):
         self._test_path(pathlib.Path(PATH), PATH, pathlib.Path(PATH))
 
+    def test_compressed_file(self):
+        fd, path = tempfile.mkstemp(suffix='.xml.gz')
+        os.close(fd)
+        try:
+            with gzip.open(path, 'wb') as f:
+                f.write(b'<tag>content</tag>')
+            source = ETSource(path)
+            with source as src:
+                assert_equal(ET.parse(src).getroot().text, 'content')
+            assert_true(source._opened.closed)
+            self._verify_string_representation(source, path)
+        finally:
+            os.remove(path)
+
     def test_opened_file_object(self):
         with open(PATH) as f:
             source = ETSource(f)
@@ -1,7 +1,7 @@
 import unittest
 from collections import UserDict
 
-from robot.utils import normalize, NormalizedDict
+from robot.utils import ChainedNormalizedDict, normalize, NormalizedDict
 from robot.utils.asserts import assert_equal, assert_true, assert_false, assert_raises
 
 
@@ -287,5 +287,71 @@ class TestNormalizedDict(unittest.TestCase):
         assert_equal(nd._keys, {})
 
 
+class TestChainedNormalizedDict(unittest.TestCase):
+
+    def setUp(self):
+        self.parent = NormalizedDict({'A': 1, 'b': 2}, ignore='_')
+        self.chained = ChainedNormalizedDict(self.parent)
+
+    def test_get_from_parent(self):
+        assert_equal(self.chained['a'], 1)
+        assert_equal(self.chained['B_'], 2)
+        assert_true('a' in self.chained)
+        assert_false('c' in self.chained)
+        assert_raises(KeyError, self.chained.__getitem__, 'c')
+
+    def test_set_does_not_affect_parent(self):
+        self.chained['a'] = 'new'
+        self.chained['C'] = 3
+        assert_equal(self.chained['A'], 'new')
+        assert_equal(self.chained['c'], 3)
+        assert_equal(self.parent, {'A': 1, 'b': 2})
+
+    def test_changes_to_parent_are_visible(self):
+        self.chained['a'] = 'new'
+        self.parent['a'] = 'parent'
+        self.parent['c'] = 3
+        assert_equal(self.chained['a'], 'new')
+        assert_equal(self.chained['c'], 3)
+
+    def test_delete(self):
+        self.chained['a'] = 'new'
+        self.chained['c'] = 3
+        del self.chained['a']
+        del self.chained['c']
+        assert_false('a' in self.chained)
+        assert_false('c' in self.chained)
+        assert_raises(KeyError, self.chained.__delitem__, 'a')
+        assert_equal(self.chained.pop('b'), 2)
+        assert_equal(len(self.chained), 0)
+        assert_equal(self.parent, {'A': 1, 'b': 2})
+        self.chained['a'] = 'again'
+        assert_equal(list(self.chained.items()), [('a', 'again')])
+
+    def test_iteration_and_len(self):
+        self.chained['a'] = 'new'
+        self.chained['C'] = 3
+        assert_equal(list(self.chained), ['A', 'b', 'C'])
+        assert_equal(list(self.chained.items()), [('A', 'new'), ('b', 2), ('C', 3)])
+        assert_equal(len(self.chained), 3)
+
+    def test_copy_and_eq(self):
+        self.chained['c'] = 3
+        copy = self.chained.copy()
+        assert_equal(type(copy), NormalizedDict)
+        assert_equal(copy, {'A': 1, 'b': 2, 'c': 3})
+        assert_true(copy['_c_'], 3)
+        assert_equal(self.chained, copy)
+        assert_equal(copy, self.chained)
+        assert_true(self.chained != self.parent)
+
+    def test_clear(self):
+        self.chained['c'] = 3
+        self.chained.clear()
+        assert_equal(len(self.chained), 0)
+        assert_false('a' in self.chained)
+        assert_equal(len(self.parent), 2)
+
+
 if __name__ == '__main__':
     unittest.main()
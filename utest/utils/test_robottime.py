@@ -9,7 +9,9 @@ from robot.utils.asserts import (assert_equal, assert_raises_with_msg,
 from robot.utils.robottime import (timestr_to_secs, secs_to_timestr, get_time,
                                    parse_time, format_time, get_elapsed_time,
                                    get_timestamp, timestamp_to_secs,
-                                   elapsed_time_to_string, _get_timetuple)
+                                   elapsed_time_to_string, _get_timetuple,
+                                   get_epoch_millis, millis_to_timestamp,
+                                   timestamp_to_millis)
 
 
 EXAMPLE_TIME = time.mktime(datetime.datetime(2007, 9, 20, 16, 15, 14).timetuple())
@@ -212,6 +214,46 @@ class TestTime(unittest.TestCase):
         result = timestamp_to_secs('20070920 16:15:14.123')
         assert_equal(result, EXAMPLE_TIME+0.123)
 
+    def test_timestamp_to_millis(self):
+        expected = int(EXAMPLE_TIME) * 1000
+        for timestamp, millis in [('20070920 16:15:14.123', 123),
+                                  ('20070920 16:15:14.000', 0),
+                                  ('20070920 16:15:15.999', 1999),
+                                  ('20070920 16:59:59.999', 2685999),
+                                  ('20070920 16:00:00.000', -914000),
+                                  ('20070920 17:00:00.001', 2686001),
+                                  ('20070921 16:15:14.123', 86400123)]:
+            assert_equal(timestamp_to_millis(timestamp), expected + millis, timestamp)
+
+    def test_timestamp_to_millis_with_other_formats(self):
+        expected = int(EXAMPLE_TIME) * 1000
+        for timestamp, millis in [('20070920 16:15:14', 0),
+                                  ('20070920 16:15:14.123456', 123),
+                                  ('2007-09-20 16:15:14.123', 123),
+                                  ('2007-09-20 16:15:14.1', 100)]:
+            assert_equal(timestamp_to_millis(timestamp), expected + millis, timestamp)
+        assert_equal(timestamp_to_millis('N/A'), None)
+
+    def test_timestamp_to_millis_with_invalid(self):
+        for invalid in ['', 'invalid', '20070920 16:15:xx.123',
+                        '2007092x 16:15:14.123', '20071320 16:15:14.123']:
+            assert_raises_with_msg(ValueError, "Invalid timestamp '%s'." % invalid,
+                                   timestamp_to_millis, invalid)
+
+    def test_millis_to_timestamp(self):
+        millis = int(EXAMPLE_TIME) * 1000
+        for timestamp in ['20070920 16:15:14.123', '20070920 16:15:14.000',
+                          '20070920 16:15:15.999', '20070921 16:15:14.123']:
+            assert_equal(millis_to_timestamp(timestamp_to_millis(timestamp)),
+                         timestamp)
+        assert_equal(millis_to_timestamp(millis + 1), '20070920 16:15:14.001')
+        assert_equal(millis_to_timestamp(millis - 1), '20070920 16:15:13.999')
+
+    def test_get_epoch_millis(self):
+        start = int(time.time() * 1000)
+        millis = get_epoch_millis()
+        assert_true(start <= millis <= int(time.time() * 1000) + 1)
+
     def test_get_elapsed_time(self):
         starttime = '20060526 14:01:10.500'
         for endtime, expected in [('20060526 14:01:10.500', 0),
@@ -3,8 +3,9 @@ import unittest
 from robot.errors import DataError
 from robot.utils.asserts import (assert_equal, assert_false,
                                  assert_raises_with_msg, assert_true)
-from robot.variables.search import (search_variable, unescape_variable_syntax,
-                                    VariableIterator)
+from robot.variables.search import (get_variable_template, search_variable,
+                                    unescape_variable_syntax, VariableIterator,
+                                    VariableSearcher)
 
 
 class TestSearchVariable(unittest.TestCase):
@@ -201,6 +202,18 @@ class TestSearchVariable(unittest.TestCase):
         self._test('{{}}'*1000 + '${var}', '${var}', start=4000)
         self._test('${var}' + '[i]'*1000, '${var}', items=['i']*1000)
 
+    def test_fast_path_and_state_machine_find_same_variables(self):
+        for inp in ['${var}', 'x ${var} y ${v2}', '%{var}[x]', '${v}[x]', '${v}}',
+                    r'${v\}}', '${a{b}}', '${a}${b}', r'\${a} ${b}', '${unclosed',
+                    '@{l}[0]', '&{d}[k][l]', '*{v}[x]', '${}', '${ }']:
+            fast = search_variable(inp, ignore_errors=True)
+            searcher = VariableSearcher('$@&%*', ignore_errors=True)
+            searcher._find_simple_variable_end = lambda string, start: -1
+            slow = searcher.search(inp)
+            assert_equal((fast.identifier, fast.base, fast.items, fast.start, fast.end),
+                         (slow.identifier, slow.base, slow.items, slow.start, slow.end),
+                         inp)
+
     def test_complex(self):
         self._test('${${PER}SON${2}[${i}]}', '${${PER}SON${2}[${i}]}')
         self._test('${x}[${${PER}SON${2}[${i}]}]', '${x}',
@@ -269,6 +282,52 @@ class TestSearchVariable(unittest.TestCase):
         assert_true(search_variable('&{x}[k][foo][bar][1]').is_dict_variable())
 
 
+class TestVariableTemplate(unittest.TestCase):
+
+    def test_no_variables(self):
+        template = get_variable_template(r'{not} \{var}')
+        assert_false(template.has_variables)
+        assert_false(template.is_variable)
+        assert_equal(template.tail(), '{not} {var}')
+        assert_equal(template.tail(str.upper), r'{NOT} \{VAR}')
+
+    def test_variable(self):
+        template = get_variable_template('${var}[item]')
+        assert_true(template.is_variable)
+        match = template.first_match()
+        assert_equal((match.name, match.items), ('${var}', ('item',)))
+
+    def test_literal_parts_and_variables(self):
+        template = get_variable_template(r'a\tb${x} c @{y}[0]\n')
+        assert_true(template.has_variables)
+        assert_false(template.is_variable)
+        assert_equal([(before, str(match)) for before, match in template.matches()],
+                     [('a\tb', '${x}'), (' c ', '@{y}[0]')])
+        assert_equal(template.tail(), '\n')
+        assert_equal([before for before, _ in template.matches(str.upper)],
+                     [r'A\TB', ' C '])
+
+    def test_templates_are_cached(self):
+        string = 'cached ${template}'
+        template = get_variable_template(string)
+        assert_true(get_variable_template(string) is template)
+        assert_true(get_variable_template(string, ignore_errors=True) is not template)
+
+    def test_matches_can_be_modified(self):
+        template = get_variable_template('${var}')
+        template.first_match().base = 'modified'
+        assert_equal(template.first_match().base, 'var')
+        for _, match in template.matches():
+            match.base = 'modified'
+        assert_equal([m.base for _, m in template.matches()], ['var'])
+
+    def test_invalid_syntax(self):
+        assert_equal(get_variable_template('${x} ${invalid'), None)
+        template = get_variable_template('${x} ${invalid', ignore_errors=True)
+        assert_equal([str(m) for _, m in template.matches()], ['${x}'])
+        assert_equal(template.tail(), ' ${invalid')
+
+
 class TestVariableIterator(unittest.TestCase):
 
     def test_no_variables(self):
@@ -2,7 +2,8 @@ import unittest
 
 from robot.variables import Variables
 from robot.errors import DataError, VariableError
-from robot.utils.asserts import assert_equal, assert_raises
+from robot.utils.asserts import (assert_equal, assert_raises,
+                                 assert_raises_with_msg, assert_true)
 
 
 SCALARS = ['${var}', '${  v A  R }']
@@ -133,6 +134,22 @@ class TestVariables(unittest.TestCase):
     def test_replace_non_existing_string(self):
         assert_raises(VariableError, self.varz.replace_string, '${nonexisting}')
 
+    def test_replace_same_string_repeatedly(self):
+        self.varz['${var 1}'] = 'one'
+        self.varz['${var 2}'] = 'two'
+        for index, value in [(1, 'one'), (2, 'two'), (1, 'one')]:
+            self.varz['${index}'] = index
+            assert_equal(self.varz.replace_scalar('${var ${index}}'), value)
+            assert_equal(self.varz.replace_string('-${var ${index}}-'), f'-{value}-')
+            assert_equal(self.varz.replace_list(['${var ${index}}']), [value])
+
+    def test_error_order_is_preserved_with_invalid_syntax(self):
+        assert_raises_with_msg(VariableError, "Variable '${nonexisting}' not found.",
+                               self.varz.replace_string, '${nonexisting} ${invalid')
+        assert_raises_with_msg(VariableError,
+                               "Variable '${invalid' was not closed properly.",
+                               self.varz.replace_string, 'x ${invalid')
+
     def test_non_string_input(self):
         for item in [1, False, None, [], (), {}, object]:
             assert_equal(self.varz.replace_list([item]), [item])
@@ -234,6 +251,16 @@ class TestVariables(unittest.TestCase):
         copy = varz.copy()
         assert_equal(copy['${foo}'], 'bar')
 
+    def test_chained_copy(self):
+        varz = Variables()
+        varz['${foo}'] = 'bar'
+        copy = varz.copy(chained=True)
+        copy['${new}'] = 'value'
+        varz['${foo}'] = 'changed'
+        assert_equal(copy.replace_string('${foo} ${new}'), 'changed value')
+        assert_equal(copy.as_dict(), {'${foo}': 'changed', '${new}': 'value'})
+        assert_true('${new}' not in varz)
+
     def test_ignore_error(self):
         v = Variables()
         v['${X}'] = 'x'
@@ -35,6 +35,13 @@ describe("Text decoder", function () {
         var actual = strings.get(1);
         expect(actual).toEqual("plain text");
     });
+
+    it("should get referenced strings from shared strings", function () {
+        window.sharedStrings = ["*", "*shared text", "eNorzk3MySmmLQEASKop9Q=="];
+        var strings = window.testdata.StringStore(["*", "#1", "#2"]);
+        expect(strings.get(1)).toEqual("shared text");
+        expect(strings.get(2)).toEqual(multiplyString("small", 20));
+    });
 });
 
 function subSuite(index, suite) {